@@ -83,3 +83,190 @@ def slide_element(
     else:
         raise ValueError(f"Unsupported alignment axis: {align}")
     return ApplyMethod(element.move_to, planar_goal, run_time=runtime)
+
+
+class BlockShift(Animation):
+    """Move a block of elements by one shared offset as a single animation.
+
+    Sliding each cell of a block with its own ``ApplyMethod(cell.move_to, ...)`` builds a
+    starting and a target copy per cell and interpolates all of them every frame.
+    ``BlockShift`` copies nothing: each frame it shifts ``members`` by the change in
+    ``rate_func(alpha) * offset`` since the previous frame, so a shift of n cells is one
+    animation with one vector add per cell per frame.
+
+    Parameters
+    ----------
+    mobject : Mobject
+        The structure that owns the block; the members stay its submobjects throughout.
+    members : Iterable[Mobject]
+        Elements to move together.
+    offset : np.ndarray
+        Total displacement of the block.
+    **kwargs :
+        Forwarded to ``Animation``. Updaters keep running by default so attached text and
+        arrows follow the block every frame.
+    """
+
+    def __init__(self, mobject, members, offset, **kwargs):
+        kwargs.setdefault("suspend_mobject_updating", False)
+        super().__init__(mobject, **kwargs)
+        self.members = list(members)
+        self.offset = np.asarray(offset, dtype=float)
+        self._progress = 0.0
+
+    def create_starting_mobject(self):
+        return self.mobject  # Members are shifted incrementally, no copy needed
+
+    def begin(self) -> None:
+        self._progress = 0.0
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        progress = self.rate_func(alpha)
+        step = progress - self._progress
+        if not step:
+            return
+        delta = self.offset * step
+        for member in self.members:
+            member.shift(delta)
+        self._progress = progress
+
+
+class ParallelMove(Animation):
+    """Move many members of a structure to their own targets as one animation.
+
+    Positions for every member are computed together each frame (one NumPy expression
+    over an ``(n, 3)`` array); each member is then shifted by the difference from where it
+    was on the previous frame. Members can travel on an arc (``arc`` times ``UP``, positive
+    over, negative under) so crossing elements don't overlap.
+
+    Parameters
+    ----------
+    mobject : Mobject
+        The structure that owns the members; they stay its submobjects throughout.
+    members : Sequence[Mobject]
+        Elements to move.
+    targets : np.ndarray
+        ``(n, 3)`` target centres, one per member.
+    arcs : np.ndarray | float, optional
+        Peak height of each member's arc (scalar or ``(n,)``). Defaults to a straight line.
+    **kwargs :
+        Forwarded to ``Animation``. Updaters keep running by default, as in `BlockShift`.
+    """
+
+    def __init__(self, mobject, members, targets, arcs=0.0, **kwargs):
+        kwargs.setdefault("suspend_mobject_updating", False)
+        super().__init__(mobject, **kwargs)
+        self.members = list(members)
+        self.targets = np.asarray(targets, dtype=float).reshape(len(self.members), 3)
+        self.arcs = np.broadcast_to(np.asarray(arcs, dtype=float), (len(self.members),)).copy()
+        self._starts = np.zeros_like(self.targets)
+        self._current = np.zeros_like(self.targets)
+
+    def create_starting_mobject(self):
+        return self.mobject  # Members are shifted incrementally, no copy needed
+
+    def begin(self) -> None:
+        self._starts = np.array([member.get_center() for member in self.members], dtype=float).reshape(-1, 3)
+        self._current = self._starts.copy()
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        progress = self.rate_func(alpha)
+        positions = self._starts + (self.targets - self._starts) * progress
+        positions[:, 1] += self.arcs * np.sin(np.pi * progress)
+        deltas = positions - self._current
+        for member, delta in zip(self.members, deltas):
+            if delta.any():
+                member.shift(delta)
+        self._current = positions
+
+
+class StyleTween(Animation):
+    """Interpolate fill/stroke style of a mobject in place, without copying it.
+
+    ``ApplyMethod(body.set_fill, ...)`` builds a full Transform: a starting copy and a
+    target copy of the mobject, and point interpolation every frame even though only
+    the colour changes. ``StyleTween`` snapshots the style arrays once in ``begin`` and
+    writes ``start + (end - start) * alpha`` into them with preallocated buffers, so
+    frames allocate nothing.
+
+    Parameters
+    ----------
+    mobject : Mobject
+        Mobject whose family (members with points) is restyled.
+    fill_color, stroke_color : ParsableManimColor | None
+        Target colours; None keeps the current ones.
+    fill_opacity, stroke_opacity : float | None
+        Target opacities; None keeps the current ones.
+    stroke_width : float | None
+        Target stroke width; None keeps the current one.
+    members : Iterable[Mobject] | None
+        Restyle only these mobjects (and their families) instead of the whole family of
+        ``mobject``. Lets one animation on a structure restyle a row or region of it.
+    **kwargs :
+        Forwarded to ``Animation`` (``run_time``, ``rate_func``, ...).
+    """
+
+    def __init__(
+        self,
+        mobject,
+        *,
+        fill_color=None,
+        fill_opacity: float | None = None,
+        stroke_color=None,
+        stroke_opacity: float | None = None,
+        stroke_width: float | None = None,
+        members=None,
+        **kwargs,
+    ):
+        from manim import ManimColor
+        super().__init__(mobject, **kwargs)
+        #Kept as hex strings/floats so render cache keys describe the target style
+        self.fill_color = ManimColor(fill_color).to_hex() if fill_color is not None else None
+        self.fill_opacity = fill_opacity
+        self.stroke_color = ManimColor(stroke_color).to_hex() if stroke_color is not None else None
+        self.stroke_opacity = stroke_opacity
+        self.stroke_width = stroke_width
+        self.members = list(members) if members is not None else None
+        self._tracks: list[tuple] = []
+
+    def create_starting_mobject(self):
+        return self.mobject  # Style is snapshotted per member in begin(), no copy needed
+
+    def _track(self, member, attr: str, color: str | None, opacity: float | None) -> None:
+        from manim import ManimColor
+        current = getattr(member, attr, None)
+        if current is None or (color is None and opacity is None):
+            return
+        start = np.array(current, dtype=float)
+        end = start.copy()
+        if color is not None:
+            end[..., :3] = ManimColor(color).to_rgb()
+        if opacity is not None:
+            end[..., 3] = opacity
+        self._tracks.append((member, attr, start, end - start, np.empty_like(start)))
+
+    def begin(self) -> None:
+        self._tracks = []
+        roots = self.members if self.members is not None else [self.mobject]
+        for member in (m for root in roots for m in root.family_members_with_points()):
+            fill_attr = "fill_rgbas" if hasattr(member, "fill_rgbas") else "fill_rgba" #Cairo | OpenGL
+            stroke_attr = "stroke_rgbas" if hasattr(member, "stroke_rgbas") else "stroke_rgba"
+            self._track(member, fill_attr, self.fill_color, self.fill_opacity)
+            self._track(member, stroke_attr, self.stroke_color, self.stroke_opacity)
+            if self.stroke_width is not None:
+                start = np.array(member.stroke_width, dtype=float)
+                self._tracks.append((member, "stroke_width", start, self.stroke_width - start, np.empty_like(start)))
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        alpha = self.rate_func(alpha)
+        for member, attr, start, delta, scratch in self._tracks:
+            np.multiply(delta, alpha, out=scratch)
+            scratch += start
+            current = getattr(member, attr)
+            if isinstance(current, np.ndarray) and current.shape == scratch.shape:
+                current[...] = scratch
+            else: #Scalar attribute (Cairo stroke_width) or array replaced since begin
+                setattr(member, attr, scratch.item() if scratch.ndim == 0 else scratch.copy())
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+"""
+Batched VMobject drawing for the Cairo renderer.
+
+Manim's Cairo camera sets up a path, a source colour and a fill/stroke for every
+VMobject it draws. A ``VisualArray`` of 1,000 cells is 1,000 identical rectangles
+plus a few thousand glyphs of the same white, so most of a frame goes into
+repeating that setup. `BatchedCamera` draws each run of consecutive, same-styled
+VMobjects as one compound Cairo path:
+
+- the draw order (z-index, then family order) is kept: only neighbours in it are
+  merged, so cell bodies (z 0) form one batch and their text glyphs (z 1) another,
+  flushed in one pass after the bodies,
+- members must have a single fill and stroke colour (no gradients or sheen) and no
+  background stroke; anything else is drawn exactly as Manim draws it,
+- members whose bounding boxes overlap are split into separate batches, since a
+  later member's fill has to cover an earlier member's stroke (cells crossing
+  during a swap) and overlapping translucent fills must blend twice.
+
+It also drops VMobjects that lie entirely outside the frame before any path is
+built for them (see `Components.culling`).
+"""
+
+import itertools as it
+from typing import Iterable
+
+import numpy as np
+from manim import Camera, VMobject
+
+from Components.culling import FrustumCuller
+
+
+class BatchedCamera(Camera):
+    """Cairo `Camera` that fills and strokes runs of same-styled VMobjects with one path.
+
+    Installed by `AlgoScene` for Cairo scenes when ``RenderSettings.batch_draw`` or
+    ``RenderSettings.cull_offscreen`` is on; ``batch_draw`` and ``cull_offscreen`` mirror them.
+    """
+
+    max_batch = 512  # Caps the pairwise overlap check at max_batch**2 box comparisons
+    batch_draw = False
+    cull_offscreen = True
+    cull_margin = 0.1  # Scene units, covers strokes drawn past a mobject's points
+
+    def get_mobjects_to_display(self, mobjects, include_submobjects: bool = True, excluded_mobjects: list | None = None):
+        mobjects = super().get_mobjects_to_display(mobjects, include_submobjects, excluded_mobjects)
+        if not self.cull_offscreen:
+            return mobjects
+        culler = getattr(self, "_culler", None)
+        if culler is None:
+            culler = self._culler = FrustumCuller(margin=self.cull_margin)
+        culler.begin_frame(self)
+        return [mobject for mobject in mobjects if culler.is_visible(mobject)]
+
+    def display_multiple_non_background_colored_vmobjects(self, vmobjects: Iterable[VMobject], pixel_array: np.ndarray):
+        if not self.batch_draw:
+            return super().display_multiple_non_background_colored_vmobjects(vmobjects, pixel_array)
+        ctx = self.get_cairo_context(pixel_array)
+        for key, run in it.groupby(vmobjects, self.style_key):
+            run = list(run)
+            if key is None or len(run) == 1:
+                for vmobject in run:
+                    self.display_vectorized(vmobject, ctx)
+                continue
+            for batch in self.split_overlapping(run):
+                self.display_batch(batch, ctx)
+
+    @staticmethod
+    def style_key(vmobject: VMobject) -> tuple | None:
+        """What a batch's members must share, or None if ``vmobject`` must be drawn on its own."""
+        if vmobject.get_stroke_width(background=True) != 0:
+            return None
+        fill = vmobject.get_fill_rgbas()
+        width = vmobject.get_stroke_width()
+        stroke = vmobject.get_stroke_rgbas() if width else fill[:1]
+        if len(fill) != 1 or len(stroke) != 1:
+            return None
+        return (tuple(fill[0].tolist()), tuple(stroke[0].tolist()) if width else None, float(width),
+                vmobject.joint_type, vmobject.cap_style)
+
+    def split_overlapping(self, run: list[VMobject]) -> list[list[VMobject]]:
+        """Split ``run`` into batches whose members' bounding boxes don't overlap (shared edges are fine)."""
+        batches = []
+        tolerance = 1e-6
+        for offset in range(0, len(run), self.max_batch):
+            chunk = run[offset:offset + self.max_batch]
+            boxes = np.array([self._box(vmobject) for vmobject in chunk])
+            overlaps = ((boxes[:, None, 0] < boxes[None, :, 2] - tolerance) & (boxes[None, :, 0] < boxes[:, None, 2] - tolerance)
+                        & (boxes[:, None, 1] < boxes[None, :, 3] - tolerance) & (boxes[None, :, 1] < boxes[:, None, 3] - tolerance))
+            overlaps = np.tril(overlaps, k=-1) #Row j: the earlier members j overlaps
+            last_conflict = np.where(overlaps.any(axis=1), len(chunk) - 1 - np.argmax(overlaps[:, ::-1], axis=1), -1)
+            start = 0
+            for index in range(1, len(chunk)):
+                if last_conflict[index] >= start:
+                    batches.append(chunk[start:index])
+                    start = index
+            batches.append(chunk[start:])
+        return batches
+
+    @staticmethod
+    def _box(vmobject: VMobject) -> tuple[float, float, float, float]:
+        points = vmobject.points
+        low, high = points[:, :2].min(axis=0), points[:, :2].max(axis=0)
+        return low[0], low[1], high[0], high[1]
+
+    def display_batch(self, vmobjects: list[VMobject], ctx) -> None:
+        """Draw ``vmobjects`` (same `style_key`) as one compound path: one fill, one stroke."""
+        if len(vmobjects) == 1:
+            self.display_vectorized(vmobjects[0], ctx)
+            return
+        ctx.new_path()
+        for vmobject in vmobjects:
+            self.append_subpaths(ctx, vmobject)
+        lead = vmobjects[0]
+        self.apply_fill(ctx, lead)
+        self.apply_stroke(ctx, lead)
+
+    def append_subpaths(self, ctx, vmobject: VMobject) -> None:
+        """Add ``vmobject``'s subpaths to the current path, like `set_cairo_context_path` without ``new_path``."""
+        points = self.transform_points_pre_display(vmobject, vmobject.points)
+        per_curve = vmobject.n_points_per_curve
+        usable = len(points) - len(points) % per_curve
+        if usable == 0:
+            return
+        curves = points[:usable, :2].reshape(-1, per_curve, 2)
+        gaps = np.abs(curves[1:, 0] - curves[:-1, -1]).max(axis=1) > vmobject.tolerance_for_point_equality
+        for subpath in np.split(curves, np.flatnonzero(gaps) + 1):
+            ctx.new_sub_path()
+            ctx.move_to(*subpath[0, 0].tolist())
+            for p1x, p1y, p2x, p2y, p3x, p3y in subpath[:, 1:].reshape(-1, 6).tolist():
+                ctx.curve_to(p1x, p1y, p2x, p2y, p3x, p3y)
+            if np.abs(subpath[0, 0] - subpath[-1, -1]).max() <= vmobject.tolerance_for_point_equality:
+                ctx.close_path()
+
+
+__all__ = ["BatchedCamera"]
@@ -8,23 +8,40 @@ can import the dataclasses below and either use them as-is or clone them
 with overrides before wiring dependencies.
 """
 
-from dataclasses import dataclass, field, replace
-from typing import Any, Dict
+import json
+import os
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, Dict, Mapping
+
+CONFIG_ENV_VAR = "ALGOMANCER_CONFIG"  # JSON AppConfig handed to scenes rendered in a subprocess
 
 
 @dataclass(frozen=True)
 class RenderSettings:
     """Renderer/window parameters."""
-    from manim.renderer.opengl_renderer import OpenGLRenderer
-    from manim.renderer.cairo_renderer import CairoRenderer
+
     pixel_width: int = 1920
     pixel_height: int = 1080
     window_scale: float = 0.75  # 0–1, multiplies pixel dims to get window size
     quality: str = "medium"  # low | medium | high | 4k
     renderer_str: str = "opengl"  # or "cairo"
-    renderer: OpenGLRenderer | CairoRenderer = OpenGLRenderer # or CairoRenderer
     samples: int = 1  # MSAA samples
     slides: bool = True
+    output_mode: str = "partial"  # "partial" (one movie file per play) or "stream" (one encoder per scene)
+    render_workers: int = 1  # >1 splits each Cairo play's frames across forked processes
+    min_frames_per_worker: int = 8
+    vfr_holds: bool = True  # write static waits as one frame held for the whole wait (needs ffmpeg on PATH, skipped otherwise)
+    batch_draw: bool = False  # Cairo: draw runs of same-styled VMobjects (cell bodies, glyphs) as one compound path (opt-in until Tests/bench_batched_camera.py is measured)
+    cull_offscreen: bool = True  # skip interpolating, updating and (Cairo) drawing elements outside the camera frame
+
+    @property
+    def renderer(self) -> type:
+        """Renderer class for `renderer_str`, imported on first access."""
+        if self.renderer_str == "cairo":
+            from manim.renderer.cairo_renderer import CairoRenderer
+            return CairoRenderer
+        from manim.renderer.opengl_renderer import OpenGLRenderer
+        return OpenGLRenderer
 
 
 @dataclass(frozen=True)
@@ -32,7 +49,12 @@ class PlaybackSettings:
     """Playback/controller defaults."""
 
     frame_rate: int = 30
-    dt_mode: str = "fixed"  # "fixed" or "adaptive"
+    dt_mode: str = "fixed"  # "fixed" or "adaptive" (live OpenGL preview drops late steps; file output stays fixed)
+    batch_compares: bool = True  # queue compare effects and play them together before the next play
+    compare_lag_ratio: float = 1.0  # lag between flushed compare effects: 1 keeps them back to back (same video length), e.g. 0.3 overlaps them for a shorter video
+    reduce_effects: bool = True  # drop redundant highlights, merge repeated indicates; highlight/unhighlight pairs cancel in parallel plays only (a sequential pair, e.g. a read flash, is kept)
+    batch_pointer_moves: bool = False  # queue every pointer move until the next play, not only inside Pointer.batch blocks
+    pool_pointers: bool = True  # PointerRange recycles finished pointers (per structure) instead of re-creating them
 
 
 
@@ -45,6 +67,16 @@ class LoggingSettings:
     file_path: str = "DEBUG/algomancer.log"
 
 
+@dataclass(frozen=True)
+class CacheSettings:
+    """Persistent render cache defaults (see Components.render_cache)."""
+
+    enabled: bool = True
+    directory: str = "media/algomancer_cache"
+    max_bytes: int = 2_000_000_000  # ~2GB, least recently used segments are evicted first
+    verify_digests: bool = False  # debug: check cached structure digests against a full `state_stamp` walk every play
+
+
 @dataclass(frozen=True)
 class AppConfig:
     """Container for all configuration domains."""
@@ -52,6 +84,7 @@ class AppConfig:
     render: RenderSettings = RenderSettings()
     playback: PlaybackSettings = PlaybackSettings()
     logging: LoggingSettings = LoggingSettings()
+    cache: CacheSettings = CacheSettings()
     metadata: Dict[str, Any] = field(default_factory=dict)
 
     def with_overrides( #We froze the dataclasses
@@ -60,6 +93,7 @@ class AppConfig:
         render: RenderSettings | None = None,
         playback: PlaybackSettings | None = None,
         logging: LoggingSettings | None = None,
+        cache: CacheSettings | None = None,
         metadata: Dict[str, Any] | None = None,
     ) -> "AppConfig":
         """Return a new AppConfig with the provided replacements.
@@ -83,9 +117,32 @@ class AppConfig:
             render=render or self.render,
             playback=playback or self.playback,
             logging=logging or self.logging,
+            cache=cache or self.cache,
             metadata=new_metadata,
         )
 
+    def to_json(self) -> str:
+        """Serialise to JSON, e.g. to hand the config to a `manim` subprocess."""
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, text: str) -> "AppConfig":
+        """Inverse of `to_json`; unknown sections and fields are rejected."""
+        data = json.loads(text)
+        return cls(
+            render=RenderSettings(**data.get("render", {})),
+            playback=PlaybackSettings(**data.get("playback", {})),
+            logging=LoggingSettings(**data.get("logging", {})),
+            cache=CacheSettings(**data.get("cache", {})),
+            metadata=dict(data.get("metadata", {})),
+        )
+
+
+def config_from_env(environ: Mapping[str, str] | None = None) -> AppConfig | None:
+    """Return the AppConfig stored in ``CONFIG_ENV_VAR`` by `render_scene`, if any."""
+    text = (os.environ if environ is None else environ).get(CONFIG_ENV_VAR)
+    return AppConfig.from_json(text) if text else None
+
 
 DEFAULT_CONFIG = AppConfig()
 
@@ -93,6 +150,9 @@ __all__ = [
     "RenderSettings",
     "PlaybackSettings",
     "LoggingSettings",
+    "CacheSettings",
     "AppConfig",
     "DEFAULT_CONFIG",
+    "CONFIG_ENV_VAR",
+    "config_from_env",
 ]
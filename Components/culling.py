@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+"""
+View-frustum culling for structure elements.
+
+A long ``VisualArray`` or ``VisualLinkedList`` can run far past the camera frame,
+yet every frame interpolates, updates and draws all of its cells. `FrustumCuller`
+(one per `AlgoScene`, see ``RenderSettings.cull_offscreen``) makes that work scale
+with the visible elements instead:
+
+- at the start of a play, `watch` walks the play's animations down to their leaves
+  (``AnimationGroup``/``Succession`` members) and guards the leaves whose mobject,
+  and target, lie entirely outside the frame (``Succession`` members are checked when
+  they begin, once their target exists): their per-frame ``interpolate`` is
+  skipped while they stay off screen. Only leaves that depend on alpha alone are
+  guarded (``Transform`` and its subclasses, ``ShowPartial``, ``Write``, `StyleTween`),
+  so a guarded leaf catches up the moment it is drawn again (the camera moved, or
+  the element was shifted into view) and ``finish`` still applies its final state,
+- `update_children` runs a structure's per-element updaters (cell text following
+  its body, ...) only for elements in view; skipped ``dt`` is handed over when an
+  element comes back,
+- the Cairo camera drops off-screen VMobjects before building their paths
+  (`BatchedCamera`).
+
+Boxes come from the element's body (text and adornments sit inside it) padded by
+`FrustumCuller.margin`, and are computed without building points for bodies that
+share a template (`SharedRectangle`). The frame is assumed to be the flat 2D view
+Algomancer scenes use.
+"""
+
+from typing import Iterable
+
+import numpy as np
+from manim import AnimationGroup, DrawBorderThenFill, ShowPartial, Succession, Transform, config
+
+from Components.animations import StyleTween
+
+_GUARDED = (Transform, ShowPartial, DrawBorderThenFill, StyleTween)
+
+
+def mobject_box(mobject) -> np.ndarray | None:
+    """``[xmin, ymin, xmax, ymax]`` of a mobject (its body for elements), or None if it has no points."""
+    body = getattr(mobject, "body", None)
+    if body is not None and body is not mobject:
+        return mobject_box(body)
+    fast = getattr(mobject, "box_2d", None)
+    if fast is not None and not mobject.submobjects:
+        return fast()
+    members = [member.points for member in mobject.family_members_with_points()]
+    if not members:
+        return None
+    points = members[0] if len(members) == 1 else np.concatenate(members)
+    return np.concatenate([points[:, :2].min(axis=0), points[:, :2].max(axis=0)])
+
+
+def frame_box(camera) -> np.ndarray:
+    """``[xmin, ymin, xmax, ymax]`` of the area ``camera`` shows (Cairo cameras or the OpenGL camera frame)."""
+    center = getattr(camera, "frame_center", None)
+    if center is not None:
+        width, height = camera.frame_width, camera.frame_height
+    elif hasattr(camera, "get_center"):
+        center, width, height = camera.get_center(), camera.get_width(), camera.get_height()
+    else:
+        center, width, height = np.zeros(3), config.frame_width, config.frame_height
+    return np.array([center[0] - width / 2, center[1] - height / 2, center[0] + width / 2, center[1] + height / 2])
+
+
+class FrustumCuller:
+    """Skips interpolation and updaters of structure elements outside the camera frame.
+
+    Parameters
+    ----------
+    margin : float, optional
+        Padding (scene units) around every box, so strokes, arrows and labels just past
+        an element's body never pop in late.
+    """
+
+    def __init__(self, margin: float = 0.5):
+        self.margin = margin
+        self.frame = np.array([-np.inf, -np.inf, np.inf, np.inf])
+        self.guarded = 0 #Leaves guarded in the current play, for logging
+
+    def begin_frame(self, camera) -> None:
+        """Snapshot the camera frame for this frame's visibility tests."""
+        self.frame = frame_box(camera)
+
+    def box_visible(self, box: np.ndarray | None) -> bool:
+        if box is None: #Nothing to draw, e.g. updater-only mobjects: always run
+            return True
+        frame, margin = self.frame, self.margin
+        return (box[0] - margin <= frame[2] and box[2] + margin >= frame[0]
+                and box[1] - margin <= frame[3] and box[3] + margin >= frame[1])
+
+    def is_visible(self, mobject) -> bool:
+        return self.box_visible(mobject_box(mobject))
+
+    # --- Animations ---
+    @staticmethod
+    def _leaves(animations: Iterable, begun: bool = True) -> Iterable[tuple]:
+        """``(leaf, begun)`` pairs; a ``Succession`` only begins its first member up front."""
+        for animation in animations:
+            if isinstance(animation, Succession):
+                for member in animation.animations:
+                    yield from FrustumCuller._leaves([member], begun and member is getattr(animation, "active_animation", None))
+            elif isinstance(animation, AnimationGroup):
+                yield from FrustumCuller._leaves(animation.animations, begun)
+            else:
+                yield animation, begun
+
+    @staticmethod
+    def _union(first: np.ndarray | None, second: np.ndarray | None) -> np.ndarray | None:
+        if first is None or second is None:
+            return first if second is None else second
+        return np.concatenate([np.minimum(first[:2], second[:2]), np.maximum(first[2:], second[2:])])
+
+    def _extent(self, animation) -> np.ndarray | None:
+        """Box covering where the leaf starts and ends (Transform targets), padded for arced paths."""
+        starting = getattr(animation, "starting_mobject", None)
+        target = getattr(animation, "target_copy", None)
+        box = self._union(mobject_box(starting) if starting is not None else None,
+                          mobject_box(target) if target is not None else None)
+        if box is not None and getattr(animation, "path_arc", 0):
+            reach = np.hypot(box[2] - box[0], box[3] - box[1]) / 2 #An arc never strays further than half its chord
+            box = box + np.array([-reach, -reach, reach, reach])
+        return box
+
+    def watch(self, animations: Iterable, camera) -> int:
+        """Guard the leaves of ``animations`` that start and end off screen; returns how many were guarded.
+
+        Leaves that haven't begun yet (later members of a ``Succession``) are decided when they begin,
+        once their start and target are known.
+        """
+        self.begin_frame(camera)
+        self.guarded = 0
+        for leaf, begun in self._leaves(animations):
+            if not isinstance(leaf, _GUARDED) or getattr(leaf, "_cull_guarded", False):
+                continue
+            if begun:
+                self._consider(leaf)
+            else:
+                self._defer(leaf)
+        return self.guarded
+
+    def _defer(self, animation) -> None:
+        original = animation.begin
+
+        def begin() -> None: #Monkeypatches the leaf's begin, restored once it has run
+            del animation.begin
+            original()
+            self._consider(animation)
+        animation.begin = begin
+
+    def _consider(self, animation) -> None:
+        extent = self._extent(animation)
+        if extent is None: #Unknown start/target: never guarded, it could be moving anywhere
+            return
+        if self.box_visible(self._union(mobject_box(animation.mobject), extent)):
+            return
+        self._guard(animation, extent)
+        self.guarded += 1
+
+    def _guard(self, animation, extent: np.ndarray | None) -> None:
+        original = animation.interpolate
+
+        def interpolate(alpha: float) -> None: #Monkeypatches the leaf's interpolate, finish() (alpha 1) always passes
+            if alpha >= 1 or self.box_visible(self._union(mobject_box(animation.mobject), extent)):
+                original(alpha)
+        animation.interpolate = interpolate
+        animation._cull_guarded = True
+
+    # --- Updaters ---
+    def update_children(self, structure, dt: float) -> None:
+        """Run the updaters of ``structure``'s on-screen children, banking ``dt`` for the others."""
+        if getattr(structure, "updating_suspended", False):
+            return
+        for child in structure.submobjects:
+            if self.is_visible(child):
+                banked = getattr(child, "_culled_dt", 0.0)
+                if banked:
+                    child._culled_dt = 0.0
+                child.update(dt + banked)
+            else:
+                child._culled_dt = getattr(child, "_culled_dt", 0.0) + dt
+
+
+__all__ = ["FrustumCuller", "frame_box", "mobject_box"]
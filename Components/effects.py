@@ -1,27 +1,131 @@
 from __future__ import annotations
 
 from manim import *
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Iterable, NamedTuple
 
-from Components.logging import DebugLogger
+from Components.animations import StyleTween
+from Components.logging import DebugLogger, get_logger
 from Components.strategies import OpenGLStrategy,CairoStrategy
 if TYPE_CHECKING:
     from numbers import Number
     from Structures.base import VisualElement,VisualStructure
 
 
+class EffectTag(NamedTuple):
+    """What an effect animation does to an element, read by `reduce_effects`.
+
+    ``kind`` is "fill" (highlight/unhighlight), "stroke" (outline/unoutline) or
+    "indicate"; ``target`` is the state it leaves the body in (or the pulse it plays).
+    """
+
+    kind: str
+    body: Any
+    target: tuple
+
+
+def _tag(animation: Animation, kind: str, body, target: tuple) -> Animation:
+    animation.effect_tag = EffectTag(kind, body, target)
+    return animation
+
+
+def _current_state(kind: str, body) -> tuple | None:
+    """The body's actual fill/stroke state, in the same form as an `EffectTag` target."""
+    try:
+        if kind == "fill":
+            return (ManimColor(body.get_fill_color()).to_hex(), round(float(body.get_fill_opacity()), 3))
+        if kind == "stroke":
+            return (ManimColor(body.get_stroke_color()).to_hex(), round(float(body.get_stroke_width()), 3))
+    except Exception:  # Bodies without a readable style can't be reduced
+        return None
+    return None
+
+
+def reduce_effects(animations: Iterable[Animation], parallel: bool = False) -> list[Animation]:
+    """Drop effect animations that would not change what is on screen.
+
+    A small per-element state machine is seeded from each body's current style and
+    advanced by every effect in ``animations``:
+
+    - a highlight/outline to the state the element is already in is dropped,
+      as is an unhighlight/unoutline of an element that is not highlighted,
+    - an indicate repeating the previous effect on the same element is merged into it,
+    - in a parallel play (``parallel=True``) only the last fill/stroke effect per element
+      survives, and a highlight/unhighlight pair that ends where it started cancels out.
+      Sequential pairs are kept: played one after the other they are a visible flash
+      (``VisualArray.__getitem__``), and state is not carried across plays.
+
+    Animations that are not effects are kept in order. After one of them (other than a
+    ``Wait``) runs in a sequential list, bodies not seen so far are no longer seeded,
+    since that animation may have restyled them.
+    """
+    animations = list(animations)
+    if parallel:
+        last_state: dict[tuple[int, str], int] = {}
+        seen_indicates: set[tuple[int, tuple]] = set()
+        drop: set[int] = set()
+        for i, animation in enumerate(animations):
+            tag = getattr(animation, "effect_tag", None)
+            if tag is None:
+                continue
+            if tag.kind == "indicate":
+                key = (id(tag.body), tag.target)
+                if key in seen_indicates:
+                    drop.add(i)
+                seen_indicates.add(key)
+                continue
+            key = (id(tag.body), tag.kind)
+            if key in last_state:
+                drop.add(last_state[key])  # Overridden by this later effect in the same play
+            last_state[key] = i
+        for (_, kind), i in last_state.items():
+            tag = animations[i].effect_tag
+            if tag.target == _current_state(kind, tag.body):  # Pair cancelled out, or nothing to do
+                drop.add(i)
+        return [animation for i, animation in enumerate(animations) if i not in drop]
+
+    state: dict[tuple[int, str], tuple | None] = {}
+    previous: EffectTag | None = None
+    trusted = True
+    kept = []
+    for animation in animations:
+        tag = getattr(animation, "effect_tag", None)
+        if tag is None:
+            kept.append(animation)
+            if not isinstance(animation, Wait):
+                trusted = False
+                previous = None
+            continue
+        if tag.kind == "indicate":
+            if previous is not None and previous.kind == "indicate" and previous.body is tag.body and previous.target == tag.target:
+                continue
+            kept.append(animation)
+            previous = tag
+            continue
+        key = (id(tag.body), tag.kind)
+        if key not in state:
+            state[key] = _current_state(tag.kind, tag.body) if trusted else None
+        if state[key] == tag.target:
+            continue
+        state[key] = tag.target
+        kept.append(animation)
+        previous = tag
+    return kept
+
+
 class EffectsManager:
     """Factory for common, reusable visual effects.
 
     Centralizes small animations like highlight/pulse/outline so structures can
     keep a minimal API. Effects are renderer-aware via a simple strategy layer.
+    Style effects are `StyleTween`s, which restyle bodies in place instead of
+    transforming copies of them.
     """
     def __init__(self, logger: DebugLogger | None = None):
 
-        self.logger = logger or DebugLogger(logger_name=f"{__name__}.EffectsManager")
+        self.logger = logger or get_logger(logger_name=f"{__name__}.EffectsManager")
         self.strategy = OpenGLStrategy() if config.renderer == RendererType.OPENGL else CairoStrategy()
 
-    def highlight(self, element: "VisualElement", color=YELLOW, opacity=None, runtime=0.5) -> ApplyMethod:
+    def highlight(self, element: "VisualElement", color=YELLOW, opacity=None, runtime=0.5) -> StyleTween:
         """Tint an element's fill to draw attention.
 
         Parameters
@@ -36,9 +140,10 @@ class EffectsManager:
         if self.logger:
             element_name = getattr(element, "label", type(element).__name__)
             self.logger.info("highlight element=%s color=%s opacity=%s", element_name, color, opacity)
-        return ApplyMethod(element_body.set_fill, color, opacity, run_time=runtime)
+        return _tag(StyleTween(element_body, fill_color=color, fill_opacity=opacity, run_time=runtime),
+                    "fill", element_body, (ManimColor(color).to_hex(), round(float(opacity), 3)))
 
-    def unhighlight(self, element: "VisualElement", opacity=None, runtime=0.5) -> ApplyMethod:
+    def unhighlight(self, element: "VisualElement", opacity=None, runtime=0.5) -> StyleTween:
         """Restore element fill back to base (black) with opacity.
 
         Parameters
@@ -52,7 +157,8 @@ class EffectsManager:
         if self.logger:
             element_name = getattr(element, "label", type(element).__name__)
             self.logger.info("unhighlight element=%s opacity=%s", element_name, opacity)
-        return ApplyMethod(element_body.set_fill, BLACK, opacity, run_time=runtime)
+        return _tag(StyleTween(element_body, fill_color=BLACK, fill_opacity=opacity, run_time=runtime),
+                    "fill", element_body, (ManimColor(BLACK).to_hex(), round(float(opacity), 3)))
     
 
     def indicate(self, element: "VisualElement", color=YELLOW, scale_factor=1.1, runtime=0.8) -> Animation:
@@ -62,23 +168,26 @@ class EffectsManager:
             element_name = getattr(element, "label", type(element).__name__)
             self.logger.info("indicate element=%s color=%s scale=%s", element_name, color, scale_factor)
 
-        return Indicate(element_body, color=color, scale_factor=scale_factor, run_time=runtime)
+        return _tag(Indicate(element_body, color=color, scale_factor=scale_factor, run_time=runtime),
+                    "indicate", element_body, (ManimColor(color).to_hex(), scale_factor, runtime))
 
-    def outline(self, element: "VisualElement", color=PURE_GREEN, width=6, runtime=0.5) -> ApplyMethod:
+    def outline(self, element: "VisualElement", color=PURE_GREEN, width=6, runtime=0.5) -> StyleTween:
         """Apply a colored stroke to outline the element."""
         element_body = getattr(element, "body", element)
         if self.logger:
             element_name = getattr(element, "label", type(element).__name__)
             self.logger.info("outline element=%s color=%s width=%s", element_name, color, width)
-        return ApplyMethod(element_body.set_stroke, color, width, 1.0, run_time=runtime)
+        return _tag(StyleTween(element_body, stroke_color=color, stroke_width=width, stroke_opacity=1.0, run_time=runtime),
+                    "stroke", element_body, (ManimColor(color).to_hex(), round(float(width), 3)))
 
-    def unoutline(self, element: "VisualElement", color=WHITE, width=4, runtime=0.5) -> ApplyMethod:
+    def unoutline(self, element: "VisualElement", color=WHITE, width=4, runtime=0.5) -> StyleTween:
         """Revert outline to a neutral stroke."""
         element_body = getattr(element, "body", element)
         if self.logger:
             element_name = getattr(element, "label", type(element).__name__)
             self.logger.info("unoutline element=%s color=%s width=%s", element_name, color, width)
-        return ApplyMethod(element_body.set_stroke, color, width, 1.0, run_time=runtime)
+        return _tag(StyleTween(element_body, stroke_color=color, stroke_width=width, stroke_opacity=1.0, run_time=runtime),
+                    "stroke", element_body, (ManimColor(color).to_hex(), round(float(width), 3)))
     
     def compare(self, element_1: VisualElement | Number, element_2: VisualElement | Number, result: bool = True) -> list[Animation]:
         """Build a simple visual compare sequence.
@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+"""
+Frame output stage that bypasses Manim's per-play movie writers.
+
+Manim copies every frame several times on its way to disk (``camera.get_frame``,
+the file writer queue, the encoder) and opens a fresh encoder for every play.
+This module keeps one ffmpeg process per output and feeds it from a fixed ring
+of pre-allocated frame buffers:
+
+- the producer (``PlaybackController``) fills a free slot straight from the
+  renderer: ``np.copyto`` from the Cairo pixel array, or ``read_into`` from the
+  OpenGL framebuffer,
+- a writer thread hands the slot's ``memoryview`` to ffmpeg's stdin and returns
+  the slot to the pool.
+
+No intermediate arrays or ``bytes`` objects are created per frame, and the
+producer only blocks when the encoder falls a full ring behind.
+"""
+
+import queue
+import shutil
+import subprocess
+import threading
+from fractions import Fraction
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Sequence
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from Components.logging import DebugLogger
+
+
+class FrameRing:
+    """Fixed pool of pre-allocated frame buffers shared by one producer and one consumer.
+
+    Parameters
+    ----------
+    frame_shape : tuple[int, int, int]
+        ``(height, width, channels)`` of every frame.
+    slots : int
+        Number of buffers. The producer blocks in `acquire` once all of them are
+        waiting to be consumed.
+    """
+
+    def __init__(self, frame_shape: tuple[int, int, int], slots: int = 8) -> None:
+        if slots < 1:
+            raise ValueError("FrameRing needs at least one slot.")
+        self.frame_shape = tuple(frame_shape)
+        self.frame_bytes = int(np.prod(self.frame_shape))
+        self._buffers = [bytearray(self.frame_bytes) for _ in range(slots)]
+        self._views = [memoryview(buffer) for buffer in self._buffers]
+        self._arrays = [np.frombuffer(buffer, dtype=np.uint8).reshape(self.frame_shape) for buffer in self._buffers]
+        self._free: queue.Queue[int] = queue.Queue()
+        self._ready: queue.Queue[tuple[int, int] | None] = queue.Queue()
+        for slot in range(slots):
+            self._free.put(slot)
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    def acquire(self) -> int:
+        """Return the index of a free slot, waiting for the consumer if none is free."""
+        return self._free.get()
+
+    def array(self, slot: int) -> np.ndarray:
+        """Writable ``uint8`` array view of ``slot`` (no copy)."""
+        return self._arrays[slot]
+
+    def view(self, slot: int) -> memoryview:
+        """Raw ``memoryview`` of ``slot`` (no copy)."""
+        return self._views[slot]
+
+    def publish(self, slot: int, repeat: int = 1) -> None:
+        """Hand a filled slot to the consumer, to be emitted ``repeat`` times."""
+        self._ready.put((slot, repeat))
+
+    def release(self, slot: int) -> None:
+        """Return a consumed slot to the free pool."""
+        self._free.put(slot)
+
+    def next_ready(self) -> tuple[int, int] | None:
+        """Block until a slot is published; None once the ring is closed."""
+        return self._ready.get()
+
+    def close(self) -> None:
+        """Tell the consumer that no more frames will be published."""
+        self._ready.put(None)
+
+
+class FFmpegSink:
+    """Persistent ffmpeg process fed from a `FrameRing`.
+
+    Parameters
+    ----------
+    path : str | Path
+        Output file, or ``"-"`` together with ``output_args`` such as ``("-f", "null")``.
+    width, height : int
+        Frame size in pixels.
+    fps : float
+        Frame rate of the raw input stream.
+    slots : int
+        Ring size; more slots absorb encoder stalls at the cost of memory.
+    vflip : bool
+        Flip frames vertically inside ffmpeg. OpenGL framebuffers are stored
+        bottom-up, so this avoids flipping (and copying) every frame in NumPy.
+    drop_duplicates : bool
+        Drop exact repeats of the previous frame before encoding and write a
+        variable frame-rate stream, so holds cost one encoded frame. ffmpeg gives
+        the last frame it keeps a single frame's duration, so the repeats of the
+        latest ``write(..., repeat=n)`` are held back: they are fed to the encoder
+        once another frame follows, or appended as a still segment by `close`.
+    output_args : Sequence[str] | None
+        Encoder arguments placed before ``path``. Defaults to H.264/yuv420p.
+    ffmpeg : str
+        ffmpeg executable.
+    logger : DebugLogger | None
+        Optional logger for lifecycle events.
+
+    Examples
+    --------
+    >>> with FFmpegSink("out.mp4", 1920, 1080, 60) as sink:  # doctest: +SKIP
+    ...     sink.write(frame)               # (1080, 1920, 4) uint8 RGBA
+    ...     sink.write(frame, repeat=30)    # half a second hold, one slot
+    """
+
+    DEFAULT_OUTPUT_ARGS: tuple[str, ...] = ("-vcodec", "libx264", "-pix_fmt", "yuv420p", "-crf", "23")
+
+    def __init__(
+        self,
+        path: str | Path,
+        width: int,
+        height: int,
+        fps: float,
+        *,
+        slots: int = 8,
+        vflip: bool = False,
+        drop_duplicates: bool = False,
+        output_args: Sequence[str] | None = None,
+        ffmpeg: str = "ffmpeg",
+        logger: "DebugLogger | None" = None,
+    ) -> None:
+        if not has_ffmpeg(ffmpeg):
+            raise FileNotFoundError(f"ffmpeg executable {ffmpeg!r} was not found on PATH.")
+        self.path = path if path == "-" else Path(path)
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.vflip = vflip
+        self.output_args = tuple(output_args if output_args is not None else self.DEFAULT_OUTPUT_ARGS)
+        self.ffmpeg = ffmpeg
+        self.logger = logger
+        self.ring = FrameRing((height, width, 4), slots=slots)
+        self.frames_written = 0
+        self._error: BaseException | None = None
+        self._closed = False
+        self._time_holds = drop_duplicates and path != "-"
+        self._hold: tuple[np.ndarray, int] | None = None  # (frame, repeats not yet sent) of the latest hold
+
+        command = [
+            ffmpeg, "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}", "-r", str(fps),
+            "-i", "-", "-an",
+        ]
+        filters = (["vflip"] if vflip else []) + (["mpdecimate=hi=0:lo=0:frac=0"] if drop_duplicates else [])
+        if filters:
+            command += ["-vf", ",".join(filters)]
+        if drop_duplicates: #Keep the original timestamps of the frames that survive
+            command += ["-fps_mode", "vfr"]
+        command += list(self.output_args)
+        command.append(str(self.path))
+        self._process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        self._writer = threading.Thread(target=self._drain, name="algomancer-ffmpeg-writer", daemon=True)
+        self._writer.start()
+        if self.logger:
+            self.logger.debug("frame_pipeline.open path=%s size=%dx%d fps=%s slots=%d", self.path, width, height, fps, slots)
+
+    def _drain(self) -> None:
+        stdin = self._process.stdin
+        while True:
+            item = self.ring.next_ready()
+            if item is None:
+                return
+            slot, repeat = item
+            view = self.ring.view(slot)
+            try:
+                if self._error is None:
+                    for _ in range(repeat):
+                        stdin.write(view)
+            except (BrokenPipeError, OSError, ValueError) as exc:  # ffmpeg exited; surfaced by write/close
+                self._error = exc
+            finally:
+                self.ring.release(slot)
+
+    def _check(self) -> None:
+        if self._closed:
+            raise RuntimeError("FFmpegSink is closed.")
+        if self._error is not None:
+            raise RuntimeError(f"ffmpeg stopped accepting frames: {self._error}") from self._error
+
+    def write(self, frame: np.ndarray, repeat: int = 1) -> None:
+        """Copy ``frame`` (``height x width x 4`` uint8) into a slot and queue it ``repeat`` times."""
+        self._check()
+        if repeat <= 0:
+            return
+        self._release_hold()
+        slot = self.ring.acquire()
+        np.copyto(self.ring.array(slot), frame, casting="unsafe")
+        self._publish(slot, repeat)
+
+    def write_into(self, fill: Callable[[memoryview], None], repeat: int = 1) -> None:
+        """Let ``fill`` write a frame directly into a slot's buffer, then queue it ``repeat`` times.
+
+        Used for sources that can read into a caller-provided buffer, e.g.
+        ``moderngl.Framebuffer.read_into``.
+        """
+        self._check()
+        if repeat <= 0:
+            return
+        self._release_hold()
+        slot = self.ring.acquire()
+        try:
+            fill(self.ring.view(slot))
+        except BaseException:
+            self.ring.release(slot)
+            raise
+        self._publish(slot, repeat)
+
+    def _publish(self, slot: int, repeat: int) -> None:
+        self.frames_written += repeat
+        if self._time_holds and repeat > 1: #Send the first frame now, keep the repeats back (see drop_duplicates)
+            self._hold = (self.ring.array(slot).copy(), repeat - 1)
+            repeat = 1
+        self.ring.publish(slot, repeat)
+
+    def _release_hold(self) -> None:
+        """Another frame follows the latest hold: its repeats can go through ffmpeg's decimation."""
+        if self._hold is None:
+            return
+        frame, repeat = self._hold
+        self._hold = None
+        slot = self.ring.acquire()
+        np.copyto(self.ring.array(slot), frame)
+        self.ring.publish(slot, repeat)
+
+    def _append_hold(self) -> None:
+        """Append the trailing hold to the finished file as a still segment lasting the held repeats."""
+        frame, repeat = self._hold
+        self._hold = None
+        if not has_ffmpeg(self.ffmpeg): #Removed while rendering: keep the stream, short hold and all
+            if self.logger:
+                self.logger.debug("frame_pipeline.hold skipped path=%s, ffmpeg not found", self.path)
+            return
+        if self.vflip: #The encoder flipped the stream, the still segment is written as is
+            frame = frame[::-1]
+        body = self.path.with_name(f"{self.path.stem}.body{self.path.suffix}")
+        tail = self.path.with_name(f"{self.path.stem}.hold{self.path.suffix}")
+        listing = self.path.with_name(f"{self.path.stem}.ffconcat")
+        self.path.replace(body)
+        try:
+            write_still_segment(tail, frame, repeat / self.fps, self.output_args, ffmpeg=self.ffmpeg)
+            #The body's duration is set explicitly: its trailing frames were decimated, so its last kept frame must
+            #last until the still segment starts
+            sent = (self.frames_written - repeat) / self.fps
+            quoted = [str(part.resolve()).replace("'", "'\\''") for part in (body, tail)]
+            listing.write_text(f"ffconcat version 1.0\nfile '{quoted[0]}'\nduration {sent}\nfile '{quoted[1]}'\n")
+            subprocess.run([self.ffmpeg, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+                            "-i", str(listing), "-c", "copy", str(self.path)], check=True)
+        except BaseException:
+            body.replace(self.path) #Keep the stream, short hold and all
+            raise
+        finally:
+            for part in (body, tail, listing):
+                part.unlink(missing_ok=True)
+        if self.logger:
+            self.logger.debug("frame_pipeline.hold path=%s frames=%d", self.path, repeat)
+
+    def close(self) -> None:
+        """Flush queued frames, wait for ffmpeg to finish the file and append a held-back trailing hold."""
+        if self._closed:
+            return
+        self._closed = True
+        self.ring.close()
+        self._writer.join()
+        try:
+            self._process.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+        returncode = self._process.wait()
+        if self.logger:
+            self.logger.debug("frame_pipeline.close path=%s frames=%d returncode=%d", self.path, self.frames_written, returncode)
+        if returncode != 0:
+            raise RuntimeError(f"ffmpeg exited with status {returncode} while writing {self.path}")
+        if self._error is not None:
+            raise RuntimeError(f"ffmpeg stopped accepting frames: {self._error}") from self._error
+        if self._hold is not None:
+            self._append_hold()
+
+    def __enter__(self) -> "FFmpegSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def has_ffmpeg(ffmpeg: str = "ffmpeg") -> bool:
+    """Whether the ``ffmpeg`` executable can be found; Manim itself encodes through PyAV and doesn't need it."""
+    return shutil.which(ffmpeg) is not None
+
+
+def output_args_for(extension: str, transparent: bool = False) -> tuple[str, ...] | None:
+    """Encoder arguments matching Manim's partial movie files for ``extension``.
+
+    Returns None for formats Algomancer can't write itself.
+    """
+    if extension == ".webm":
+        return ("-vcodec", "libvpx-vp9", "-pix_fmt", "yuva420p" if transparent else "yuv420p", "-auto-alt-ref", "1")
+    if transparent:
+        return ("-vcodec", "qtrle", "-pix_fmt", "argb") if extension == ".mov" else None
+    if extension in (".mp4", ".mov"):
+        return FFmpegSink.DEFAULT_OUTPUT_ARGS
+    return None  # .gif and friends are palette-optimised by Manim after concatenation
+
+
+def write_still_segment(
+    path: str | Path,
+    frame: np.ndarray,
+    duration: float,
+    output_args: Sequence[str],
+    *,
+    ffmpeg: str = "ffmpeg",
+) -> None:
+    """Encode ``frame`` once into a movie file that holds it for ``duration`` seconds.
+
+    The segment contains a single frame whose display time is the whole hold
+    (a variable frame-rate segment), so a pause costs one encoded frame however
+    long it is. Concatenation keeps the timestamps, so the hold survives muxing.
+    """
+    height, width = frame.shape[:2]
+    rate = Fraction(duration).limit_denominator(10_000)
+    command = [
+        ffmpeg, "-y", "-loglevel", "error",
+        "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}",
+        "-framerate", f"{rate.denominator}/{rate.numerator}",  # One input frame lasts `duration`
+        "-i", "-", "-an", "-frames:v", "1",
+        *output_args,
+    ]
+    if Path(path).suffix in (".mp4", ".mov"):
+        command += ["-video_track_timescale", "15360"]  # Same timescale as Manim's segments
+    command.append(str(path))
+    subprocess.run(command, input=memoryview(np.ascontiguousarray(frame[..., :4])), check=True)
+
+
+__all__ = ["FrameRing", "FFmpegSink", "has_ffmpeg", "output_args_for", "write_still_segment"]
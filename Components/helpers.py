@@ -36,7 +36,7 @@ def make_grid(self,r=3,c=3,cell_height=1,cell_width=1):
         else:
             start_pos = DOWN*0.5*r
             
-        array = VisualArray([""] * c,label=f"Array at row {i}",scene=self,start_pos=start_pos,cell_height=cell_height,cell_width=cell_width)
+        array = VisualArray([""] * c,label=f"Array at row {i}",scene=self,start_pos=start_pos,element_height=cell_height,element_width=cell_width)
         arrays.append(array)
         self.play(array.create())
         prev_array = array
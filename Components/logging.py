@@ -1,6 +1,5 @@
 import logging
 import os
-from dotenv import load_dotenv
 from logging.handlers import RotatingFileHandler
 from typing import Any, TYPE_CHECKING
 from pprint import pformat
@@ -8,6 +7,31 @@ if TYPE_CHECKING:
     from Structures.base import VisualElement,VisualStructure
 LOGGING_READY = False
 LOG_FILE = os.path.join("DEBUG","algomancer.log")
+_LOGGERS: dict[str, "DebugLogger"] = {} #Process-wide registry, one DebugLogger per name
+
+
+def get_logger(logger_name: str | None = None, output: bool = True) -> "DebugLogger":
+    """Return the shared `DebugLogger` for ``logger_name``, creating it on first use.
+
+    Elements and structures are created in bulk (e.g. one `Pointer` per `PointerRange`),
+    so they should fetch their logger here instead of constructing a `DebugLogger`.
+    The first request for a name logs a single "Run started" line; later requests
+    are a dict lookup with no logging or file writes.
+
+    Parameters
+    ----------
+    logger_name : str | None
+        Namespace for the underlying logger. Defaults to this module's name.
+    output : bool
+        Forwarded to `DebugLogger` (only matters for the first logger in the process).
+    """
+    name = logger_name or __name__
+    logger = _LOGGERS.get(name)
+    if logger is None:
+        logger = DebugLogger(logger_name=name, output=output)
+        _LOGGERS[name] = logger
+        logger.info("Run started for %s", name)
+    return logger
 
 class DebugLogger:
     """
@@ -34,13 +58,18 @@ class DebugLogger:
       Logs a detailed snapshot of a single visual element.
     """
     def __init__(self, logger_name: str | None = None, output: bool = True) -> None:
-        """Configure root handlers once and return the requested logger."""
+        """Configure root handlers once and wrap the requested logger.
+
+        Construction has no logging side effects beyond the one-time setup; prefer
+        `get_logger` so instances are shared per name.
+        """
         global LOGGING_READY
         if not LOGGING_READY:
+            from dotenv import load_dotenv #Deferred: only the first logger pays for it
             current_directory = os.path.dirname(os.path.abspath(__file__))
             env_path = os.path.join(current_directory,"..",".env")
-            print(env_path)
             load_dotenv(env_path)
+            os.makedirs(os.path.dirname(LOG_FILE),exist_ok=True)
             logging_level = (os.getenv("LOGGING_LEVEL") or "INFO").upper()
             level = getattr(logging,logging_level,logging.INFO)
             handlers = [
@@ -64,10 +93,9 @@ class DebugLogger:
         name = logger_name or __name__
         self.logger = logging.getLogger(name)
         if not LOGGING_READY:
+            self.logger.info("=" * 60)
             self.logger.info("Algomancer run initialized…")
             LOGGING_READY = True
-        self.logger.info("=" * 60)
-        self.logger.info("Run started for %s", name)
         
     def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+"""
+Multi-process frame rendering for the Cairo renderer.
+
+Cairo rasterises every frame of a play on one core. Once a play's animations are
+compiled, its frame times are independent of each other, so this module splits
+them into contiguous chunks and renders each chunk in a forked worker:
+
+- each worker inherits the compiled scene through ``fork`` (copy-on-write),
+  interpolates its own frame times and dumps raw RGBA frames to a scratch file,
+- the parent replays the chunks in order through ``emit``, so the file writer
+  or frame sink sees exactly the frame sequence a serial render would produce.
+
+Workers are forked rather than fed pickled scenes: structures hold updaters
+(lambdas) and weak references that the standard pickler cannot serialise.
+"""
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+from typing import TYPE_CHECKING, Callable, Sequence
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from manim.renderer.cairo_renderer import CairoRenderer
+    from Components.runtime import AlgoScene
+
+
+def can_fork() -> bool:
+    """Whether this platform can start workers that inherit the scene (POSIX only)."""
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def split_times(times: Sequence[float], workers: int, min_chunk: int) -> list[Sequence[float]]:
+    """Split ``times`` into at most ``workers`` contiguous chunks of at least ``min_chunk`` frames."""
+    chunks = max(1, min(workers, len(times) // max(1, min_chunk)))
+    bounds = np.linspace(0, len(times), chunks + 1).astype(int)
+    return [times[start:end] for start, end in zip(bounds[:-1], bounds[1:]) if end > start]
+
+
+class ParallelRenderError(RuntimeError):
+    """A frame worker failed; ``emitted`` frames (the chunks before it) were already handed to ``emit``."""
+
+    def __init__(self, message: str, emitted: int) -> None:
+        super().__init__(message)
+        self.emitted = emitted
+
+
+def _scratch_dir(needed: int) -> str:
+    """Directory for ``needed`` bytes of frame dumps: ``/dev/shm`` when they fit, the regular temp dir otherwise."""
+    shm = "/dev/shm"  # Keep frame dumps in memory where available (Docker's default is only 64 MB)
+    in_memory = os.path.isdir(shm) and shutil.disk_usage(shm).free >= needed
+    return tempfile.mkdtemp(prefix="algomancer_frames_", dir=shm if in_memory else None)
+
+
+def _render_chunk(scene: AlgoScene, renderer: CairoRenderer, times: Sequence[float], path: str) -> None:
+    with open(path, "wb") as out:
+        for t in times:
+            scene.update_to_time(t)
+            renderer.update_frame(scene, scene.moving_mobjects)
+            out.write(memoryview(np.ascontiguousarray(renderer.camera.pixel_array)))
+
+
+def render_parallel(
+    scene: AlgoScene,
+    renderer: CairoRenderer,
+    times: Sequence[float],
+    workers: int,
+    emit: Callable[[np.ndarray], None],
+    *,
+    min_chunk: int = 8,
+) -> None:
+    """Render ``times`` across ``workers`` forked processes and ``emit`` the frames in order.
+
+    Parameters
+    ----------
+    scene : AlgoScene
+        Scene whose animations were compiled and begun for this play.
+    renderer : CairoRenderer
+        Renderer whose camera rasterises each frame.
+    times : Sequence[float]
+        Frame times of the play, as produced by the scene's time progression.
+    workers : int
+        Maximum number of worker processes.
+    emit : Callable[[np.ndarray], None]
+        Receives every frame (``height x width x 4`` uint8) in time order.
+    min_chunk : int
+        Smallest number of frames worth a worker; shorter plays use fewer workers.
+
+    Raises
+    ------
+    ParallelRenderError
+        When a worker fails (e.g. its scratch file ran out of space). Frames before its
+        chunk were already emitted, the caller renders the rest serially.
+
+    Notes
+    -----
+    The parent scene is not advanced frame by frame; callers should bring it to
+    the last frame time afterwards (``scene.update_to_time``). Updaters that
+    integrate ``dt`` see one step per chunk boundary instead of one per frame.
+    """
+    shape = renderer.camera.pixel_array.shape
+    chunks = split_times(times, workers, min_chunk)
+    context = multiprocessing.get_context("fork")
+    scratch = _scratch_dir(len(times) * int(np.prod(shape)))
+    processes = []
+    emitted = 0
+    try:
+        for index, chunk in enumerate(chunks):
+            path = os.path.join(scratch, f"chunk_{index:04}.rgba")
+            process = context.Process(target=_render_chunk, args=(scene, renderer, chunk, path), daemon=True)
+            process.start()
+            processes.append((process, path, len(chunk)))
+
+        for process, path, count in processes:  # Chunks finish out of order, but are emitted in order
+            process.join()
+            if process.exitcode != 0:
+                raise ParallelRenderError(f"Frame worker for {path} exited with status {process.exitcode}", emitted)
+            frames = np.memmap(path, dtype=np.uint8, mode="r", shape=(count, *shape))
+            for frame in frames:
+                emit(frame)
+            del frames
+            emitted += count
+            os.remove(path)
+    finally:
+        for process, _, _ in processes:
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+__all__ = ["ParallelRenderError", "can_fork", "render_parallel", "split_times"]
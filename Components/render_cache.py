@@ -0,0 +1,473 @@
+from __future__ import annotations
+
+"""
+Persistent render cache for partial movie files.
+
+Manim names each play's partial movie file after a hash of the camera, the
+animations and every mobject in the scene, and only looks for it inside the
+current scene's partial movie directory. This module keys plays by what
+Algomancer actually animates instead:
+
+- the operation: animation types, timing and targets, and the updaters running during it,
+- the scene state: a digest of the geometry and style of what is on screen,
+- the style: resolution, frame rate, renderer and background.
+
+Rendered segments are stored in one shared directory, so an identical play is
+reused across runs and across scenes. The directory is bounded in size and
+evicts least-recently-used segments first.
+"""
+
+import hashlib
+import os
+import shutil
+import time
+import types
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from manim import Animation, Mobject
+    from Components.config import CacheSettings
+    from Components.logging import DebugLogger
+
+CACHE_VERSION = "4"  # Bump when the key layout changes so stale segments are never reused
+_STYLE_ATTRS = ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "fill_rgba", "stroke_rgba",
+                "stroke_width", "background_stroke_width", "fill_opacity", "stroke_opacity")
+_PRIMITIVES = (bool, int, float, str)
+_WEIGHTS = np.linspace(1.0, 2.0, 1024)  # Per-point weights for `state_stamp`, grown on demand
+
+
+def _update_with_array(digest: "hashlib._Hash", value: Any) -> None:
+    array = np.ascontiguousarray(value)
+    digest.update(str(array.dtype).encode())
+    digest.update(array.tobytes())
+
+
+def update_mobject_digest(digest: "hashlib._Hash", mobject: "Mobject") -> None:
+    """Feed the raw points and style arrays of ``mobject``'s family into ``digest``.
+
+    Only the arrays are hashed (no JSON serialisation), which keeps this close to a
+    memory copy even for large structures.
+    """
+    for member in mobject.family_members_with_points():
+        digest.update(type(member).__name__.encode())
+        _update_with_array(digest, member.points)
+        for attr in _STYLE_ATTRS:
+            value = getattr(member, attr, None)
+            if value is None or callable(value):
+                continue
+            _update_with_array(digest, value)
+        digest.update(repr(getattr(member, "z_index", 0)).encode())
+
+
+def _stamp_weights(count: int) -> np.ndarray:
+    global _WEIGHTS
+    if len(_WEIGHTS) < count:
+        _WEIGHTS = np.linspace(1.0, 2.0, max(count, 2 * len(_WEIGHTS)))
+    return _WEIGHTS[:count]
+
+
+def state_stamp(mobject: "Mobject") -> bytes:
+    """Cheap fingerprint of ``mobject``'s family: which members it has, their points and style.
+
+    Points enter as one weighted sum per member (so moves, scales and reorderings all
+    change it) instead of being hashed whole, which makes this several times cheaper
+    than `update_mobject_digest`, but still a walk over every point. It is only compared
+    within a run, with ``CacheSettings.verify_digests`` on, to find edits no ``mark_dirty``
+    call reported (``set_fill`` on a cell's body, in-place point writes); cache keys always
+    come from the full digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for member in mobject.family_members_with_points():
+        points = member.points
+        digest.update(id(member).to_bytes(8, "little"))
+        digest.update((_stamp_weights(len(points)) @ points).tobytes())
+        for attr in _STYLE_ATTRS:
+            value = getattr(member, attr, None)
+            if isinstance(value, np.ndarray):
+                digest.update(value.tobytes())
+            elif value is not None and not callable(value):
+                digest.update(repr(value).encode())
+        digest.update(repr(getattr(member, "z_index", 0)).encode())
+    return digest.digest()
+
+
+def _describe_code(code: types.CodeType, seen: set[int], known: set[int] | None = None) -> str | None:
+    """Bytecode, constants and referenced names of ``code`` (nested functions included)."""
+    digest = hashlib.blake2b(code.co_code, digest_size=16)
+    for const in code.co_consts:
+        text = _describe_code(const, seen, known) if isinstance(const, types.CodeType) else _describe_value(const, seen, known)
+        if text is None:
+            return None
+        digest.update(text.encode())
+    digest.update(repr(code.co_names).encode())
+    return digest.hexdigest()
+
+
+def _describe_callable(value: Any, seen: set[int], known: set[int] | None = None) -> str | None:
+    """Stable text for a function: its code, defaults, closure cells and the globals it reads.
+
+    Names alone are not enough since every lambda is ``"<lambda>"`` and the cache
+    outlives the run that stored a segment, so this follows Manim's
+    ``get_hash_from_play_call`` and hashes what the function computes with. Returns None
+    for callables with nothing stable to hash (callable instances, ...). Mobjects in
+    ``known`` are described by type only (see `describe_updaters`).
+    """
+    function = getattr(value, "__func__", value)
+    bound = getattr(value, "__self__", None)
+    parts = []
+    if bound is not None and not isinstance(bound, types.ModuleType):
+        from manim import Mobject
+        #A bound Mobject's state is already part of the play's mobjects and the scene digest
+        parts.append(type(bound).__name__ if isinstance(bound, Mobject) else _describe_value(bound, seen, known))
+    code = getattr(function, "__code__", None)
+    if code is None:
+        if not isinstance(function, (types.BuiltinFunctionType, np.ufunc, type)):
+            return None
+        #Library code: stable by name
+        parts.append(f"{getattr(function, '__module__', None)}.{getattr(function, '__qualname__', function.__name__)}")
+        return None if None in parts else "fn(" + ",".join(parts) + ")"
+    parts.append(_describe_code(code, seen, known))
+    parts.append(_describe_value(function.__defaults__, seen, known))
+    parts.append(_describe_value(function.__kwdefaults__, seen, known))
+    for cell in function.__closure__ or ():
+        try:
+            parts.append(_describe_value(cell.cell_contents, seen, known))
+        except ValueError: #Empty cell, e.g. a name assigned after the closure was made
+            parts.append("<empty>")
+    scope = getattr(function, "__globals__", {})
+    for name in code.co_names:
+        if name in scope:
+            parts.append(f"{name}={_describe_value(scope[name], seen, known)}")
+    return None if None in parts else "fn(" + ",".join(parts) + ")"
+
+
+def _describe_value(value: Any, seen: set[int] | None = None, known: set[int] | None = None) -> str | None:
+    """Stable text for an animation argument or attribute, or None if it can't be described.
+
+    ``seen`` guards against recursive functions and self-referencing containers;
+    mobjects whose ids are in ``known`` are described by type instead of digested.
+    """
+    from manim import Mobject
+
+    if value is None or isinstance(value, _PRIMITIVES):
+        return repr(value)
+    if isinstance(value, Mobject):
+        if known is not None and id(value) in known: #Already part of the key
+            return type(value).__name__
+        digest = hashlib.blake2b(digest_size=16)
+        update_mobject_digest(digest, value)
+        return digest.hexdigest()
+    if isinstance(value, np.ndarray):
+        return repr(np.round(value, 6).tolist())
+    if isinstance(value, types.ModuleType):
+        return f"module {value.__name__}"
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return "<recursive>"
+    seen.add(id(value))
+    if isinstance(value, (list, tuple)):
+        items = [_describe_value(item, seen, known) for item in value]
+        return None if None in items else "(" + ",".join(items) + ")"
+    if isinstance(value, (set, frozenset)):
+        items = [_describe_value(item, seen, known) for item in value]
+        return None if None in items else "{" + ",".join(sorted(items)) + "}"
+    if isinstance(value, dict):
+        keys = sorted(value, key=repr)
+        items = [_describe_value(value[key], seen, known) for key in keys]
+        return None if None in items else "{" + ",".join(f"{key!r}:{item}" for key, item in zip(keys, items)) + "}"
+    if callable(value):
+        return _describe_callable(value, seen, known)
+    if type(value).__repr__ is object.__repr__: #Default repr is an address, which says nothing about the value
+        return None
+    return repr(value)
+
+
+def describe_animation(animation: "Animation") -> str | None:
+    """Return a signature of ``animation``: its type, settings, functions and targets.
+
+    Composite animations (``AnimationGroup``, ``Succession``) are described through
+    their children; leaf animations also describe the mobject they act on and, for
+    ``ApplyMethod``/``Transform``, the method arguments or target mobject. Returns None
+    when part of the animation can't be described (see `_describe_value`), in which
+    case the play must not be cached.
+    """
+    parts = [type(animation).__name__]
+    undescribed = []
+
+    def add(name: str, value: Any) -> None:
+        text = _describe_value(value)
+        if text is None:
+            undescribed.append(name)
+        parts.append(f"{name}={text}")
+
+    settings = sorted((name, value) for name, value in vars(animation).items() if not name.startswith("_"))
+    for name, value in settings:
+        if isinstance(value, _PRIMITIVES):
+            parts.append(f"{name}={value!r}")
+    add("rate", getattr(animation, "rate_func", None))
+    children = getattr(animation, "animations", None)
+    if children:
+        described = [describe_animation(child) for child in children]
+        if undescribed or None in described:
+            return None
+        parts.append("[" + ";".join(described) + "]")
+        return "|".join(parts)
+
+    if hasattr(animation, "path_func"): #Transform keeps path_arc and its path function privately
+        add("path", animation.path_func)
+    method = getattr(animation, "method", None)
+    if method is not None:
+        add("method", method)
+        add("args", getattr(animation, "method_args", ()))
+    target = getattr(animation, "target_mobject", None)
+    if target is not None:
+        add("target", target)
+    members = getattr(animation, "members", None)
+    if members:  # StyleTween/BlockShift acting on part of its mobject
+        add("members", members)
+    for name, value in settings:  # Arrays (BlockShift offsets, bar writes, ...), functions and keyword dicts
+        if name in ("rate_func", "method"):
+            continue
+        if isinstance(value, (np.ndarray, dict)) or (callable(value) and not isinstance(value, type)):
+            add(name, value)
+    mobject = getattr(animation, "mobject", None)
+    if mobject is not None:
+        add("mobject", mobject)
+    return None if undescribed else "|".join(parts)
+
+
+def describe_updaters(mobjects: Iterable["Mobject"]) -> str | None:
+    """Signature of the updaters on every member of ``mobjects`` (``always_redraw``, labels following a body, ...).
+
+    Updaters change the frames of a play without touching its animations, so they are
+    part of the key like Manim's ``get_hash_from_play_call`` makes them. Mobjects among
+    ``mobjects`` that they use are described by type, since their state is already in the
+    scene digest (digesting every cell body a text follows would cost more than the play);
+    any other mobject (a ``ValueTracker`` off screen, ...) is digested. Returns None when
+    an updater can't be described.
+    """
+    members = {id(member): member for mobject in mobjects for member in mobject.get_family()}
+    known = set(members)
+    parts = []
+    for member in members.values():
+        for updater in member.get_updaters():
+            text = _describe_callable(updater, set(), known)
+            if text is None:
+                return None
+            parts.append(text)
+    return ";".join(parts)
+
+
+def describe_style(renderer: Any) -> str:
+    """Render settings that change the pixels of an otherwise identical play."""
+    from manim import config
+
+    camera = getattr(renderer, "camera", None)
+    return repr((
+        config.pixel_width,
+        config.pixel_height,
+        config.frame_rate,
+        config.frame_width,
+        config.frame_height,
+        str(config.renderer),
+        str(config.background_color),
+        config.background_opacity,
+        config.transparent,
+        config.movie_file_extension,
+        type(camera).__name__,
+        _describe_value(getattr(camera, "frame_center", None)),
+    ))
+
+
+class SceneStateDigest:
+    """Incremental digest of what is on screen, maintained per structure.
+
+    Hashing every point array on every play costs more than rendering short plays, so
+    each registered `VisualStructure` caches its own digest (`state_digest`) and only
+    rehashes after it is marked dirty: by its own mutators, by style edits and ``become``
+    on its elements, or by `mark_animated` once a play has animated one of its members or
+    ran with updaters on it. The per-play
+    digest then combines the cached structure digests with raw digests of the few
+    mobjects no structure owns (pointer arrows, labels, ...).
+    """
+
+    def __init__(self) -> None:
+        self._owners: dict[int, int] = {}  # id(member) -> id(structure)
+        self._versions: dict[int, int] = {}  # id(structure) -> family version the owners were built from
+
+    def _refresh_owners(self, structures: list[Any]) -> None:
+        versions = {id(structure): getattr(structure, "_family_version", 0) for structure in structures}
+        if versions == self._versions:
+            return
+        self._owners = {}
+        for structure in structures:
+            for member in structure.get_family():
+                self._owners[id(member)] = id(structure)
+        self._versions = versions
+
+    def update(self, digest: "hashlib._Hash", scene: Any) -> None:
+        """Feed the scene's state into ``digest`` in draw order."""
+        structures = list(getattr(scene, "_structures", {}).values())
+        self._refresh_owners(structures)
+        by_id = {id(structure): structure for structure in structures}
+        seen: set[int] = set()
+        for mobject in scene.mobjects:
+            owner = self._owners.get(id(mobject))
+            if owner is None or owner not in by_id:
+                update_mobject_digest(digest, mobject)
+                continue
+            if owner in seen:
+                continue
+            seen.add(owner)
+            digest.update(by_id[owner].state_digest())
+
+    def mark_animated(self, animations: Iterable["Animation"], scene: Any) -> None:
+        """Mark every structure owning a member of ``animations``, or carrying updaters, as dirty."""
+        structures = list(getattr(scene, "_structures", {}).values())
+        self._refresh_owners(structures)
+        by_id = {id(structure): structure for structure in structures}
+        dirty: set[int] = set()
+        for structure in structures:
+            if getattr(structure, "_has_updaters", False): #Its updaters ran during the play
+                dirty.add(id(structure))
+                structure.mark_dirty()
+        for animation in animations:
+            mobject = getattr(animation, "mobject", None)
+            if mobject is None:
+                continue
+            for member in mobject.get_family():
+                owner = self._owners.get(id(member))
+                if owner is not None and owner not in dirty and owner in by_id:
+                    dirty.add(owner)
+                    by_id[owner].mark_dirty()
+
+
+class RenderCache:
+    """Size-bounded, cross-run store of rendered partial movie files.
+
+    Parameters
+    ----------
+    directory : str | Path
+        Where segments are kept. Shared by every scene and run.
+    max_bytes : int
+        Upper bound for the total size of stored segments; the least recently
+        used segments are evicted first once it is exceeded.
+    logger : DebugLogger | None
+        Optional logger for hits, stores and evictions.
+
+    Notes
+    -----
+    Recency is tracked through each segment's modification time, which `fetch`
+    refreshes, so no index file has to be kept in sync across processes.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int, logger: "DebugLogger | None" = None) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.logger = logger
+        self.state = SceneStateDigest()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._total_bytes = sum(path.stat().st_size for path in self.directory.iterdir() if path.is_file())
+
+    @classmethod
+    def from_settings(cls, settings: "CacheSettings", logger: "DebugLogger | None" = None) -> "RenderCache | None":
+        """Build a cache from `CacheSettings`, or return None when it is disabled."""
+        if not settings.enabled:
+            return None
+        return cls(settings.directory, settings.max_bytes, logger=logger)
+
+    def key(self, renderer: Any, animations: Iterable["Animation"], scene: Any) -> str | None:
+        """Return the cache key for one play: (operation, scene-state digest, style).
+
+        Returns None when an animation or an updater can't be described (e.g. it calls
+        a callable object), so the play is rendered without caching rather than keyed loosely.
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(CACHE_VERSION.encode())
+        digest.update(describe_style(renderer).encode())
+        for animation in animations:
+            described = describe_animation(animation)
+            if described is None:
+                if self.logger:
+                    self.logger.debug("render_cache.skip %s can't be described", type(animation).__name__)
+                return None
+            digest.update(described.encode())
+        mobjects = [*scene.mobjects, *(animation.mobject for animation in animations if getattr(animation, "mobject", None) is not None)]
+        updaters = describe_updaters(mobjects)
+        if updaters is None:
+            if self.logger:
+                self.logger.debug("render_cache.skip an updater can't be described")
+            return None
+        digest.update(updaters.encode())
+        self.state.update(digest, scene)
+        return f"algo_{digest.hexdigest()}"
+
+    def _path(self, key: str, extension: str) -> Path:
+        return self.directory / f"{key}{extension}"
+
+    def fetch(self, key: str, destination: str | Path) -> bool:
+        """Materialise the segment for ``key`` at ``destination``.
+
+        Returns True on a hit. The segment is hard-linked when possible and
+        copied otherwise.
+        """
+        destination = Path(destination)
+        source = self._path(key, destination.suffix)
+        if not source.exists():
+            return False
+        if not destination.exists():
+            try:
+                os.link(source, destination)
+            except OSError:
+                shutil.copy2(source, destination)
+        now = time.time()
+        os.utime(source, (now, now))
+        if self.logger:
+            self.logger.debug("render_cache.hit key=%s", key)
+        return True
+
+    def store(self, key: str, source: str | Path) -> None:
+        """Add a freshly rendered segment under ``key`` and evict down to ``max_bytes``."""
+        source = Path(source)
+        target = self._path(key, source.suffix)
+        if target.exists() or not source.exists():
+            return
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+        self._total_bytes += target.stat().st_size
+        if self.logger:
+            self.logger.debug("render_cache.store key=%s size=%d", key, target.stat().st_size)
+        if self._total_bytes > self.max_bytes:
+            self.evict()
+
+    def evict(self) -> None:
+        """Delete least-recently-used segments until the cache fits in ``max_bytes``."""
+        segments = sorted(
+            (path for path in self.directory.iterdir() if path.is_file()),
+            key=lambda path: path.stat().st_mtime,
+        )
+        self._total_bytes = sum(path.stat().st_size for path in segments)
+        for path in segments:
+            if self._total_bytes <= self.max_bytes:
+                break
+            size = path.stat().st_size
+            path.unlink()
+            self._total_bytes -= size
+            if self.logger:
+                self.logger.debug("render_cache.evict %s size=%d", path.name, size)
+
+
+__all__ = [
+    "RenderCache",
+    "SceneStateDigest",
+    "describe_animation",
+    "describe_style",
+    "describe_updaters",
+    "state_stamp",
+    "update_mobject_digest",
+]
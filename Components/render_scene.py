@@ -1,12 +1,13 @@
-from manim import *
+from __future__ import annotations
 import subprocess
 from pathlib import Path
 import os
 from typing import TYPE_CHECKING
-from Components.config import DEFAULT_CONFIG as CFG
-from Components.logging import DebugLogger
-from Components.runtime import AlgoScene,AlgoSlide
+from Components.config import AppConfig, DEFAULT_CONFIG, CONFIG_ENV_VAR
+from Components.logging import get_logger
 import Components.runtime as runtime
+if TYPE_CHECKING:
+    from Components.runtime import AlgoScene,AlgoSlide
 QUALITY_MAP = {
     "low": "l",      # -ql
     "medium": "m",   # -qm
@@ -27,6 +28,7 @@ def render_scene(
     fps: int | None = None,
     slides: bool = True,
     force:bool = True,
+    app_config: AppConfig | None = None,
 ) -> list[str]:
     """Render one or more scenes via the Manim CLI.
 
@@ -50,6 +52,9 @@ def render_scene(
         Frames per second (``--fps``). Defaults to 30.
     slides : bool | None, optional
         Whether to force manim-slides mode. When ``None``, logic will decide later.
+    app_config : AppConfig | None, optional
+        Configuration for this render. Supplies the defaults above and is handed to the
+        scenes in the Manim subprocess. Defaults to ``DEFAULT_CONFIG``.
 
     Returns
     -------
@@ -57,8 +62,9 @@ def render_scene(
         Names of rendered scenes in order.
     """
     runtime.ACTIVE_SCRIPT = str(Path(file).resolve())
-    logger = DebugLogger(logger_name=__name__, output=True)
-    cfg = CFG 
+    logger = get_logger(logger_name=__name__, output=True)
+    cfg = app_config or DEFAULT_CONFIG
+    env = dict(os.environ, **{CONFIG_ENV_VAR: cfg.to_json()}) #Read back by AlgoScene in the subprocess
     quality = (quality or cfg.render.quality).lower()
     if quality not in QUALITY_MAP:
         raise ValueError(f"Unsupported quality '{quality}'. Expected one of {tuple(QUALITY_MAP)}")
@@ -83,7 +89,7 @@ def render_scene(
                 return
             cmd.append(scene.__name__)
             print("Running:", " ".join(cmd))
-            subprocess.run(cmd, check=True)
+            subprocess.run(cmd, check=True, env=env)
             outputs.append(scene.__name__)
         return outputs
     
@@ -121,6 +127,7 @@ def render_scene(
         Ensures all scenes subclass `AlgoSlide`, then runs `manim-slides present`
         for each scene name.
         """
+        from Components.runtime import AlgoSlide
         invalid = [s for s in scenes if not issubclass(s, AlgoSlide)]
         if invalid:
             names = ", ".join(s.__name__ for s in invalid)
@@ -134,7 +141,7 @@ def render_scene(
             ]
             cmd = [c for c in cmd if c]
             print("Running:", " ".join(cmd))
-            subprocess.run(cmd, check=True)
+            subprocess.run(cmd, check=True, env=env)
         return
 
     
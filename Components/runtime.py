@@ -1,8 +1,5 @@
 from __future__ import annotations
 from manim import *
-from manim.renderer.opengl_renderer import OpenGLRenderer
-from manim.renderer.cairo_renderer import CairoRenderer
-from manim_slides import Slide
 import contextvars
 import contextlib
 import sys
@@ -11,28 +8,52 @@ import weakref
 import numpy as np
 from typing import TYPE_CHECKING,Callable,Any,Generator,Iterable
 from types import FrameType
-from screeninfo import get_monitors
 from enum import Enum
 import os
 
-from Components.logging import DebugLogger
+from Components.logging import get_logger
 from Components.animations import LazyAnimation
+from Components.effects import reduce_effects
 from Components.helpers import flatten_array
-from Components.config import DEFAULT_CONFIG as CFG
+from Components.config import AppConfig, RenderSettings, DEFAULT_CONFIG, config_from_env
+from Components.render_cache import RenderCache
+from Components.frame_pipeline import FFmpegSink, has_ffmpeg, output_args_for, write_still_segment
+from Components.parallel_render import ParallelRenderError, can_fork, render_parallel
+from Components.batched_camera import BatchedCamera
+from Components.culling import FrustumCuller
 from manim.utils.hashing import get_hash_from_play_call
 if TYPE_CHECKING:
+    from manim.renderer.opengl_renderer import OpenGLRenderer
+    from manim.renderer.cairo_renderer import CairoRenderer
     from Structures.base import VisualStructure
 
 def compute_window_size(scale: float = 0.75) -> tuple[int, int]:
+      from screeninfo import get_monitors #Only needed once a window is actually opened
       monitor = get_monitors()[0]  #primary display
       width = int(monitor.width * scale)
       height = int(monitor.height * scale)
       return width, height
 
-config.pixel_width = CFG.render.pixel_width
-config.pixel_height = CFG.render.pixel_height
-config.window_size = compute_window_size(0.75)  #75% of the screen
-config.samples=CFG.render.samples
+def configure_window(scale: float = 0.75) -> None:
+    """Size the preview window relative to the primary display, but only if one will be opened.
+
+    Called right before the renderer sets up the scene, so headless renders never query
+    the display. Falls back to Manim's default size when no monitor can be found.
+    """
+    if config.renderer != RendererType.OPENGL:
+        return
+    if not (config.force_window or (config.preview and not config.write_to_movie and not config.save_last_frame)):
+        return
+    try:
+        config.window_size = compute_window_size(scale)
+    except Exception: #screeninfo raises when there is no display
+        return
+
+def apply_render_settings(settings: RenderSettings) -> None:
+    """Push a scene's render settings into Manim's config before its renderer and camera are set up."""
+    config.pixel_width = settings.pixel_width
+    config.pixel_height = settings.pixel_height
+    config.samples = settings.samples
 
 EXCLUDED_DIRS = {".venv", "site-packages", "manim", "Components","Structures"}
 ACTIVE_SCRIPT = None
@@ -76,6 +97,8 @@ class AlgoScene(Scene):
     """Scene subclass that tracks play state, registered structures, and drag-scaling."""
 
     _inside_play_call = False
+    streaming_output = True #Whether RenderSettings.output_mode="stream" may replace partial movie files
+    app_config: AppConfig | None = None #Class-level default, e.g. `app_config = DEFAULT_CONFIG.with_overrides(...)`
 
     def __init__(
         self,
@@ -84,14 +107,30 @@ class AlgoScene(Scene):
         always_update_mobjects=False,
         random_seed=None,
         skip_animations=False,
+        app_config: AppConfig | None = None,
     ):
         os.makedirs("DEBUG",exist_ok=True)
-        self.logger = DebugLogger(logger_name=__name__)
+        self.logger = get_logger(logger_name=__name__)
+        #Explicit argument > class attribute > config handed over by render_scene > defaults
+        self.app_config: AppConfig = app_config or type(self).app_config or config_from_env() or DEFAULT_CONFIG
+        apply_render_settings(self.app_config.render)
+        configure_window(self.app_config.render.window_scale)
+        render_settings = self.app_config.render
+        if camera_class is None and (render_settings.batch_draw or render_settings.cull_offscreen) and config.renderer == RendererType.CAIRO:
+            camera_class = BatchedCamera
         super().__init__(renderer, camera_class, always_update_mobjects, random_seed, skip_animations)
+        camera = getattr(self.renderer, "camera", None)
+        if isinstance(camera, BatchedCamera):
+            camera.batch_draw = render_settings.batch_draw
+            camera.cull_offscreen = render_settings.cull_offscreen
+        self.culler: FrustumCuller | None = FrustumCuller() if render_settings.cull_offscreen else None
         self._trace = []
         self._structures: weakref.WeakValueDictionary[int, VisualStructure] = weakref.WeakValueDictionary()
         self._active_structure = None
         self.player = PlaybackController(scene=self)
+        self._pending_compares: list[Animation] = [] #Compare effects waiting for the next play, see queue_compare
+        self._pending_pointer_moves: dict[int, tuple[Any, int]] = {} #id(pointer) -> (pointer, index before the batch)
+        self._pointer_batch_depth = 0
         self._keys_down:set = set([])
         self._last_toggle:float = 0.0 #There shuold be a 200ms cooldown between each key combination
 
@@ -101,10 +140,93 @@ class AlgoScene(Scene):
         with enable_animation():
             yield
 
+    def queue_compare(self, *animations: Animation) -> None:
+        """Defer a compare effect until the next play, where all pending compares run as one play.
+
+        Comparisons in a loop (searching, scanning for a minimum, ...) then cost one play
+        instead of one per comparison. Plays immediately when batching is disabled.
+        """
+        if not self.app_config.playback.batch_compares:
+            self.play(*animations)
+            return
+        self.flush_pointer_moves() #Keep moves and compares in the order the algorithm made them
+        self._pending_compares.extend(animations)
+
+    def flush_compares(self) -> None:
+        """Play every pending compare effect, in recording order, as a single play.
+
+        Batching only saves plays: back to back (``PlaybackSettings.compare_lag_ratio`` of 1)
+        the effects take as long as before. A smaller lag ratio starts each effect before the
+        previous one ends, which shortens the video.
+        """
+        if not self._pending_compares:
+            return
+        pending, self._pending_compares = self._pending_compares, []
+        if self.app_config.playback.reduce_effects:
+            pending = reduce_effects(pending)
+            if not pending:
+                return
+        self.logger.debug("Flushing %d pending compare animations", len(pending))
+        lag_ratio = self.app_config.playback.compare_lag_ratio
+        self.player.play(Succession(*pending) if lag_ratio >= 1 else AnimationGroup(*pending, lag_ratio=lag_ratio))
+
+    @contextlib.contextmanager
+    def batch_pointer_moves(self):
+        """Queue pointer moves made inside the block; see `Pointer.batch`. Nested blocks flush on the outermost exit."""
+        self._pointer_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._pointer_batch_depth -= 1
+            if not self._pointer_batch_depth:
+                self.flush_pointer_moves()
+
+    @property
+    def batching_pointer_moves(self) -> bool:
+        return self._pointer_batch_depth > 0 or self.app_config.playback.batch_pointer_moves
+
+    def queue_pointer_move(self, pointer, old_index: int) -> None:
+        """Defer a pointer move until the next play; only the first queued origin of each pointer is kept."""
+        self.flush_compares()
+        self._pending_pointer_moves.setdefault(id(pointer), (pointer, old_index))
+
+    def flush_pointer_moves(self) -> None:
+        """Play every pending pointer move, from its origin to the pointer's current index, as one parallel play."""
+        if not self._pending_pointer_moves:
+            return
+        pending, self._pending_pointer_moves = list(self._pending_pointer_moves.values()), {}
+        moves = [
+            pointer.move_pointer(old_index=old_index, new_index=pointer.value)
+            for pointer, old_index in pending
+            if getattr(pointer, "body", None) is not None and pointer.value != old_index
+        ]
+        if not moves:
+            return
+        self.logger.debug("Flushing %d pending pointer moves", len(moves))
+        self.player.play(AnimationGroup(*moves))
+
+    def tear_down(self):
+        self.flush_pointer_moves()
+        self.flush_compares()
+        self.player.finish_stream() #Closes the scene-wide encoder before Manim finishes the movie
+        super().tear_down()
+
     @property
     def in_play(self):  # convenience lol
         return self._inside_play_call
 
+    def begin_animations(self) -> None:
+        super().begin_animations()
+        if self.culler is not None:
+            guarded = self.culler.watch(self.animations, self.renderer.camera)
+            if guarded:
+                self.logger.debug("Culling %d off-screen animations", guarded)
+
+    def update_to_time(self, t):
+        if self.culler is not None: #Guarded animations and structure updaters test against this frame
+            self.culler.begin_frame(self.renderer.camera)
+        super().update_to_time(t)
+
     def play(self, *animations, sequential: bool = True, **kwargs):
         """
         Play one or more animations with optional parallel execution.
@@ -126,6 +248,8 @@ class AlgoScene(Scene):
         - To play animations sequentially, pass sequential=True.
         """
         self.logger.info(animations)
+        self.flush_pointer_moves() #Pointer moves and comparisons made before this play are shown before it
+        self.flush_compares()
         def resolve_animations(animations: Iterable[Animation | LazyAnimation]) -> Iterable[Animation]:
             """
             Resolve a list of Animation or LazyAnimation objects into a list of Animation objects.
@@ -158,6 +282,10 @@ class AlgoScene(Scene):
             return resolved
         
         resolved = resolve_animations(animations)
+        if self.app_config.playback.reduce_effects:
+            resolved = reduce_effects(resolved, parallel=not sequential)
+            if not resolved: #Every effect was redundant, nothing changes on screen
+                return
         if sequential:
             for anim in resolved:
                 self.player.play(anim,**kwargs)
@@ -286,26 +414,45 @@ class AlgoScene(Scene):
 
 
 
-class AlgoSlide(Slide, AlgoScene):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+def _build_algo_slide() -> type:
+    """Build `AlgoSlide` on first access so plain scenes never import manim_slides."""
+    from manim_slides import Slide
 
-    def next_slide(self, loop: bool = False, *args, **kwargs):
-        """Advances to the next slide in the presentation.
+    class AlgoSlide(Slide, AlgoScene):
+        streaming_output = False #manim-slides builds each slide from the partial movie files
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
 
-        If loop is True, the animation will continually replay itself
+        def next_slide(self, loop: bool = False, *args, **kwargs):
+            """Advances to the next slide in the presentation.
 
-        Parameters
-        ----------
-        loop : bool, optional
-            If loop is True, the animation will continually replay itself\n
-            Defaults to False.
-        *args : Any
-            Additional arguments to pass to the underlying `Slide.next_slide` method.
-        **kwargs : Any
-            Additional keyword arguments to pass to the underlying `Slide.next_slide` method.
-        """
-        super().next_slide(loop=loop, *args, **kwargs)
+            If loop is True, the animation will continually replay itself
+
+            Parameters
+            ----------
+            loop : bool, optional
+                If loop is True, the animation will continually replay itself\n
+                Defaults to False.
+            *args : Any
+                Additional arguments to pass to the underlying `Slide.next_slide` method.
+            **kwargs : Any
+                Additional keyword arguments to pass to the underlying `Slide.next_slide` method.
+            """
+            self.flush_pointer_moves() #Keep pending moves and compares on the slide they were made on
+            self.flush_compares()
+            super().next_slide(loop=loop, *args, **kwargs)
+
+    AlgoSlide.__module__ = __name__
+    AlgoSlide.__qualname__ = "AlgoSlide"
+    return AlgoSlide
+
+def __getattr__(name: str) -> Any:
+    #Module-level lazy attribute (PEP 562): `from Components.runtime import AlgoSlide` still works
+    if name == "AlgoSlide":
+        cls = _build_algo_slide()
+        globals()["AlgoSlide"] = cls
+        return cls
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
         
 class PlaybackState(str, Enum):
     """Lifecycle states for PlaybackController."""
@@ -327,7 +474,7 @@ class PlaybackController:
     def __init__(self,scene:AlgoScene,**kwargs):
         self.paused = False
         self.scene = scene
-        self.logger = DebugLogger(logger_name=f"{__name__}.PlaybackController")
+        self.logger = get_logger(logger_name=f"{__name__}.PlaybackController")
         self.renderer: OpenGLRenderer | CairoRenderer = scene.renderer
         self.state: PlaybackState = PlaybackState.IDLE
         self._playback_queue = {}
@@ -335,6 +482,65 @@ class PlaybackController:
         self.capture_enabled:bool = True
         self._step_time_delta:float = 0.0 #Time difference for n frames stepped
         self._last_t:float = 0.0
+        self.app_config:AppConfig = getattr(scene, "app_config", None) or DEFAULT_CONFIG
+        self.render_cache:RenderCache|None = RenderCache.from_settings(self.app_config.cache,logger=self.logger)
+        self.frame_sink:FFmpegSink|None = None #When set, frames bypass Manim's partial movie files
+        self._stream:FFmpegSink|None = None #Scene-wide sink owned by streaming output mode
+        self._stream_checked:bool = False
+        self._hold_path:Path|None = None #Partial movie file of the current play when it is written as one held frame
+
+    def attach_sink(self, sink: FFmpegSink) -> None:
+        """Route every rendered frame into ``sink`` instead of per-play partial movie files."""
+        self.frame_sink = sink
+
+    def detach_sink(self) -> FFmpegSink | None:
+        """Stop routing frames into the current sink and return it (still open)."""
+        sink, self.frame_sink = self.frame_sink, None
+        return sink
+
+    def open_stream(self) -> None:
+        """Open one encoder for the whole construct() when ``output_mode`` is "stream".
+
+        Checked once, on the first play. Falls back to partial movie files when the
+        output can't be streamed (slides, sections, GIFs, no ffmpeg on PATH).
+        """
+        if self._stream_checked or self.frame_sink is not None:
+            return
+        self._stream_checked = True
+        if self.app_config.render.output_mode != "stream" or not type(self.scene).streaming_output:
+            return
+        if not config.write_to_movie or config.save_sections or config.dry_run:
+            return
+        output_args = output_args_for(config.movie_file_extension, config.transparent)
+        if output_args is None:
+            self.logger.info("Streaming output does not support %s, using partial movie files", config.movie_file_extension)
+            return
+        file_writer = self.renderer.file_writer
+        movie_path = Path(file_writer.movie_file_path)
+        movie_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            stream = FFmpegSink(
+                movie_path, config.pixel_width, config.pixel_height, config.frame_rate,
+                vflip=config.renderer != RendererType.CAIRO, drop_duplicates=self.app_config.render.vfr_holds,
+                output_args=output_args, logger=self.logger,
+            )
+        except FileNotFoundError as exc:
+            self.logger.warning("Streaming output unavailable (%s), using partial movie files", exc)
+            return
+        self._stream = stream
+        self.attach_sink(stream)
+        file_writer.combine_to_movie = lambda: None #The stream already is the movie file
+        self.logger.info("Streaming output to %s", movie_path)
+
+    def finish_stream(self) -> None:
+        """Close the scene-wide encoder, if streaming output mode opened one."""
+        stream, self._stream = self._stream, None
+        if stream is None:
+            return
+        if self.frame_sink is stream:
+            self.detach_sink()
+        stream.close()
+
     def capture_data(self,animation:Animation):
         line_info = CURRENT_LINE.get()
         if line_info not in self._playback_queue:
@@ -363,47 +569,149 @@ class PlaybackController:
             """
             if not hasattr(renderer, "animations_hashes"):
                 renderer.animations_hashes = []  # type: ignore[attr-defined]
-
-            if not config["disable_caching"]:
-                hash_play = get_hash_from_play_call(
-                    renderer,
-                    renderer.camera,
-                    animations,
-                    scene.mobjects,
-                )
-                if renderer.file_writer.is_already_cached(hash_play):
+            #A cache hit below skips this play only, reset like Manim's renderers do
+            renderer.skip_animations = getattr(renderer, "_original_skipping_status", renderer.skip_animations)
+            renderer.update_skipping_status()
+            if self.frame_sink is not None: #Frames go straight to the sink, no partial movie file for this play
+                scene.compile_animation_data(*animations,**kwargs)
+                scene.begin_animations()
+                return
+
+            partial_dir = getattr(renderer.file_writer, "partial_movie_directory", None)
+            hash_play = None
+            if not config["disable_caching"] and not (self.render_cache is not None and partial_dir is None):
+                if self.render_cache is not None:
+                    hash_play = self.render_cache.key(renderer, animations, scene)
+                    if hash_play is not None:
+                        self.render_cache.fetch(hash_play, Path(partial_dir) / f"{hash_play}{config.movie_file_extension}")
+                else:
+                    hash_play = get_hash_from_play_call(
+                        renderer,
+                        renderer.camera,
+                        animations,
+                        scene.mobjects,
+                    )
+                if hash_play is not None and renderer.file_writer.is_already_cached(hash_play):
                     renderer.skip_animations = True
-            else:
+            if hash_play is None: #Caching disabled, nothing is written to disk to cache, or the play can't be keyed
                 hash_play = f"uncached_{renderer.num_plays:05}"
 
             renderer.animations_hashes.append(hash_play)
             renderer.file_writer.add_partial_movie_file(hash_play)
 
-            renderer.file_writer.begin_animation(not renderer.skip_animations)
             scene.compile_animation_data(*animations,**kwargs)
             scene.begin_animations()
+            self._hold_path = hold_segment_path(renderer, scene)
+            if self._hold_path is None: #Holds skip Manim's encoder entirely, see render_frozen_frame
+                renderer.file_writer.begin_animation(not renderer.skip_animations)
+
+        def hold_segment_path(renderer: OpenGLRenderer | CairoRenderer, scene: AlgoScene) -> Path | None:
+            """Partial movie file to write this play into as a single held frame, if it's a static hold."""
+            if not self.app_config.render.vfr_holds or renderer.skip_animations or not scene.is_current_animation_frozen_frame():
+                return None
+            if int(config.frame_rate * scene.duration) <= 1: #Nothing to save on single-frame waits
+                return None
+            if output_args_for(config.movie_file_extension, config.transparent) is None:
+                return None
+            if not has_ffmpeg(): #Falls back to Manim's writer, which doesn't need the binary
+                return None
+            path = renderer.file_writer.partial_movie_files[-1]
+            return Path(path) if path is not None else None
             
         def finalize_animations(renderer:OpenGLRenderer|CairoRenderer,scene:AlgoScene) -> None:
-            renderer.file_writer.end_animation(not renderer.skip_animations)
+            if self.frame_sink is not None:
+                renderer.time += scene.duration
+                renderer.num_plays += 1
+                return
+            if self._hold_path is None:
+                renderer.file_writer.end_animation(not renderer.skip_animations)
+            self._hold_path = None
+            if self.render_cache is not None:
+                self.render_cache.state.mark_animated(scene.animations, scene)
+            partial_movie_files = getattr(renderer.file_writer, "partial_movie_files", None)
+            if self.render_cache is not None and not renderer.skip_animations and partial_movie_files:
+                if partial_movie_files[-1] is not None and not renderer.animations_hashes[-1].startswith("uncached_"): #Freshly rendered, keep it for later runs/scenes
+                    self.render_cache.store(renderer.animations_hashes[-1], partial_movie_files[-1])
             renderer.time += scene.duration
             renderer.num_plays += 1
             
         def render_frozen_frame(renderer: OpenGLRenderer | CairoRenderer, scene: AlgoScene) -> None:
-                """Render a single frozen frame, duplicating it to match scene.duration.
+                """Render a single frozen frame, held for scene.duration.
 
                 Mirrors Manim's OpenGLRenderer.play frozen-frame branch
                 """
                 renderer.update_frame(scene)
                 if not renderer.skip_animations:
-                    renderer.file_writer.write_frame(
-                        renderer,
-                        num_frames=int(config.frame_rate * scene.duration),
-                    )
-                if not isinstance(renderer,CairoRenderer) and renderer.window is not None :
+                    num_frames = int(config.frame_rate * scene.duration)
+                    if self._hold_path is not None: #One encoded frame displayed for the whole hold
+                        write_still_segment(
+                            self._hold_path, renderer.get_frame(), num_frames / config.frame_rate,
+                            output_args_for(config.movie_file_extension, config.transparent),
+                        )
+                    elif self.frame_sink is not None: #One ring slot, dropped as a duplicate by the encoder
+                        write_sink_frame(renderer, repeat=num_frames)
+                    else:
+                        renderer.file_writer.write_frame(renderer, num_frames=num_frames)
+                if config.renderer != RendererType.CAIRO and renderer.window is not None :
                     renderer.window.swap_buffers()
                     while time.time() - renderer.animation_start_time < scene.duration:
                         pass
                 renderer.animation_elapsed_time = scene.duration
+        def write_sink_frame(renderer: OpenGLRenderer | CairoRenderer, repeat: int = 1) -> None:
+            """Copy the renderer's current frame into the sink's ring, skipping Manim's frame copies."""
+            if config.renderer == RendererType.CAIRO:
+                self.frame_sink.write(renderer.camera.pixel_array, repeat=repeat)
+                return
+            fbo = renderer.frame_buffer_object #Read straight into the ring slot, flipped by ffmpeg
+            self.frame_sink.write_into(lambda view: fbo.read_into(view, viewport=fbo.viewport, components=4), repeat=repeat)
+
+        def render_frame(scene: AlgoScene, renderer: OpenGLRenderer | CairoRenderer, t: float, write: bool = True) -> None:
+            """Render the frame at time ``t``, writing it to the sink when one is attached.
+
+            Mirrors CairoRenderer.render/OpenGLRenderer.render without going through the file writer.
+            """
+            if self.frame_sink is None:
+                renderer.render(scene, t, scene.moving_mobjects)
+                return
+            if config.renderer == RendererType.CAIRO:
+                renderer.update_frame(scene, scene.moving_mobjects)
+            else:
+                renderer.update_frame(scene)
+            if write and not renderer.skip_animations:
+                write_sink_frame(renderer)
+            window = getattr(renderer, "window", None)
+            if window is not None:
+                window.swap_buffers()
+                while renderer.animation_elapsed_time < t:
+                    renderer.update_frame(scene)
+                    window.swap_buffers()
+
+        def emit_frame(frame: np.ndarray) -> None:
+            """Hand an already rendered Cairo frame to the sink or Manim's file writer."""
+            if self.frame_sink is not None:
+                self.frame_sink.write(frame)
+            else:
+                self.renderer.add_frame(frame)
+
+        def parallel_times(scene: AlgoScene, renderer: OpenGLRenderer | CairoRenderer) -> list[float] | None:
+            """Frame times of this play if it should be split across workers, else None."""
+            if self.app_config.render.render_workers <= 1 or config.renderer != RendererType.CAIRO or not can_fork():
+                return None
+            if renderer.skip_animations or scene.skip_animation_preview or scene.stop_condition is not None:
+                return None
+            if self.state == PlaybackState.PAUSED: #Stepping needs the interactive loop
+                return None
+            times = list(getattr(scene.time_progression, "iterable", ()))
+            return times if len(times) >= 2 * self.app_config.render.min_frames_per_worker else None
+
+        def adaptive_preview(renderer: OpenGLRenderer | CairoRenderer) -> bool:
+            """Whether late steps may be dropped: dt_mode "adaptive", live OpenGL window, nothing written to file."""
+            if self.app_config.playback.dt_mode != "adaptive" or config.renderer != RendererType.OPENGL:
+                return False
+            if getattr(renderer, "window", None) is None or self.frame_sink is not None:
+                return False
+            return not (config.write_to_movie or config.save_last_frame)
+
         def run_animation_loop(scene: AlgoScene,renderer:OpenGLRenderer|CairoRenderer, skip_rendering: bool = False) -> None:
             """Advance animations for the given scene frame-by-frame and render each frame.
 
@@ -415,22 +723,49 @@ class PlaybackController:
                 scene.animations,
                 scene.duration,
             )
-            for t in scene.time_progression:  
-                # self.logger.debug("Current time progression: %s; time progression type: %s",t,type(t))
-                while self.state == PlaybackState.PAUSED and self._step_time_delta == 0:
-                    renderer.render(scene, self._last_t, scene.moving_mobjects) #so inputs and changes(scaling) can still be rendered
-                    time.sleep(0.01)
+            times = parallel_times(scene, renderer) if not skip_rendering else None
+            if times is not None: #Cairo frames rendered across forked workers, emitted in order
+                try:
+                    render_parallel(scene, renderer, times, self.app_config.render.render_workers, emit=emit_frame,
+                                    min_chunk=self.app_config.render.min_frames_per_worker)
+                except ParallelRenderError as error: #Finish the play in this process from the first missing frame
+                    self.logger.warning("Parallel render failed (%s), rendering the remaining %d frames serially",
+                                        error, len(times) - error.emitted)
+                    for t in times[error.emitted:]:
+                        scene.update_to_time(t)
+                        render_frame(scene, renderer, t)
+                scene.update_to_time(times[-1]) #Workers advanced their own copies of the scene
+                self._last_t = times[-1]
+            else:
+                adaptive = adaptive_preview(renderer)
+                frame_budget = 1 / config.frame_rate
+                paused_for = 0.0 #Wall time spent paused, excluded when checking if the preview is late
+                dropped = 0
+                for t in scene.time_progression:
+                    # self.logger.debug("Current time progression: %s; time progression type: %s",t,type(t))
+                    pause_start = time.time()
+                    while self.state == PlaybackState.PAUSED and self._step_time_delta == 0:
+                        render_frame(scene, renderer, self._last_t, write=False) #so inputs and changes(scaling) can still be rendered
+                        time.sleep(0.01)
+                    paused_for += time.time() - pause_start
                     
-                if self.state == PlaybackState.PAUSED and self._step_time_delta > 0: #Step to the correct frame first before pausing
-                    self._step_time_delta -= (1/config.frame_rate)
+                    if self.state == PlaybackState.PAUSED and self._step_time_delta > 0: #Step to the correct frame first before pausing
+                        self._step_time_delta -= (1/config.frame_rate)
                     
-                scene.update_to_time(t) #Animations will be rendered as if they're at the time t
-                if not skip_rendering and not scene.skip_animation_preview:
-                    renderer.render(scene, t, scene.moving_mobjects)
-                if scene.stop_condition is not None and scene.stop_condition():
-                    scene.time_progression.close()
-                    break
-                self._last_t = t
+                    if adaptive and self.state == PlaybackState.PLAYING and t + frame_budget < scene.duration:
+                        elapsed = time.time() - renderer.animation_start_time - paused_for
+                        if elapsed > t + frame_budget: #Over budget: merge this step into the next one
+                            dropped += 1
+                            continue
+                    scene.update_to_time(t) #Animations will be rendered as if they're at the time t
+                    if not skip_rendering and not scene.skip_animation_preview:
+                        render_frame(scene, renderer, t)
+                    if scene.stop_condition is not None and scene.stop_condition():
+                        scene.time_progression.close()
+                        break
+                    self._last_t = t
+                if dropped:
+                    self.logger.debug("Adaptive preview dropped %d late steps", dropped)
 
             for animation in scene.animations:
                 animation.finish()
@@ -452,6 +787,7 @@ class PlaybackController:
         #     self.logger.info("Playback timeline: %s",self._playback_timeline)
         #     return
         self.renderer.animation_start_time = time.time()
+        self.open_stream()
         begin_animations(scene=self.scene, renderer=self.renderer, animations=animations)
         
         if self.scene.is_current_animation_frozen_frame():  # Frozen frame
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+"""
+Flyweight geometry for cell bodies.
+
+Every `Cell` of a structure has the same body: a ``Rectangle`` (or
+``RoundedRectangle``) of ``element_width`` x ``element_height``. Building one per
+cell recomputes the same corners (and corner arcs) and keeps one point array per
+cell. `cell_body` instead builds each shape once, keeps its points centred on the
+origin as a read-only template, and returns bodies that store only a translation:
+
+- ``points`` is ``template + offset``; writes that only translate the shape
+  (``shift``, ``move_to``, moving a parent group) just move ``offset``,
+- any other write (``scale``/``rotate`` from ``indicate``, a ``Transform`` to another
+  shape, ``Create`` drawing part of the outline) gives the body its own copy, and a
+  later write that lands back on a translated template (the end of an ``indicate``)
+  drops that copy again.
+
+An assigned array is kept as the body's own copy, since Manim often fills it in place
+after assigning it (``pointwise_become_partial`` assigns ``np.empty`` and writes slices).
+Only read-modify-write assignments (``points += v``, which hand back the array the body
+just gave out) and the body's own methods, once they return, fold points back into a
+translation.
+
+The OpenGL renderer keeps points in ``data["points"]``, which its shaders read
+directly, so there `cell_body` returns ordinary shapes.
+"""
+
+import weakref
+
+import numpy as np
+from manim import ORIGIN, WHITE, Polygram, Rectangle, RendererType, RoundedRectangle, config
+
+_TEMPLATES: dict[tuple[float, float, float], np.ndarray] = {}
+_TEMPLATE_BOXES: dict[int, np.ndarray] = {} #id(template) -> [xmin, ymin, xmax, ymax], cached templates are never freed
+
+
+def shape_template(width: float, height: float, corner_radius: float = 0) -> np.ndarray:
+    """Read-only points of a ``width`` x ``height`` (rounded) rectangle centred on the origin, built once per shape."""
+    key = (float(width), float(height), float(corner_radius))
+    template = _TEMPLATES.get(key)
+    if template is None:
+        shape = (RoundedRectangle(width=width, height=height, corner_radius=corner_radius) if corner_radius
+                 else Rectangle(width=width, height=height))
+        template = shape.points - shape.get_center()
+        template.setflags(write=False)
+        _TEMPLATES[key] = template
+        _TEMPLATE_BOXES[id(template)] = np.concatenate([template[:, :2].min(axis=0), template[:, :2].max(axis=0)])
+    return template
+
+
+class SharedRectangle(Rectangle):
+    """A `Rectangle` whose points are a shared template plus its own translation (Cairo only).
+
+    Parameters
+    ----------
+    template : np.ndarray
+        Shape points centred on the origin, from `shape_template`.
+    center : np.ndarray, optional
+        Where to place the shape.
+    color : ManimColor, optional
+        Stroke (and fill) colour, as for `Rectangle`.
+    **kwargs :
+        Style arguments forwarded to ``VMobject``.
+    """
+
+    translation_tolerance = 1e-9
+
+    def __init__(self, template: np.ndarray, center: np.ndarray = ORIGIN, color=WHITE, **kwargs):
+        super(Polygram, self).__init__(color=color, **kwargs) #Skip Polygram/Rectangle: the template already holds the corners
+        self._template = template
+        self._offset = np.array(center, dtype=float)
+        self._own_points = None
+        self._handed_out = None #Weak reference to the last array built by the getter
+
+    @property
+    def points(self) -> np.ndarray:
+        own = getattr(self, "_own_points", None)
+        if own is not None:
+            return own
+        template = getattr(self, "_template", None)
+        if template is None: #Still inside VMobject.__init__
+            return np.zeros((0, 3))
+        points = template + self._offset
+        self._handed_out = weakref.ref(points)
+        return points
+
+    @points.setter
+    def points(self, new_points) -> None:
+        new_points = np.asarray(new_points)
+        handed_out = getattr(self, "_handed_out", None)
+        write_back = new_points is getattr(self, "_own_points", None) or (handed_out is not None and handed_out() is new_points)
+        self._own_points = new_points
+        if write_back: #The caller is done with it; a fresh array may still be filled in place
+            self._reshare()
+
+    def _reshare(self) -> None:
+        """Drop the body's own points if they are just a translated template."""
+        template, own = getattr(self, "_template", None), self._own_points
+        if template is None or own is None or own.shape != template.shape:
+            return
+        offset = own[0] - template[0]
+        if np.abs(own - template - offset).max() <= self.translation_tolerance:
+            self._offset = offset.astype(float)
+            self._own_points = None
+
+    @property
+    def shares_template(self) -> bool:
+        """Whether the body currently stores only a translation (no point array of its own)."""
+        return getattr(self, "_template", None) is not None and self._own_points is None
+
+    def box_2d(self) -> np.ndarray:
+        """``[xmin, ymin, xmax, ymax]`` of the body, without building its points while it shares the template."""
+        box = _TEMPLATE_BOXES.get(id(self._template)) if self.shares_template else None
+        if box is None:
+            points = self.points
+            return np.concatenate([points[:, :2].min(axis=0), points[:, :2].max(axis=0)])
+        return box + self._offset[[0, 1, 0, 1]]
+
+    def shift(self, *vectors):
+        if not self.shares_template or self.submobjects:
+            return super().shift(*vectors)
+        self._offset = self._offset + sum(np.asarray(vector, dtype=float) for vector in vectors)
+        return self
+
+    def apply_points_function_about_point(self, *args, **kwargs):
+        super().apply_points_function_about_point(*args, **kwargs)
+        self._reshare()
+        return self
+
+    def interpolate(self, *args, **kwargs):
+        super().interpolate(*args, **kwargs)
+        self._reshare()
+        return self
+
+    def pointwise_become_partial(self, *args, **kwargs):
+        super().pointwise_become_partial(*args, **kwargs)
+        self._reshare()
+        return self
+
+    def __deepcopy__(self, clone_from_id):
+        clone_from_id[id(self._template)] = self._template #Copies share the template too
+        return super().__deepcopy__(clone_from_id)
+
+
+def cell_body(width: float, height: float, corner_radius: float = 0, center: np.ndarray = ORIGIN):
+    """Body shape for a `Cell`: a `SharedRectangle` under Cairo, a plain (rounded) rectangle under OpenGL."""
+    if config.renderer != RendererType.CAIRO:
+        shape = (RoundedRectangle(width=width, height=height, corner_radius=corner_radius) if corner_radius
+                 else Rectangle(width=width, height=height))
+        return shape.move_to(center)
+    return SharedRectangle(shape_template(width, height, corner_radius), center=center)
+
+
+__all__ = ["shape_template", "SharedRectangle", "cell_body"]
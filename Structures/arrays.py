@@ -2,10 +2,11 @@ from typing import Any,Generic,TypeVar
 import math
 import numpy as np
 from manim import *
-from Components.animations import LazyAnimation, hop_element, slide_element
+from Components.animations import BlockShift, LazyAnimation, ParallelMove, StyleTween, hop_element, slide_element
 from Components.geometry import get_offset_position
-from Components.logging import DebugLogger
+from Components.logging import get_logger
 from Components.runtime import AlgoScene, is_animating
+from Components.shapes import cell_body
 from Structures.base import VisualStructure,VisualElement
 from Structures.pointers import Pointer
 BRIGHT_GREEN = "#00FF00"
@@ -40,6 +41,8 @@ class Cell(VisualElement):
         -----
         - The cell is rendered with a black background and white text by default.
         - The cell's text is centered within the cell's body.
+        - Under Cairo, bodies of the same size share one point template plus a per-cell
+          translation (see `Components.shapes`); scaling or rotating a body copies its points.
         """
 
     def __init__(self, value:Any,master:VisualStructure,
@@ -48,8 +51,7 @@ class Cell(VisualElement):
                 **kwargs):
         self.rounded = rounded
         corner_radius = 0.3 if rounded else 0
-        self.body = (RoundedRectangle(width=cell_width, height=cell_height, corner_radius=corner_radius) if rounded else 
-                Rectangle(width=cell_width, height=cell_height))
+        self.body = cell_body(cell_width, cell_height, corner_radius) #Same-sized cells share one point template
         self.body.set_fill(BLACK, opacity=1.0)
         if not border:
             self.body.set_stroke(opacity=0)
@@ -141,7 +143,7 @@ class VisualArray(VisualStructure,Generic[T]):
               Coordinates for the array’s center if `pos` is not provided.  
               Defaults to ORIGIN on each axis.
         """
-        self.logger = DebugLogger(logger_name=__name__, output=False)
+        self.logger = get_logger(logger_name=__name__, output=False)
         self._raw_data = data if isinstance(data, list) else list(data) #The original structure the user passed in, maybe don't touch this beyond create()
         self.border = kwargs.pop("border",True)
         super().__init__(scene,label,**kwargs)
@@ -150,6 +152,8 @@ class VisualArray(VisualStructure,Generic[T]):
         self.element_height = element_height
         self._instantiated = False
         self._iter_pointer = None
+        self._regions: dict[str, Rectangle] = {} #One overlay per region effect ("highlight"/"outline"), see _region_effect
+        self._visible_regions: set[str] = set()
 
         self.logger.info(
             "array.init len=%d w=%s h=%s rounded=%s border=%s label=%s pos=%s",
@@ -167,6 +171,8 @@ class VisualArray(VisualStructure,Generic[T]):
             
     def __getitem__(self, index):
         self.logger.debug("__getitem__ at index=%s",index)
+        if isinstance(index, slice):
+            return self._get_slice(index)
         if isinstance(index, Pointer):
             return self.get_element(index.value).value
         if self.scene and is_animating() and not self.scene.in_play:#Dunders should only execute if a scene is passed(otherwise only log)
@@ -174,6 +180,113 @@ class VisualArray(VisualStructure,Generic[T]):
             self.play([self.highlight(index,runtime=0.4),self.unhighlight(index,runtime=0.3)]) 
         return self.get_element(index).value
     
+    def _get_slice(self, region: slice) -> list:
+        """``arr[i:j]``: the values in the slice, shown through the highlight region when animating.
+
+        If a region is already highlighted (a sliding window), it moves onto the slice and stays;
+        otherwise the slice is flashed like a single-index read.
+        """
+        values = [cell.value for cell in self.elements[region]]
+        if not (self.scene and is_animating() and not self.scene.in_play) or not values:
+            return values
+        if region.step not in (None, 1): #Not one rectangle, flash the cells instead
+            cells = self.elements[region]
+            self.play(AnimationGroup(*[self.highlight(cell, runtime=0.4) for cell in cells]),
+                      AnimationGroup(*[self.unhighlight(cell, runtime=0.3) for cell in cells]))
+        elif "highlight" in self._visible_regions:
+            self.play(self.highlight(region, runtime=0.4))
+        else:
+            self.play([self.highlight(region, runtime=0.4), self.unhighlight(region, runtime=0.3)])
+        return values
+
+    def _region_span(self, region: slice) -> tuple[int, int]:
+        start, stop, step = region.indices(len(self.elements))
+        if step != 1:
+            raise ValueError(f"Region effects need a contiguous slice, got step {step}.")
+        return start, max(start, stop)
+
+    def _region_shape(self, start: int, stop: int) -> Rectangle:
+        """A rectangle covering the cells ``start`` to ``stop - 1``."""
+        first, last = self.elements[start], self.elements[stop - 1]
+        left, right = first.get_left(), last.get_right()
+        height = max(first.body_height, last.body_height)
+        return Rectangle(width=right[0] - left[0], height=height).move_to((left + right) / 2)
+
+    def _region_effect(self, kind: str, region: slice, *, show: bool, color: ManimColor,
+                       opacity: float | None = None, width: float | None = None, runtime: float = 0.5) -> LazyAnimation:
+        """Show, move or hide the overlay rectangle behind ``highlight``/``outline`` of a slice.
+
+        Each effect kind has one overlay for the whole array, so a region effect is a single
+        animation however many cells the slice covers: a fade-in when the overlay is hidden,
+        a `Transform` to the new span (and colour) when it is visible, a fade-out on hide.
+        """
+        def styled(shape: Rectangle, visible: bool) -> Rectangle:
+            if kind == "highlight":
+                shape.set_fill(color, opacity=opacity if visible else 0).set_stroke(width=0, opacity=0)
+                shape.z_index = 0.5 #Over the cell bodies, under their text
+            else:
+                shape.set_fill(opacity=0).set_stroke(color, width=width, opacity=1 if visible else 0)
+                shape.z_index = 2
+            return shape
+
+        def build():
+            start, stop = self._region_span(region)
+            overlay = self._regions.get(kind)
+            visible = kind in self._visible_regions
+            self.logger.debug("array.region kind=%s span=%s:%s show=%s visible=%s", kind, start, stop, show, visible)
+            if not show or stop == start:
+                if not visible:
+                    return Wait(1e-6)
+                self._visible_regions.discard(kind)
+                if kind == "highlight":
+                    return StyleTween(overlay, fill_opacity=0, run_time=runtime)
+                return StyleTween(overlay, stroke_opacity=0, run_time=runtime)
+
+            target = styled(self._region_shape(start, stop), visible=True)
+            if visible:
+                return Transform(overlay, target, run_time=runtime)
+            if overlay is None:
+                overlay = self._regions[kind] = styled(target.copy(), visible=False)
+                self.add(overlay)
+            else:
+                overlay.become(styled(target.copy(), visible=False)) #Hidden, so it can jump to the new span
+            self._visible_regions.add(kind)
+            if kind == "highlight":
+                return StyleTween(overlay, fill_color=color, fill_opacity=opacity, run_time=runtime)
+            return StyleTween(overlay, stroke_color=color, stroke_opacity=1, stroke_width=width, run_time=runtime)
+        return LazyAnimation(builder=build)
+
+    def highlight(self, element: "Cell|int|slice", *, color: ManimColor = YELLOW,
+                  opacity: float | None = None, runtime: float = 0.5):
+        """Highlight a cell, or a contiguous slice of cells with one region overlay (``arr.highlight(slice(i, j))``).
+
+        Highlighting another slice while one is shown moves and resizes the overlay in one animation.
+        """
+        if isinstance(element, slice):
+            opacity = self.effects.strategy.get_fill_opacity() if opacity is None else opacity
+            return self._region_effect("highlight", element, show=True, color=color, opacity=opacity, runtime=runtime)
+        return super().highlight(element, color=color, opacity=opacity, runtime=runtime)
+
+    def unhighlight(self, element: "Cell|int|slice", *, opacity: float | None = None, runtime: float = 0.5):
+        """Unhighlight a cell, or hide the region overlay of a slice."""
+        if isinstance(element, slice):
+            return self._region_effect("highlight", element, show=False, color=BLACK, runtime=runtime)
+        return super().unhighlight(element, opacity=opacity, runtime=runtime)
+
+    def outline(self, element: "Cell|int|slice", *, color: ManimColor = PURE_GREEN,
+                width: float = 6, runtime: float = 0.5):
+        """Outline a cell, or draw one outline around a contiguous slice of cells."""
+        if isinstance(element, slice):
+            return self._region_effect("outline", element, show=True, color=color, width=width, runtime=runtime)
+        return super().outline(element, color=color, width=width, runtime=runtime)
+
+    def unoutline(self, element: "Cell|int|slice", *, color: ManimColor = WHITE,
+                  width: float = 4, runtime: float = 0.5):
+        """Remove a cell's outline, or hide the outline around a slice."""
+        if isinstance(element, slice):
+            return self._region_effect("outline", element, show=False, color=color, width=width, runtime=runtime)
+        return super().unoutline(element, color=color, width=width, runtime=runtime)
+
     def __setitem__(self, index, value):
         if self.scene and is_animating() and not self.scene.in_play:
             self.play(self.set_value(index=index,value=value))
@@ -238,7 +351,7 @@ class VisualArray(VisualStructure,Generic[T]):
 
                 elem.move_to(slots[i])
                 
-            self.submobjects = list(self.elements)
+            self.submobjects = list(self.elements) + list(self._regions.values())
             print("Sorted elements: ",self.elements)
             self.play(Wait(0.1))
             return self
@@ -258,7 +371,7 @@ class VisualArray(VisualStructure,Generic[T]):
         """
         def build():
             cell:Cell = self.get_element(index)
-            animation = cell.set_value(value, color=self.text_color)
+            animation = cell.set_value(value, text_color=self.text_color, text_size=self.text_size)
             element_value = cell.value
             try:
                 idx_num = self.get_index(cell)
@@ -281,10 +394,9 @@ class VisualArray(VisualStructure,Generic[T]):
             destination = self.get_element(to_idx).get_center()
             key:Cell = self.get_element(from_idx)
             anims.append(hop_element(element=key))
-            for i in range(from_idx + step,to_idx + step,step):
-                cell:Cell = self.elements[i]
-                prev:Cell = self.elements[i - step]
-                anims.append(slide_element(element=cell,target_pos=prev.get_center()))
+            if from_idx != to_idx: #Cells between the two indices close the gap as one block
+                block = self.elements[from_idx + 1:to_idx + 1] if step == 1 else self.elements[to_idx:from_idx]
+                anims.append(self._shift_block(block, key.get_center() - self.elements[from_idx + step].get_center()))
                 
             anims.append(slide_element(element=key,target_pos=destination))
             anims.append(ApplyMethod(key.move_to, destination, run_time=0.3))
@@ -304,6 +416,15 @@ class VisualArray(VisualStructure,Generic[T]):
         
             
 
+    def _shift_block(self, cells: list[Cell], offset: np.ndarray, runtime: float = 0.5) -> BlockShift:
+        """One animation sliding a contiguous run of cells horizontally by ``offset``.
+
+        The cells stay owned by the array; callers reorder ``elements`` once the shift finishes.
+        """
+        offset = np.array([offset[0], 0.0, 0.0]) #Cells only slide along the row, like slide_element(align="x")
+        self.logger.debug("array.shift_block cells=%d dx=%.3f", len(cells), offset[0])
+        return BlockShift(self, members=list(cells), offset=offset, run_time=runtime)
+
     def move_cell(self, cell: int | Cell, target_position: np.ndarray, runtime: float = 1.0, direction = UP) -> Succession:
         """Moves specified cell to desired position"""
         cell_element = self.get_element(cell)
@@ -406,7 +527,8 @@ class VisualArray(VisualStructure,Generic[T]):
             raise TypeError("extend() argument must be iterable")
         for item in iterable:
             self.append(item,recenter=recenter)
-            self.wait(0.05)
+            if self.scene and is_animating() and not self.scene.in_play: #Short hold between appends
+                self.play(Wait(0.05))
             
     def __delitem__(self, index: int | Cell) -> None:
         cell: Cell = self.get_element(index)
@@ -436,20 +558,16 @@ class VisualArray(VisualStructure,Generic[T]):
         """
         mid = len(self.elements) // 2
         popped_cell:Cell = self.get_element(index)
+        index = self.get_index(popped_cell)
       
         anims = []
         anims.append(FadeOut(popped_cell))
-        if index <= mid:
-            for i in range(index - 1,-1,-1): #Shift cells to the right to fill up the popped cell
-                cell:Cell = self.elements[i]
-                prev:Cell = self.elements[i + 1]
-                anims.append(slide_element(element=cell,target_pos=prev.get_center()))
-        else:
-            for i in range(index + 1,len(self.elements)): #Shift cells to the left to fill up the popped cell
-                cell:Cell = self.elements[i]
-                prev:Cell = self.elements[i - 1]
-                anims.append(slide_element(element=cell,target_pos=prev.get_center()))
-       
+        if index <= mid and index > 0: #Shift the cells on the left one slot right to fill up the popped cell
+            neighbour:Cell = self.elements[index - 1]
+            anims.append(self._shift_block(self.elements[:index], popped_cell.get_center() - neighbour.get_center(), runtime=runtime))
+        elif index > mid and index < len(self.elements) - 1: #Shift the cells on the right one slot left
+            neighbour:Cell = self.elements[index + 1]
+            anims.append(self._shift_block(self.elements[index + 1:], popped_cell.get_center() - neighbour.get_center(), runtime=runtime))
             
         self.play(*anims,runtime=runtime)    
         self.elements.pop(index)
@@ -491,6 +609,62 @@ class VisualArray(VisualStructure,Generic[T]):
 
         return Succession(move_1, move_2, finalize, runtime=runtime)
     
+    def swap_many(self, pairs, runtime: float = 0.5) -> LazyAnimation:
+        """Swap several disjoint pairs of cells in one parallel animation.
+
+        Meant for rounds of independent swaps (odd-even transposition, bitonic sort...), which
+        would otherwise be one `swap` Succession per pair.
+
+        Parameters
+        ----------
+        pairs : Iterable[tuple[int | Cell | Pointer, int | Cell | Pointer]]
+            Index pairs to swap. Pairs of the same index are skipped.
+        runtime : float, optional
+            Duration of the whole round.
+
+        Returns
+        -------
+        LazyAnimation
+            One `ParallelMove` of every swapped cell, then a finish hook that applies the
+            permutation to ``elements``.
+
+        Raises
+        ------
+        ValueError
+            If an index appears in more than one pair.
+        """
+        index_pairs = [] #Resolved now so invalid rounds fail at the call site, not at play time
+        for pair in pairs:
+            first, second = (self.get_index(self.get_element(item.value if isinstance(item, Pointer) else item)) for item in pair)
+            if first != second:
+                index_pairs.append((first, second))
+        indices = np.array(index_pairs, dtype=int).reshape(-1, 2)
+        if len(np.unique(indices)) != indices.size:
+            raise ValueError(f"swap_many() needs disjoint pairs, got {index_pairs}.")
+
+        def build():
+            if not len(indices):
+                return Wait(1e-6)
+            movers = np.concatenate([indices[:, 0], indices[:, 1]])
+            partners = np.concatenate([indices[:, 1], indices[:, 0]])
+            cells = [self.elements[i] for i in movers]
+            centers = np.array([cell.get_center() for cell in self.elements], dtype=float)
+            targets = centers[partners]
+            arcs = np.concatenate([np.full(len(indices), 1.0), np.full(len(indices), -1.0)]) * float(self.element_height)
+            self.logger.debug("array.swap_many pairs=%s", index_pairs)
+            move = ParallelMove(self, members=cells, targets=targets, arcs=arcs, run_time=runtime)
+
+            finalize = Wait(0)
+            original_finish = finalize.finish
+            def _finish_swaps():
+                original_finish()
+                permutation = np.arange(len(self.elements))
+                permutation[movers] = partners
+                self.elements = [self.elements[i] for i in permutation]
+            finalize.finish = _finish_swaps
+            return Succession(move, finalize)
+        return LazyAnimation(builder=build)
+
     def create(self, cells: list[Cell] | None = None, runtime: float = 0.5) -> AnimationGroup:
         """Creates the Cell object or index passed, defaults to creating the entire array"""
         def instantiate(raw_data: list[Any], position: np.ndarray) -> None:
@@ -0,0 +1,457 @@
+from __future__ import annotations
+from collections.abc import Sequence
+from typing import Any
+import weakref
+import numpy as np
+from manim import *
+from Components.animations import BlockShift, LazyAnimation
+from Components.logging import get_logger
+from Components.runtime import AlgoScene, is_animating
+from Structures.arrays import VisualArray
+from Structures.base import VisualElement
+from Structures.pointers import Pointer
+
+
+class Bar(VisualElement):
+    """Stand-in element for one slot of a `VisualBarArray`.
+
+    A `Bar` owns no mobjects: its value and geometry are read from the array's buffers,
+    so pointers, comparisons and ``get_element`` work without one mobject per value.
+    Bars are created on first access and cached per slot index.
+    """
+
+    def __init__(self, master: VisualBarArray, index: int):
+        super().__init__(master=master)
+        self.index = index
+
+    @property
+    def value(self):
+        master = self.master
+        return master.values[self.index].item() if master is not None else None
+
+    @value.setter
+    def value(self, new_value):
+        if new_value is not None: #VisualElement.__init__ assigns value=None
+            self.master.write(self.index, new_value)
+
+    @property
+    def body_width(self):
+        return self.master.marker_size
+
+    @property
+    def body_height(self):
+        return self.master.marker_size
+
+    def get_center(self):
+        return self.master.slot_center(self.index)
+
+    def get_top(self):
+        return self.get_center() + UP * self.master.strip_height / 2
+
+    def get_bottom(self):
+        return self.get_center() + DOWN * self.master.strip_height / 2
+
+    def get_left(self):
+        return self.get_center() + LEFT * self.master.bar_width / 2
+
+    def get_right(self):
+        return self.get_center() + RIGHT * self.master.bar_width / 2
+
+
+class _BarSlots(Sequence):
+    """``elements`` of a `VisualBarArray`: a sequence of `Bar`s built lazily, one per slot."""
+
+    def __init__(self, master: VisualBarArray):
+        self._master_ref = weakref.ref(master)
+        self._bars: dict[int, Bar] = {}
+
+    def __len__(self):
+        return len(self._master_ref().values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        length = len(self)
+        index = index + length if index < 0 else index
+        if not 0 <= index < length:
+            raise IndexError("list index out of range")
+        bar = self._bars.get(index)
+        if bar is None:
+            bar = self._bars[index] = Bar(self._master_ref(), index)
+        return bar
+
+    def materialized(self) -> list[Bar]:
+        """The bars created so far (the ones pointers or effects have touched)."""
+        return list(self._bars.values())
+
+    def forget_from(self, index: int) -> None:
+        """Drop cached bars at ``index`` and after, for slots that no longer exist."""
+        for key in [key for key in self._bars if key >= index]:
+            del self._bars[key]
+
+
+class BarTween(Animation):
+    """Redraw some bars of a `VisualBarArray` from ``start_values`` to ``end_values``.
+
+    Only the listed bars' vertices (or heat bins) are rewritten each frame; the values
+    themselves are committed when the animation is built.
+    """
+
+    def __init__(self, array: VisualBarArray, indices, start_values, end_values, **kwargs):
+        super().__init__(array, **kwargs)
+        self.indices = np.asarray(indices, dtype=int)
+        self.start_values = np.asarray(start_values, dtype=float)
+        self.end_values = np.asarray(end_values, dtype=float)
+
+    def create_starting_mobject(self):
+        return self.mobject  # Draws straight into the array's buffers
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        progress = self.rate_func(alpha)
+        self.mobject.draw(self.indices, self.start_values + (self.end_values - self.start_values) * progress)
+
+
+class VisualBarArray(VisualArray):
+    """A `VisualArray` drawn as a bar chart or heat strip instead of one `Cell` per value.
+
+    Parameters
+    ----------
+    data : Sequence[float] | np.ndarray
+        Numeric values.
+    scene : AlgoScene
+        The active scene (pass ``self``).
+    mode : str, optional
+        ``"bars"`` (bar height follows the value) or ``"heat"`` (full-height bars coloured
+        by value). Defaults to ``"bars"``.
+    width : float | None, optional
+        Width of the whole strip. Defaults to 90% of the frame width.
+    height : float, optional
+        Height of the strip.
+    color : ManimColor, optional
+        Bar colour in ``"bars"`` mode.
+    colors : Sequence[ManimColor], optional
+        Colour scale (low to high) in ``"heat"`` mode.
+    heat_levels : int, optional
+        Number of colour levels in ``"heat"`` mode.
+    marker_size : float, optional
+        Size the bars report as their body, so pointers and offsets stay readable however
+        thin the bars are.
+    label : str | None, optional
+        Label used in logs and overlays.
+    **kwargs :
+        Additional positioning arguments (``start_pos`` or ``x``/``y``/``z``).
+
+    Notes
+    -----
+    - ``values`` (NumPy) is the source of truth. ``"bars"`` mode draws every bar as a subpath
+      of one `VMobject`; ``"heat"`` mode draws one `VMobject` per colour level. Writes and
+      swaps rewrite only the affected bars' vertices (heat: the two levels involved), so
+      10k-100k element arrays stay cheap to build and animate.
+    - ``elements`` holds lightweight `Bar` stand-ins built on first access; indexing,
+      ``swap``/``swap_many``, ``set_value`` and `Pointer` work as on `VisualArray`.
+    - Highlights and outlines of an index or slice use the region overlay, so one region
+      of each kind is shown at a time.
+    - ``append``/``pop``/``insert`` re-lay out the whole strip from the buffer.
+    """
+
+    def __init__(self, data: Any, scene: AlgoScene = None, mode: str = "bars", width: float | None = None,
+                 height: float = 3.0, color: ManimColor = BLUE, colors=(BLUE_E, TEAL, YELLOW, RED),
+                 heat_levels: int = 16, marker_size: float = 0.5, label: str = None, **kwargs):
+        values = np.asarray(data)
+        if values.ndim != 1 or values.dtype.kind not in "biuf":
+            raise TypeError(f"VisualBarArray needs a 1D sequence of numbers, got {values.dtype} with shape {values.shape}.")
+        if mode not in ("bars", "heat"):
+            raise ValueError(f"Unknown VisualBarArray mode {mode!r}, expected 'bars' or 'heat'.")
+        super().__init__([], scene=scene, label=label, **kwargs)
+        self.logger = get_logger(logger_name=__name__, output=False)
+        self.values: np.ndarray = values.copy()
+        self.elements = _BarSlots(self)
+        self.mode = mode
+        self.strip_width = float(width) if width is not None else config.frame_width * 0.9
+        self.strip_height = float(height)
+        self.bar_color = color
+        self.heat_colors = color_gradient(list(colors), heat_levels)
+        self.marker_size = marker_size
+        self.strip: VMobject | VGroup | None = None
+        self._drawn = np.zeros(0) #Values as currently drawn (behind `values` while a BarTween runs)
+        self._levels = np.zeros(0, dtype=int) #Heat level drawn for each slot
+        self._slot_points = np.zeros((0, 0, 3)) #Full-height rectangle per slot, heat mode
+        self._range = (0.0, 1.0)
+        self.logger.info("bars.init len=%d mode=%s width=%.2f height=%.2f label=%s", len(values), mode, self.strip_width, height, label)
+
+    def __repr__(self):
+        return f"VisualBarArray({self.values.tolist()})"
+
+    # --- Geometry ---
+    @property
+    def bar_width(self) -> float:
+        return self.strip_width / max(len(self.values), 1)
+
+    def slot_center(self, index: int) -> np.ndarray:
+        left = self.pos[0] - self.strip_width / 2
+        return np.array([left + (index + 0.5) * self.bar_width, self.pos[1], self.pos[2]])
+
+    def _template(self) -> np.ndarray:
+        """Unit square outline as line curves, in the renderer's points-per-curve layout."""
+        per_curve = VMobject().n_points_per_curve
+        corners = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 0]], dtype=float)
+        weights = np.linspace(0, 1, per_curve)[:, None]
+        return np.concatenate([start + (end - start) * weights for start, end in zip(corners[:-1], corners[1:])])
+
+    def _rectangles(self, indices: np.ndarray, heights: np.ndarray) -> np.ndarray:
+        """``(len(indices), points_per_bar, 3)`` bar outlines standing on the strip's bottom."""
+        gap = 0.9 if self.bar_width * config.pixel_width / config.frame_width > 3 else 1.0 #Gaps only once bars are a few pixels wide
+        left = self.pos[0] - self.strip_width / 2 + indices * self.bar_width + self.bar_width * (1 - gap) / 2
+        scale = np.stack([np.full(len(indices), self.bar_width * gap), heights, np.zeros(len(indices))], axis=1)
+        offset = np.stack([left, np.full(len(indices), self.pos[1] - self.strip_height / 2), np.full(len(indices), self.pos[2])], axis=1)
+        return self._unit[None] * scale[:, None, :] + offset[:, None, :]
+
+    def _heights(self, values: np.ndarray) -> np.ndarray:
+        low, high = self._range
+        return np.maximum((values - low) / (high - low), 1e-3) * self.strip_height
+
+    def _heat_levels(self, values: np.ndarray) -> np.ndarray:
+        low, high = self._range
+        return np.clip(((values - low) / (high - low) * len(self.heat_colors)).astype(int), 0, len(self.heat_colors) - 1)
+
+    @staticmethod
+    def _points_changed(mobject: VMobject) -> None:
+        for hook in ("refresh_triangulation", "refresh_bounding_box"): #OpenGL caches both
+            refresh = getattr(mobject, hook, None)
+            if refresh is not None:
+                refresh()
+
+    def _layout(self) -> None:
+        """Rebuild the strip's geometry from ``values`` (creation and resizes)."""
+        values = self.values.astype(float)
+        low = min(0.0, float(values.min())) if len(values) else 0.0
+        high = float(values.max()) if len(values) else 1.0
+        self._range = (low, max(high, low + 1e-9))
+        self._unit = self._template()
+        self._drawn = values.copy()
+        if self.strip is None:
+            if self.mode == "bars":
+                self.strip = VMobject(fill_color=self.bar_color, fill_opacity=1, stroke_width=0)
+            else:
+                self.strip = VGroup(*[VMobject(fill_color=color, fill_opacity=1, stroke_width=0) for color in self.heat_colors])
+        self._redraw_all()
+
+    def _redraw_all(self) -> None:
+        """Rewrite every bar from ``_drawn`` (after a layout or a change of value range)."""
+        indices = np.arange(len(self._drawn))
+        if self.mode == "bars":
+            self.strip.set_points(self._rectangles(indices, self._heights(self._drawn)).reshape(-1, 3))
+            self._points_changed(self.strip)
+            return
+        self._slot_points = self._rectangles(indices, np.full(len(indices), self.strip_height))
+        self._levels = self._heat_levels(self._drawn)
+        self._redraw_levels(range(len(self.heat_colors)))
+
+    def _redraw_levels(self, levels) -> None:
+        for level in levels:
+            members = np.flatnonzero(self._levels == level)
+            level_mobject = self.strip[level]
+            level_mobject.set_points(self._slot_points[members].reshape(-1, 3))
+            self._points_changed(level_mobject)
+
+    def draw(self, indices: np.ndarray, values: np.ndarray) -> None:
+        """Redraw the bars at ``indices`` as ``values``, touching only their vertices (or heat levels)."""
+        indices = np.asarray(indices, dtype=int)
+        values = np.asarray(values, dtype=float)
+        low, high = self._range
+        self._drawn[indices] = values
+        if len(values) and (values.min() < low or values.max() > high): #Out of the drawn scale, rescale every bar
+            self._range = (min(low, float(values.min())), max(high, float(values.max())))
+            self._redraw_all()
+            return
+        if self.mode == "bars":
+            bars = self.strip.points.reshape(len(self.values), -1, 3)
+            bars[indices] = self._rectangles(indices, self._heights(values))
+            self._points_changed(self.strip)
+            return
+        levels = self._heat_levels(values)
+        changed = levels != self._levels[indices]
+        if changed.any():
+            touched = set(self._levels[indices[changed]].tolist()) | set(levels[changed].tolist())
+            self._levels[indices[changed]] = levels[changed]
+            self._redraw_levels(touched)
+
+    # --- Writes ---
+    def _slot(self, item) -> int:
+        return self.get_index(self.get_element(item.value if isinstance(item, Pointer) else item))
+
+    def _fit(self, new_values) -> np.ndarray:
+        """``new_values`` as an array of the buffer's dtype, upcasting the buffer first when they don't fit it.
+
+        A float or ``inf`` written into an int strip would otherwise be truncated or overflow,
+        as in `VisualGrid`.
+        """
+        incoming = np.asarray(new_values)
+        dtype = np.result_type(self.values.dtype, incoming.dtype)
+        if dtype != self.values.dtype:
+            self.logger.debug("bars.upcast %s -> %s", self.values.dtype, dtype)
+            self.values = self.values.astype(dtype)
+        return incoming.astype(dtype, copy=False)
+
+    def _tween(self, indices, new_values, runtime: float) -> Animation:
+        """Commit ``new_values`` at ``indices`` and return the animation redrawing those bars."""
+        indices = np.asarray(indices, dtype=int)
+        self.values[indices] = self._fit(new_values)
+        self.mark_dirty()
+        if self.strip is None: #Not drawn yet, create() lays out the committed values
+            return Wait(1e-6)
+        start = self._drawn[indices].copy()
+        return BarTween(self, indices, start, self.values[indices].astype(float), run_time=runtime)
+
+    def write(self, index: int, value: Any) -> None:
+        """Set ``values[index]`` and redraw that bar immediately (no animation)."""
+        value = value.value if isinstance(value, VisualElement) else value
+        if self.values[index] == value:
+            return
+        self.values[index] = self._fit(value)
+        self.mark_dirty()
+        if self.strip is not None:
+            self.draw([index], [float(self.values[index])])
+
+    def __setitem__(self, index, value):
+        if self.scene and is_animating() and not self.scene.in_play:
+            self.play(self.set_value(index=index, value=value))
+        else:
+            self.write(self._slot(index), value)
+
+    def set_value(self, index: int | Bar, value: Any, runtime: float = 0.5) -> LazyAnimation:
+        def build():
+            slot = self._slot(index)
+            resolved = value.value if isinstance(value, VisualElement) else value
+            self.logger.debug("bars.set_value index=%s value=%s", slot, resolved)
+            return self._tween([slot], [resolved], runtime)
+        return LazyAnimation(builder=build)
+
+    def swap(self, idx_1: int | Bar, idx_2: int | Bar, color=YELLOW, runtime=0.5) -> LazyAnimation:
+        """Swap two values; only their two bars are redrawn."""
+        return self.swap_many([(idx_1, idx_2)], runtime=runtime)
+
+    def swap_many(self, pairs, runtime: float = 0.5) -> LazyAnimation:
+        index_pairs = []
+        for pair in pairs:
+            first, second = (self._slot(item) for item in pair)
+            if first != second:
+                index_pairs.append((first, second))
+        indices = np.array(index_pairs, dtype=int).reshape(-1, 2)
+        if len(np.unique(indices)) != indices.size:
+            raise ValueError(f"swap_many() needs disjoint pairs, got {index_pairs}.")
+
+        def build():
+            if not len(indices):
+                return Wait(1e-6)
+            movers = np.concatenate([indices[:, 0], indices[:, 1]])
+            partners = np.concatenate([indices[:, 1], indices[:, 0]])
+            self.logger.debug("bars.swap_many pairs=%d", len(indices))
+            return self._tween(movers, self.values[partners].copy(), runtime)
+        return LazyAnimation(builder=build)
+
+    def sort(self, key=None, reverse=False, *args, **kwargs):
+        """Sort the values in place and redraw the strip in one step."""
+        order = np.argsort(self.values if key is None else [key(value) for value in self.values.tolist()], kind="stable")
+        new_values = self.values[order[::-1] if reverse else order]
+        animation = self._tween(np.arange(len(self.values)), new_values, runtime=0.5)
+        if self.scene and is_animating() and not self.scene.in_play:
+            self.play(animation)
+        elif self.strip is not None:
+            self.draw(animation.indices, animation.end_values)
+        return self
+
+    def _resize(self, values: np.ndarray) -> None:
+        self.values = values
+        self.elements.forget_from(0) #Slot geometry depends on the length
+        self.mark_dirty()
+        if self.strip is not None:
+            self._layout()
+
+    def append(self, data: Any, runtime=0.5, recenter=True) -> None:
+        value = data.value if isinstance(data, VisualElement) else data
+        self._resize(np.append(self.values, self._fit([value])))
+        self.logger.debug("bars.append value=%s -> len=%d", value, len(self.values))
+
+    def pop(self, index: int | Bar = -1, runtime=0.5) -> Any:
+        slot = self._slot(index)
+        value = self.values[slot].item()
+        self._resize(np.delete(self.values, slot))
+        self.logger.debug("bars.pop index=%s -> len=%d", slot, len(self.values))
+        return value
+
+    def insert(self, data, index: int | Bar) -> None:
+        value = data.value if isinstance(data, VisualElement) else data
+        slot = index.index if isinstance(index, Bar) else index
+        self._resize(np.insert(self.values, slot, self._fit(value)))
+
+    def __contains__(self, value) -> bool:
+        target = value.value if isinstance(value, VisualElement) else value
+        hits = np.flatnonzero(self.values == target)
+        if len(hits) and self.scene and is_animating() and not self.scene.in_play:
+            self.play([self.highlight(int(hits[0]), color=GREEN, runtime=0.3), self.unhighlight(int(hits[0]), runtime=0.3)])
+        return bool(len(hits))
+
+    # --- Effects ---
+    def _as_region(self, element) -> slice:
+        if isinstance(element, slice):
+            return element
+        slot = self._slot(element)
+        return slice(slot, slot + 1)
+
+    def _region_shape(self, start: int, stop: int) -> Rectangle:
+        left = self.pos[0] - self.strip_width / 2 + start * self.bar_width
+        return Rectangle(width=(stop - start) * self.bar_width, height=self.strip_height).move_to(
+            [left + (stop - start) * self.bar_width / 2, self.pos[1], self.pos[2]])
+
+    def highlight(self, element, *, color: ManimColor = YELLOW, opacity: float | None = None, runtime: float = 0.5):
+        return super().highlight(self._as_region(element), color=color, opacity=opacity, runtime=runtime)
+
+    def unhighlight(self, element, *, opacity: float | None = None, runtime: float = 0.5):
+        return super().unhighlight(self._as_region(element), opacity=opacity, runtime=runtime)
+
+    def outline(self, element, *, color: ManimColor = PURE_GREEN, width: float = 6, runtime: float = 0.5):
+        return super().outline(self._as_region(element), color=color, width=width, runtime=runtime)
+
+    def unoutline(self, element, *, color: ManimColor = WHITE, width: float = 4, runtime: float = 0.5):
+        return super().unoutline(self._as_region(element), color=color, width=width, runtime=runtime)
+
+    def indicate(self, element, *, color: ManimColor = YELLOW, scale_factor: float = 1.1, runtime: float = 0.5) -> Succession:
+        region = self._as_region(element)
+        return Succession(self.highlight(region, color=color, runtime=runtime / 2).build(),
+                          self.unhighlight(region, runtime=runtime / 2).build())
+
+    # --- Structure ---
+    def get_index(self, element) -> int:
+        if isinstance(element, Bar):
+            return element.index
+        return super().get_index(element)
+
+    def play(self, *anims, sequential: bool = True, **kwargs):
+        """Like `VisualStructure.play`, but only re-binds the bars that exist instead of building all of them."""
+        if not self.scene:
+            raise RuntimeError("No Scene bound. Pass scene=... when creating VisualStructure.")
+        self.scene.play(*anims, sequential=sequential, **kwargs)
+        for bar in self.elements.materialized():
+            if bar.master is not self:
+                bar.master = self
+
+    def move_to(self, target_position: np.ndarray, run_time: float = 1.0) -> None:
+        """Move the strip (and its overlays) so its centre lands on ``target_position``."""
+        offset = np.asarray(target_position, dtype=float) - self.pos
+        if self.scene and is_animating() and not self.scene.in_play and self.submobjects:
+            self.play(BlockShift(self, members=list(self.submobjects), offset=offset, run_time=run_time))
+        else:
+            for member in self.submobjects:
+                member.shift(offset)
+        self.pos = self.pos + offset
+
+    def create(self, cells=None, runtime: float = 0.5) -> Animation:
+        """Build the strip on first call and return its fade-in."""
+        if not self._instantiated:
+            self._layout()
+            self.add(self.strip)
+            self._instantiated = True
+        if not self.scene:
+            return None
+        return FadeIn(self.strip, run_time=runtime)
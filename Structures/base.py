@@ -4,8 +4,12 @@ import numpy as np
 from Components.ops import get_operation, resolve_value
 from Components.runtime import AlgoScene, is_animating,CURRENT_LINE
 from Components.effects import EffectsManager
+from Components.animations import StyleTween
+from Components.render_cache import state_stamp, update_mobject_digest
+from Components.logging import get_logger
 from typing import Any, TYPE_CHECKING,Callable
 import contextvars
+import hashlib
 import weakref
 _COMPARE_GUARD = contextvars.ContextVar("_COMPARE_GUARD", default=False)
 if TYPE_CHECKING:
@@ -49,6 +53,10 @@ class VisualStructure(VGroup):
         self.label = label if label else ""
         self.elements = []
         self._trace = []
+        self._state_digest: bytes | None = None
+        self._state_stamp: bytes | None = None #`state_stamp` the cached digest was taken at (verify_digests only)
+        self._has_updaters = False
+        self._pointer_pool = None
         self.effects = EffectsManager(logger=getattr(self, "logger", None))
         if scene is not None:
             scene.register_structure(self)
@@ -68,6 +76,7 @@ class VisualStructure(VGroup):
             return super().add(*mobjects)
         finally:
             _COMPARE_GUARD.reset(token)
+            self._family_changed()
 
     def remove(self, *mobjects):
         """Mirror add-guarding when removing so equality hooks stay inert."""
@@ -76,21 +85,96 @@ class VisualStructure(VGroup):
             return super().remove(*mobjects)
         finally:
             _COMPARE_GUARD.reset(token)
+            self._family_changed()
+
+    def _family_changed(self) -> None:
+        # Bumped on membership changes so the scene digest rebuilds its member -> structure map
+        self._family_version = getattr(self, "_family_version", 0) + 1
+        self.mark_dirty()
+
+    def mark_dirty(self) -> None:
+        """Drop the cached state digest; the next `state_digest` call rehashes the structure."""
+        self._state_digest = None
+
+    def state_digest(self) -> bytes:
+        """Digest of the structure's points and style, cached until `mark_dirty`.
+
+        Used by the render cache to key plays without rehashing unchanged structures. With
+        ``CacheSettings.verify_digests`` on (a debugging aid, it walks every point again) the
+        cached digest is also checked against a `state_stamp`, and edits that no
+        ``mark_dirty`` reported are logged and rehashed.
+        """
+        app_config = getattr(self.scene, "app_config", None) if self._scene_ref else None
+        stamp = state_stamp(self) if app_config is not None and app_config.cache.verify_digests else None
+        if getattr(self, "_state_digest", None) is not None and stamp is not None and stamp != self._state_stamp:
+            get_logger(__name__).warning("state_digest: %s %r changed without mark_dirty", type(self).__name__, self.label)
+            self._state_digest = None
+        if getattr(self, "_state_digest", None) is None:
+            digest = hashlib.blake2b(digest_size=20)
+            update_mobject_digest(digest, self)
+            self._state_digest = digest.digest()
+            self._state_stamp = stamp
+        return self._state_digest
+
+    def add_updater(self, *args, **kwargs):
+        self._has_updaters = True #Updaters change members during plays that don't animate them, see `mark_animated`
+        return super().add_updater(*args, **kwargs)
+
+    def become(self, *args, **kwargs):
+        self.mark_dirty()
+        return super().become(*args, **kwargs)
+
+    def set_fill(self, *args, **kwargs):
+        self.mark_dirty()
+        return super().set_fill(*args, **kwargs)
+
+    def set_stroke(self, *args, **kwargs):
+        self.mark_dirty()
+        return super().set_stroke(*args, **kwargs)
+
+    def set_style(self, *args, **kwargs):
+        self.mark_dirty()
+        return super().set_style(*args, **kwargs)
+
+    def set_color(self, *args, **kwargs):
+        self.mark_dirty()
+        return super().set_color(*args, **kwargs)
+
+    def shift(self, *args, **kwargs):
+        self.mark_dirty()
+        return super().shift(*args, **kwargs)
+
+    def scale(self, *args, **kwargs):
+        self.mark_dirty()
+        return super().scale(*args, **kwargs)
+
+    def rotate(self, *args, **kwargs):
+        self.mark_dirty()
+        return super().rotate(*args, **kwargs)
 
     def move_to(self, *args, **kwargs):
         super().move_to(*args, **kwargs)
         self._position = np.array(self.get_center(), dtype=float)
         return self
+
+    def update(self, dt: float = 0, recursive: bool = True):
+        """Run updaters; with culling on, elements outside the camera frame skip theirs (see `Components.culling`)."""
+        culler = getattr(self.scene, "culler", None) if self._scene_ref else None
+        if culler is None or not recursive:
+            return super().update(dt, recursive)
+        super().update(dt, recursive=False)
+        culler.update_children(self, dt)
+        return self
     
     def __len__(self):
         return len(self.elements)
 
     def highlight(self, element: "VisualElement|int", *, color: ManimColor = YELLOW,
-                opacity: float | None = None, runtime: float = 0.5) -> ApplyMethod:
+                opacity: float | None = None, runtime: float = 0.5) -> StyleTween:
         element = self.get_element(element) if isinstance(element, int) else element
         return self.effects.highlight(element, color=color, opacity=opacity, runtime=runtime)
 
-    def unhighlight(self, element: "VisualElement|int", *, opacity: float | None = None, runtime: float = 0.5) -> ApplyMethod:
+    def unhighlight(self, element: "VisualElement|int", *, opacity: float | None = None, runtime: float = 0.5) -> StyleTween:
         element = self.get_element(element) if isinstance(element, int) else element
         return self.effects.unhighlight(element, opacity=opacity, runtime=runtime)
 
@@ -100,16 +184,21 @@ class VisualStructure(VGroup):
         return self.effects.indicate(element, color=color, scale_factor=scale_factor, runtime=runtime)
 
     def outline(self, element: "VisualElement|int", *, color: ManimColor = PURE_GREEN,
-                width: float = 6, runtime: float = 0.5) -> ApplyMethod:
+                width: float = 6, runtime: float = 0.5) -> StyleTween:
         element = self.get_element(element) if isinstance(element, int) else element
         return self.effects.outline(element, color=color, width=width, runtime=runtime)
 
     def unoutline(self, element: "VisualElement|int", *, color: ManimColor = WHITE,
-                width: float = 4, runtime: float = 0.5) -> ApplyMethod:
+                width: float = 4, runtime: float = 0.5) -> StyleTween:
         element = self.get_element(element) if isinstance(element, int) else element
         return self.effects.unoutline(element, color=color, width=width, runtime=runtime)
 
         
+    def flush_compares(self) -> None:
+        """Play the compare effects queued on this structure's scene now rather than before the next play."""
+        if self.scene:
+            self.scene.flush_compares()
+
     def play(self, *anims, sequential:bool=True, **kwargs):
         """Recursive play: handles single or multiple animations\n
         Can accept either an array or multiple comma-seperated animations
@@ -220,6 +309,14 @@ class VisualStructure(VGroup):
         
 
 
+    @property
+    def pointer_pool(self):
+        """The `PointerPool` shared by every `PointerRange` over this structure, built on first use."""
+        if getattr(self, "_pointer_pool", None) is None:
+            from Structures.pointers import PointerPool
+            self._pointer_pool = PointerPool(self)
+        return self._pointer_pool
+
     @property
     def scene(self):
         return self._scene_ref() if self._scene_ref else None
@@ -376,7 +473,7 @@ class VisualElement(VGroup):
                 if hasattr(self.master, "effects") and hasattr(self.master.effects, "compare"):
                     master_anim = self.master.effects.compare(self, other, result=result)
                     if master_anim:
-                        self.master.play(*master_anim)
+                        self.master.scene.queue_compare(*master_anim) #Played with the other pending compares
     
         except ValueError: #Manim's internals cooking
             return NotImplemented
@@ -646,15 +743,50 @@ class VisualElement(VGroup):
             return
         self._bounding_box = value #cache the value if nothing works
 
+    def _mark_master_dirty(self) -> None:
+        master = self.master if getattr(self, "_master_ref", None) else None
+        if master is not None and hasattr(master, "mark_dirty"):
+            master.mark_dirty()
+
+    # --- Style edits outside a play change the structure's digest too ---
+    def set_fill(self, *args, **kwargs):
+        self._mark_master_dirty()
+        return super().set_fill(*args, **kwargs)
+
+    def set_stroke(self, *args, **kwargs):
+        self._mark_master_dirty()
+        return super().set_stroke(*args, **kwargs)
+
+    def set_style(self, *args, **kwargs):
+        self._mark_master_dirty()
+        return super().set_style(*args, **kwargs)
+
+    def set_color(self, *args, **kwargs):
+        self._mark_master_dirty()
+        return super().set_color(*args, **kwargs)
+
+    def become(self, *args, **kwargs):
+        self._mark_master_dirty()
+        return super().become(*args, **kwargs)
+
+    def add_updater(self, *args, **kwargs):
+        master = self.master if getattr(self, "_master_ref", None) else None
+        if master is not None:
+            master._has_updaters = True
+        return super().add_updater(*args, **kwargs)
+
     # --- Allow direct shift/scale/rotate if you want ---
     def shift(self, *args, **kwargs):
+        self._mark_master_dirty()
         body = getattr(self, "body", None)
         return (body.shift(*args, **kwargs) if body is not None else super().shift(*args, **kwargs))
 
     def scale(self, *args, **kwargs):
+        self._mark_master_dirty()
         body = getattr(self, "body", None)
         return (body.scale(*args, **kwargs) if body is not None else super().scale(*args, **kwargs))
 
     def rotate(self, *args, **kwargs):
+        self._mark_master_dirty()
         body = getattr(self, "body", None)
         return (body.rotate(*args, **kwargs) if body is not None else super().rotate(*args, **kwargs))
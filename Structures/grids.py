@@ -0,0 +1,207 @@
+from __future__ import annotations
+from typing import Any
+import numpy as np
+from manim import *
+from Components.animations import LazyAnimation, StyleTween
+from Components.logging import get_logger
+from Components.runtime import AlgoScene, is_animating
+from Structures.arrays import Cell
+from Structures.base import VisualStructure, VisualElement
+
+
+class VisualGrid(VisualStructure):
+    """A 2D grid of `Cell` objects backed by a NumPy value store.
+
+    Parameters
+    ----------
+    data : Sequence[Sequence[Any]] | np.ndarray
+        Initial values, one inner sequence per row. Every row must have the same length.
+    scene : AlgoScene
+        The active scene (pass ``self``).
+    element_width : float, optional
+        Width of each cell.
+    element_height : float, optional
+        Height of each cell.
+    label : str | None, optional
+        Label used in logs and overlays.
+    **kwargs :
+        Additional positioning arguments (``start_pos`` or ``x``/``y``/``z``), plus
+        ``rounded`` and ``border`` forwarded to each `Cell`.
+
+    Notes
+    -----
+    - ``values`` is a NumPy array (numeric dtype when possible, ``object`` otherwise) and is
+      the source of truth for reads, so slicing (``grid[1:3, :]``) costs no per-cell lookups.
+    - Cells are kept row-major in ``elements`` so the inherited helpers (``get_element(int)``,
+      ``highlight``...) still work with flat indices; ``cells`` holds them by ``(row, col)``.
+    - Row, column and region highlights are a single `StyleTween` on the grid, not one
+      animation per cell.
+    """
+
+    def __init__(self, data: Any, scene: AlgoScene = None, element_width: float = 1, element_height: float = 1,
+                 label: str = None, **kwargs):
+        self.logger = get_logger(logger_name=__name__, output=False)
+        values = np.asarray(data)
+        if values.ndim != 2:
+            raise ValueError(f"VisualGrid expects 2D data, got an array of shape {values.shape}.")
+        if values.dtype.kind not in "biuf": #Strings/mixed values keep their Python types
+            values = np.array(data, dtype=object)
+        self.values: np.ndarray = values.copy()
+        self.rounded = kwargs.pop("rounded", False)
+        self.border = kwargs.pop("border", True)
+        super().__init__(scene, label, **kwargs)
+        self.element_width = element_width
+        self.element_height = element_height
+        self.cells: np.ndarray = np.empty(self.values.shape, dtype=object)
+        self._instantiated = False
+        self.logger.info("grid.init shape=%s w=%s h=%s label=%s", self.shape, element_width, element_height, label)
+
+    def __repr__(self):
+        return f"VisualGrid({self.values.tolist()})"
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.values.shape
+
+    @property
+    def rows(self) -> int:
+        return self.values.shape[0]
+
+    @property
+    def cols(self) -> int:
+        return self.values.shape[1]
+
+    def _normalize_key(self, key) -> tuple:
+        if not isinstance(key, tuple):
+            key = (key, slice(None)) #grid[r] selects a whole row, like NumPy
+        if len(key) != 2:
+            raise IndexError(f"VisualGrid takes [row, col] indices, got {key!r}.")
+        return key
+
+    def _selected_cells(self, key) -> list[Cell]:
+        selected = self.cells[self._normalize_key(key)]
+        #A scalar key yields the Cell itself, which NumPy would try to unpack as a sequence of its submobjects
+        return list(selected.ravel()) if isinstance(selected, np.ndarray) else [selected]
+
+    def _store(self, key: tuple, value: Any) -> np.ndarray:
+        """Write ``value`` into ``values[key]`` and return what was written, broadcast to the selection.
+
+        The store is upcast first when ``value`` doesn't fit its dtype (a float or ``inf`` written into
+        an int grid, a string into a numeric one), instead of NumPy silently truncating or overflowing.
+        """
+        incoming = np.asarray(value)
+        if self.values.dtype == object or incoming.dtype.kind not in "biuf":
+            dtype = np.dtype(object)
+        else:
+            dtype = np.result_type(self.values.dtype, incoming.dtype)
+        if dtype != self.values.dtype:
+            self.logger.debug("grid.upcast %s -> %s", self.values.dtype, dtype)
+            self.values = self.values.astype(dtype)
+        target = self.values[key]
+        shape = target.shape if isinstance(target, np.ndarray) else () #Object grids return the element itself
+        new_values = np.broadcast_to(incoming.astype(dtype, copy=False), shape)
+        self.values[key] = new_values if shape else new_values[()]
+        return new_values
+
+    def get_element(self, cell_or_index) -> VisualElement:
+        """Like `VisualStructure.get_element`, but also accepts ``(row, col)`` tuples."""
+        if isinstance(cell_or_index, tuple):
+            row, col = cell_or_index
+            return self.cells[row, col]
+        return super().get_element(cell_or_index)
+
+    def get_position(self, element: VisualElement) -> tuple[int, int]:
+        """Return the ``(row, col)`` of a cell in this grid."""
+        return divmod(self.get_index(element), self.cols)
+
+    def __getitem__(self, key):
+        """``grid[r, c]`` returns a value; slices (``grid[r]``, ``grid[:, c]``, ``grid[a:b, c:d]``)
+        return NumPy arrays. Reads are flashed as one region highlight when animating."""
+        key = self._normalize_key(key)
+        result = self.values[key]
+        if self.scene and is_animating() and not self.scene.in_play:
+            self.play([self.highlight_region(*key, runtime=0.4), self.unhighlight_region(*key, runtime=0.3)])
+        return result.item() if isinstance(result, np.generic) else result
+
+    def __setitem__(self, key, value):
+        if self.scene and is_animating() and not self.scene.in_play:
+            self.play(self.set_value(key, value))
+            return
+        key = self._normalize_key(key)
+        cells = self._selected_cells(key)
+        new_values = self._store(key, value)
+        for cell, new_value in zip(cells, np.atleast_1d(new_values).ravel()):
+            cell.value = new_value.item() if isinstance(new_value, np.generic) else new_value
+
+    def set_value(self, key, value) -> LazyAnimation:
+        """Animate writing ``value`` (a scalar, or an array broadcastable to the selection) into ``key``."""
+        def build():
+            selection = self._normalize_key(key)
+            cells = self._selected_cells(selection)
+            new_values = self._store(selection, value)
+            animations = []
+            for cell, new_value in zip(cells, np.atleast_1d(new_values).ravel()):
+                new_value = new_value.item() if isinstance(new_value, np.generic) else new_value
+                animations.append(cell.set_value(new_value, text_color=self.text_color, text_size=self.text_size))
+            self.logger.debug("grid.set_value key=%s cells=%d", selection, len(cells))
+            return AnimationGroup(*animations) if len(animations) > 1 else animations[0]
+        return LazyAnimation(builder=build)
+
+    def highlight_region(self, rows: int | slice = slice(None), cols: int | slice = slice(None), *,
+                         color: ManimColor = YELLOW, opacity: float | None = None, runtime: float = 0.5) -> StyleTween:
+        """Tint every cell in ``grid[rows, cols]`` with one animation."""
+        if opacity is None:
+            opacity = self.effects.strategy.get_fill_opacity()
+        bodies = [cell.body for cell in self._selected_cells((rows, cols))]
+        return StyleTween(self, members=bodies, fill_color=color, fill_opacity=opacity, run_time=runtime)
+
+    def unhighlight_region(self, rows: int | slice = slice(None), cols: int | slice = slice(None), *,
+                           opacity: float | None = None, runtime: float = 0.5) -> StyleTween:
+        """Restore every cell in ``grid[rows, cols]`` to the base fill with one animation."""
+        if opacity is None:
+            opacity = self.effects.strategy.get_fill_opacity()
+        bodies = [cell.body for cell in self._selected_cells((rows, cols))]
+        return StyleTween(self, members=bodies, fill_color=BLACK, fill_opacity=opacity, run_time=runtime)
+
+    def highlight_row(self, row: int, **kwargs) -> StyleTween:
+        return self.highlight_region(row, slice(None), **kwargs)
+
+    def unhighlight_row(self, row: int, **kwargs) -> StyleTween:
+        return self.unhighlight_region(row, slice(None), **kwargs)
+
+    def highlight_column(self, col: int, **kwargs) -> StyleTween:
+        return self.highlight_region(slice(None), col, **kwargs)
+
+    def unhighlight_column(self, col: int, **kwargs) -> StyleTween:
+        return self.unhighlight_region(slice(None), col, **kwargs)
+
+    def create(self, runtime: float = 0.5) -> AnimationGroup:
+        """Build the cells on first call and return their creation animation."""
+        if not self._instantiated:
+            width, height = float(self.element_width), float(self.element_height)
+            row_shift, col_shift = (self.rows - 1) / 2, (self.cols - 1) / 2
+            for (row, col), value in np.ndenumerate(self.values):
+                cell = Cell(
+                    value=value.item() if isinstance(value, np.generic) else value,
+                    master=self,
+                    cell_width=width,
+                    cell_height=height,
+                    rounded=self.rounded,
+                    border=self.border,
+                    text_color=self.text_color,
+                    text_size=self.text_size,
+                )
+                cell.move_to(self.pos + RIGHT * (col - col_shift) * width + DOWN * (row - row_shift) * height)
+                self.cells[row, col] = cell
+                self.elements.append(cell)
+            self.add(*self.elements)
+            self._instantiated = True
+
+        if not self.scene:
+            return None
+        if not self.elements:
+            return Wait(1e-6)
+        return AnimationGroup(*[cell.create(runtime=runtime) for cell in self.elements], lag_ratio=0.02)
+
+
+VisualMatrix = VisualGrid
@@ -6,7 +6,7 @@ from Structures.arrays import Cell
 from Structures.base import VisualStructure,VisualElement
 from Components.animations import LazyAnimation, hop_element, slide_element
 from Components.geometry import get_offset_position
-from Components.logging import DebugLogger
+from Components.logging import get_logger
 from Components.runtime import is_animating
 class Entry(VisualElement):
     """
@@ -110,7 +110,7 @@ class VisualHashTable(VisualStructure):
         **kwargs :
             Additional positioning arguments forwarded to `VisualStructure`.
         """
-        self.logger = DebugLogger(logger_name=__name__, output=False)
+        self.logger = get_logger(logger_name=__name__, output=False)
         super().__init__(scene,label,**kwargs)
         self._raw_data = data
         self._bucket_count = max(1,len(data)) #Division by 0...
@@ -4,17 +4,42 @@ import numpy as np
 import math
 from typing import Any
 
-from Structures.arrays import VisualArray
+from Structures.arrays import Cell
 from Structures.base import VisualStructure
+from Components.animations import BlockShift
+from Components.logging import get_logger
+from Components.runtime import is_animating
 
 class Node(VGroup):
-    def __init__(self,value:Any,scene:Scene,height:int|float,width:int|float,text_color:ManimColor=WHITE,prev:Node = None,next:Node = None,**kwargs):
+    """
+    A single linked-list node: a rounded `Cell` plus its outgoing link arrows.
+
+    Parameters
+    ----------
+    value : Any
+        The value stored in the node.
+    master : VisualLinkedList
+        Owning list, used as the master of the node's cell.
+    height, width : int | float
+        Size of the node's cell.
+    text_color : ManimColor, optional
+        Color of the rendered value.
+    prev, next : Node | None
+        Neighbouring nodes. ``prev`` is always maintained (even for singly linked lists)
+        so unlinking stays O(1); the prev arrow is only drawn when the list is doubly linked.
+
+    Notes
+    -----
+    - ``slot`` is the viewport slot the node is currently placed at, or ``None`` if the node
+      is not shown. The list uses it to skip nodes that are already in place.
+    """
+    def __init__(self,value:Any,master:VisualLinkedList,height:int|float,width:int|float,text_color:ManimColor=WHITE,prev:Node = None,next:Node = None,**kwargs):
         super().__init__(**kwargs)
-        self.body = VisualArray(
-            [value],
-            scene=scene,
-            element_height=height,
-            element_width=width,
+        self.body = Cell(
+            value=value,
+            master=master,
+            cell_width=width,
+            cell_height=height,
             text_color=text_color,
             rounded=True,
         )
@@ -22,156 +47,399 @@ class Node(VGroup):
 
         self.prev: Node = prev
         self.next: Node = next
-        
 
-        self.arrow_prev = None
-        self.arrow_next = None
-        
+
+        self.arrow_prev:Arrow = None
+        self.arrow_next:Arrow = None
+        self.slot:int|None = None
+        self.created = False
+
+    @property
+    def value(self):
+        return self.body.value
+
+    def create(self) -> AnimationGroup:
+        self.created = True
+        return self.body.create()
+
 class VisualLinkedList(VisualStructure):
-    def __init__(self,data:Any,scene:Scene,node_width:int|float=1.25,node_height:int|float=0.5,text_color:ManimColor=WHITE,doubly:bool=False,**kwargs):
-        self.pos = kwargs.pop("pos",None) #Center of the array
-        if self.pos is not None:
-            self.pos = np.array(self.pos)
-        
-        else:
-            x = kwargs.get("x",None)
-            y = kwargs.get("y",None)
-            z = kwargs.get("z",None)
-            if x is None and y is None and z is None:
-                self.pos = ORIGIN
-                x = x if x is not None else ORIGIN[0]
-                y = y if y is not None else ORIGIN[1]
-                z = z if z is not None else ORIGIN[2]
-                self.pos = np.array([x,y,z])
-                
-        super().__init__(scene,**kwargs)
+    """
+    Visual singly/doubly linked list.
+
+    Links (``head``/``tail``/``next``/``prev``) are rewired in O(1) per mutation, and arrows are
+    never rebuilt: every arrow is rerouted onto its endpoints by one shared updater that runs
+    once per frame for the nodes currently shown.
+
+    Parameters
+    ----------
+    data : Iterable
+        Initial values.
+    scene : AlgoScene
+        Scene that owns the list.
+    node_width, node_height : int | float, optional
+        Size of each node.
+    text_color : ManimColor, optional
+        Color of the node values.
+    doubly : bool, optional
+        Draw prev arrows as well as next arrows.
+    viewport : int | None, optional
+        Number of node slots shown at once. When set, only the nodes inside the window are
+        placed and drawn; nodes outside it are laid out lazily when they scroll into view
+        (see `scroll_to`), so mutations on long lists only touch O(viewport) nodes.
+        Defaults to ``None`` (show every node).
+    **kwargs :
+        Additional positioning arguments (``pos``/``start_pos`` or ``x``/``y``/``z``).
+
+    Notes
+    -----
+    Mutating methods (`append`, `insert_at`, `remove_at`, `reverse`, `scroll_to`) update the
+    links immediately and return the animation that brings the visuals in line, to be passed
+    to ``play``.
+    """
+    def __init__(self,data:Any,scene:Scene,node_width:int|float=1.25,node_height:int|float=0.5,text_color:ManimColor=WHITE,doubly:bool=False,
+                 label:str=None,viewport:int|None=None,**kwargs):
+        self.logger = get_logger(logger_name=__name__, output=False)
+        pos = kwargs.pop("pos",None) #Center of the list
+        if pos is not None:
+            kwargs["start_pos"] = pos
+        super().__init__(scene,label,text_color=text_color,**kwargs)
+        if viewport is not None and viewport < 1:
+            raise ValueError(f"viewport must be a positive number of slots, got {viewport}")
         self.nodes:list[Node] = []
         self.head:Node = None
         self.tail:Node = None
         self.doubly = doubly
-        self.scene = scene
         self.node_width = node_width
         self.node_height = node_height
-        self.text_color = text_color
+        self.spacing = node_width * 1.7 #Node width + a 0.7 node-width gap for the arrow
+        self.viewport = viewport
         self.length = 0
-        
-        if data:
-            for idx,value in enumerate(data):
-                node:Node = Node(value,scene=scene,width=node_width,height=node_height,text_color=text_color)
-                if idx == 0:
-                    self.head = node
-                    self.tail = self.head
-                    node.move_to(self.pos)
-                    
-                else:
-                    prev = self.nodes[idx - 1]
-                    node.next_to(prev.get_right(), buff=node_width * 0.7)
-                    
-                    prev.next = node
-                    if self.doubly:
-                        node.prev = prev
-
-                        
-
-                self.nodes.append(node)
+        self._scroll = 0 #Index of the first node shown
+        self._shown:list[Node] = []
+        self._routes:dict[int,tuple[np.ndarray,np.ndarray]] = {} #id(arrow) -> last (start,end) it was routed onto
+        self._router = VMobject()
+        self._router.add_updater(self._route_arrows)
+
+        data = list(data) if data else []
+        visible = len(data) if viewport is None else min(len(data),viewport)
+        self._anchor = self.pos - RIGHT * self.spacing * (max(visible,1) - 1) / 2 #Position of slot 0
+        self._placed_anchor = self._anchor #Anchor the shown nodes were last laid out from
+        for value in data:
+            self._link(self._make_node(value),index=self.length)
+        self.logger.info(
+            "linked_list.init len=%d doubly=%s viewport=%s label=%s",
+            self.length, doubly, viewport, label,
+        )
+
+    def __repr__(self):
+        return f"VisualLinkedList({[node.value for node in self.nodes]})"
+
+    def __iter__(self):
+        node = self.head
+        while node is not None:
+            yield node
+            node = node.next
+
+    def _make_node(self,value:Any) -> Node:
+        return Node(value,master=self,width=self.node_width,height=self.node_height,text_color=self.text_color)
+
+    def _link(self,node:Node,index:int) -> None:
+        """Splice ``node`` in before the node currently at ``index`` (O(1) pointer updates)."""
+        prev = self.nodes[index - 1] if index > 0 else None
+        nxt = self.nodes[index] if index < self.length else None
+        node.prev, node.next = prev, nxt
+        if prev is not None:
+            prev.next = node
+        else:
+            self.head = node
+        if nxt is not None:
+            nxt.prev = node
+        else:
+            self.tail = node
+        self.nodes.insert(index,node)
+        self.elements.insert(index,node.body)
+        self.length += 1
+
+    def _unlink(self,index:int) -> Node:
+        """Detach and return the node at ``index`` (O(1) pointer updates)."""
+        node = self.nodes.pop(index)
+        self.elements.pop(index)
+        prev, nxt = node.prev, node.next
+        if prev is not None:
+            prev.next = nxt
+        else:
+            self.head = nxt
+        if nxt is not None:
+            nxt.prev = prev
+        else:
+            self.tail = prev
+        node.prev = node.next = None
+        self.length -= 1
+        return node
+
+    def _check_index(self,index:int,upper:int) -> int:
+        index = int(index)
+        if index < 0:
+            index += self.length
+        if not 0 <= index <= upper:
+            raise IndexError(f"Invalid index {index}. Valid range is 0 to {upper}.")
+        return index
+
+    # --- Layout ---
+    def _slot_position(self,slot:int) -> np.ndarray:
+        return self._anchor + RIGHT * self.spacing * slot
+
+    def _window(self) -> tuple[int,int]:
+        if self.viewport is None:
+            return 0,self.length
+        self._scroll = max(0,min(self._scroll,self.length - self.viewport))
+        return self._scroll,min(self.length,self._scroll + self.viewport)
+
+    def _arrow_ends(self,node:Node,target:Node,offset:np.ndarray) -> tuple[np.ndarray,np.ndarray]:
+        """Endpoints for an arrow from ``node`` to ``target``, whichever side ``target`` is on."""
+        if target.get_center()[0] >= node.get_center()[0]:
+            start,end = node.get_right(),target.get_left()
+        else:
+            start,end = node.get_left(),target.get_right()
+        gap = end - start
+        norm = np.linalg.norm(gap)
+        if norm > 0.2:
+            gap = gap / norm * 0.1
+            start,end = start + gap,end - gap
+        return start + offset,end + offset
+
+    def _arrow_offset(self,direction:str) -> np.ndarray:
+        if not self.doubly:
+            return ORIGIN
+        return UP * self.node_height * 0.15 if direction == "next" else DOWN * self.node_height * 0.15
+
+    def _route_arrows(self,router:Mobject=None) -> None:
+        """Shared updater: move every shown arrow onto its endpoints, skipping arrows whose
+        endpoints have not changed since the last frame."""
+        for node in self._shown:
+            for arrow,target,direction in ((node.arrow_next,node.next,"next"),(node.arrow_prev,node.prev,"prev")):
+                if arrow is None or target is None:
+                    continue
+                start,end = self._arrow_ends(node,target,self._arrow_offset(direction))
+                last = self._routes.get(id(arrow))
+                if last is not None and np.allclose(last[0],start) and np.allclose(last[1],end):
+                    continue
+                if np.allclose(start,end):
+                    continue
+                arrow.put_start_and_end_on(start,end)
+                self._routes[id(arrow)] = (start,end)
+
+    def _make_arrow(self,node:Node,target:Node,direction:str) -> Arrow:
+        start,end = self._arrow_ends(node,target,self._arrow_offset(direction))
+        arrow = Arrow(start,end,buff=0,stroke_width=3,max_tip_length_to_length_ratio=0.3)
+        self._routes[id(arrow)] = (start,end)
+        self.add(arrow)
+        return arrow
+
+    def _drop_arrow(self,node:Node,direction:str) -> Animation|None:
+        attr = f"arrow_{direction}"
+        arrow = getattr(node,attr)
+        if arrow is None:
+            return None
+        setattr(node,attr,None)
+        self._routes.pop(id(arrow),None)
+        self.remove(arrow)
+        return FadeOut(arrow,run_time=0.3)
+
+    def _sync_viewport(self,runtime:float=0.5) -> Succession|Wait:
+        """Bring the shown window in line with the links.
+
+        Nodes that left the window fade out, shown nodes whose slot (or the anchor) changed slide
+        (one `BlockShift` per slot distance, so a run of nodes moving together is a single animation),
+        and nodes entering the window are placed and created/faded in. Arrows are created or dropped
+        only where a link's visibility changed; existing arrows are rerouted by the router.
+        """
+        start,stop = self._window()
+        shown = self.nodes[start:stop]
+        shown_ids = {id(node) for node in shown}
+        exits,entries = [],[]
+        blocks:dict[int,list[Node]] = {} #Slot distance -> nodes sliding by it
+        drift = self._anchor - self._placed_anchor #Recentering moved slot 0, every placed node follows
+        self._placed_anchor = self._anchor
+        drifting = bool(np.any(drift))
+
+        for node in self._shown:
+            if id(node) in shown_ids:
+                continue
+            for direction in ("next","prev"):
+                anim = self._drop_arrow(node,direction)
+                if anim:
+                    exits.append(anim)
+            node.slot = None
+            self.remove(node)
+            exits.append(FadeOut(node,run_time=runtime))
+
+        for index,node in enumerate(shown):
+            slot = index + start - self._scroll
+            target_pos = self._slot_position(slot)
+            if node.slot is None:
+                node.move_to(target_pos)
                 self.add(node)
-                self.move_to(self.pos)
-                self.tail = node
-                self.length += 1
-                
-    def connect(self,node:Node) -> AnimationGroup: 
-        """Connects the sides of the current node"""
+                entries.append(node.create() if not node.created else FadeIn(node,run_time=runtime))
+            elif node.slot != slot or drifting:
+                blocks.setdefault(slot - node.slot,[]).append(node)
+            node.slot = slot
+        moves = [BlockShift(self,members=nodes,offset=RIGHT * self.spacing * distance + drift,run_time=runtime)
+                 for distance,nodes in blocks.items()]
+
+        self._shown = shown
+        for node in shown:
+            links = (("next",node.next),("prev",node.prev if self.doubly else None))
+            for direction,target in links:
+                arrow = getattr(node,f"arrow_{direction}")
+                if target is None or id(target) not in shown_ids:
+                    anim = self._drop_arrow(node,direction)
+                    if anim:
+                        exits.append(anim)
+                elif arrow is None:
+                    arrow = self._make_arrow(node,target,direction)
+                    setattr(node,f"arrow_{direction}",arrow)
+                    entries.append(GrowArrow(arrow,run_time=runtime))
+
+        steps = [AnimationGroup(*anims) for anims in (exits,moves) if anims]
+        if entries:
+            steps.append(AnimationGroup(*entries,lag_ratio=0.1))
+        if not steps:
+            return Wait(1e-6)
+        return Succession(*steps)
+
+    def move_to(self,*args,**kwargs):
+        before = self.get_center()
+        super().move_to(*args,**kwargs)
+        moved = self.get_center() - before
+        self._anchor = self._anchor + moved
+        self._placed_anchor = self._placed_anchor + moved #The nodes moved along, nothing left to slide
+        return self
+
+    # --- Public API ---
+    def connect(self,node:Node) -> AnimationGroup:
+        """Creates any missing arrows for the links of the current node"""
         anims = []
-        if node.next and not node.arrow_next:
-            node.arrow_next = Arrow(node.get_right(), node.next.get_left(), buff=0.1)
-            self.add(node.arrow_next)
-            anims.append(Create(node.arrow_next,run_time=0.7))
-            
-        if node.prev and self.doubly and not node.arrow_prev: #Creates an arrow if doubly can has prev arrow
-            node.arrow_prev = Arrow(node.get_left(),node.prev.get_right())  
-            self.add(node.arrow_prev)
-            anims.append(Create(node.arrow_prev,run_time=0.7))
-            
+        shown_ids = {id(n) for n in self._shown}
+        links = (("next",node.next),("prev",node.prev if self.doubly else None))
+        for direction,target in links:
+            if target is None or getattr(node,f"arrow_{direction}") is not None or id(target) not in shown_ids:
+                continue
+            arrow = self._make_arrow(node,target,direction)
+            setattr(node,f"arrow_{direction}",arrow)
+            anims.append(Create(arrow,run_time=0.7))
         return AnimationGroup(*anims,lag_ratio=0.2) if anims else None
-    
+
     def disconnect(self,node:Node,direction:str = "next") -> AnimationGroup:
-        """Disconnects the specified arrow of the current node\n
-        Direction can either be 'prev', 'next', or 'both'
+        """Removes the specified arrow of the current node\n
+        Direction can either be 'prev', 'next', or 'both'. Only the arrow goes: the link
+        itself stays, so traversal and indexing keep agreeing (use `remove_at` to unlink a node)
         """
-        anims = []
-        if direction == "next":
-            arrow = node.arrow_next
-            anims.append(Uncreate(arrow,runtime=0.7))
-            node.arrow_next = None
-            node.next = None
-            
-        elif direction == "prev" and self.doubly:
-            arrow = node.arrow_prev
-            anims.append(Uncreate(arrow,runtime=0.7))
-            node.arrow_prev = None
-            node.prev = None
-            
-        elif direction == "both" and self.doubly:
-            next_arrow = node.arrow_next
-            prev_arrow = node.arrow_prev
-            anims.append(Uncreate(next_arrow,runtime=0.7))
-            anims.append(Uncreate(prev_arrow,runtime=0.7))
-            node.next = None
-            node.prev = None
-            
+        if direction == "both" and self.doubly:
+            directions = ("next","prev")
+        elif direction == "next" or (direction == "prev" and self.doubly):
+            directions = (direction,)
         else:
             raise ValueError(f"Invalid direction: '{direction}'")
-        
-        return AnimationGroup(*anims,lag_ratio=0.1)
-        
-    def append(self,data:Any,recenter=True) -> AnimationGroup:
-        
-        node:Node = Node(value=data,scene=self.scene,width=self.node_width,height=self.node_height)
-        
-        
-        if self.nodes:
-            prev = self.tail
-            prev.next = node #Make sure to handle .doubly as well later on
-            node.next_to(self.tail.get_right(),buff = self.node_width * 0.7)
-            arrow_anim = self.connect(prev)
+
+        anims = []
+        for side in directions:
+            arrow = getattr(node,f"arrow_{side}")
+            if arrow is not None:
+                self._routes.pop(id(arrow),None)
+                anims.append(Uncreate(arrow,run_time=0.7))
+                setattr(node,f"arrow_{side}",None)
+        return AnimationGroup(*anims,lag_ratio=0.1) if anims else Wait(1e-6)
+
+    def append(self,data:Any,recenter=True) -> Succession:
+        """Appends a node at the tail. ``recenter`` keeps the list centered on its position
+        (ignored in viewport mode, where the window stays fixed)."""
+        if recenter and self.viewport is None and self.length:
+            self._anchor = self._anchor - RIGHT * self.spacing / 2
+        return self.insert_at(self.length,data)
+
+    def insert_at(self,index:int,data:Any) -> Succession:
+        """Inserts a new node before ``index`` and returns the animation that opens the gap,
+        creates the node and links it in."""
+        index = self._check_index(index,self.length)
+        node = self._make_node(data)
+        self._link(node,index)
+        if self.viewport is not None and index < self._scroll:
+            self._scroll += 1 #Keep the same nodes in view
+        self.logger.debug("linked_list.insert index=%s value=%s -> len=%d", index, data, self.length)
+        return self._sync_viewport()
+
+    def remove_at(self,index:int) -> Succession:
+        """Unlinks the node at ``index`` and returns the animation that removes it and closes the gap."""
+        if not self.length:
+            raise IndexError("remove_at() on an empty linked list")
+        index = self._check_index(index,self.length - 1)
+        node = self._unlink(index)
+        if self.viewport is not None and index < self._scroll:
+            self._scroll -= 1
+        anims = []
+        if node.slot is not None:
+            for direction in ("next","prev"):
+                anim = self._drop_arrow(node,direction)
+                if anim:
+                    anims.append(anim)
+            node.slot = None
+            self.remove(node)
+            anims.append(FadeOut(node))
+            self._shown = [shown for shown in self._shown if shown is not node]
+        self.logger.debug("linked_list.remove index=%s value=%s -> len=%d", index, node.value, self.length)
+        return Succession(AnimationGroup(*anims),self._sync_viewport()) if anims else self._sync_viewport()
+
+    def find(self,value:Any) -> int:
+        """Returns the index of the first node holding ``value`` (-1 if missing),
+        highlighting the traversal when animating."""
+        target = value.value if hasattr(value,"value") else value
+        animate = self.scene and is_animating() and not self.scene.in_play
+        for index,node in enumerate(self):
+            shown = node.slot is not None
+            if node.value == target:
+                if animate and shown:
+                    self.play(Succession(self.highlight(node.body,color=GREEN,runtime=0.2),
+                                         self.indicate(node.body,color=GREEN,runtime=0.3),
+                                         self.unhighlight(node.body,runtime=0.2)))
+                return index
+            if animate and shown:
+                self.play(Succession(self.highlight(node.body,runtime=0.15),self.unhighlight(node.body,runtime=0.1)))
+        return -1
+
+    def reverse(self) -> Succession:
+        """Reverses the links in place. Nodes slide to their mirrored slots while their arrows
+        are carried along and rerouted; no arrow is rebuilt."""
+        old = list(self.nodes)
+        for node in old:
+            node.next,node.prev = node.prev,node.next
+        if self.doubly:
+            for node in old:
+                node.arrow_next,node.arrow_prev = node.arrow_prev,node.arrow_next
         else:
-            self.head = node
-            self.tail = node
-            node.move_to(self.pos)
-            
-        # arrow_anims = self.connect(self.tail) #This is needed because .create() only links
-        
-        
-        self.add(node)
-        self.nodes.append(node)
-        self.tail = node
-        node_anim = node.body.create()
-        if recenter:
-            self.move_to(self.pos)
+            #The arrow that pointed into a node now leaves from it
+            carried = [node.arrow_next for node in old]
+            for node in old:
+                node.arrow_next = None
+            for i in range(len(old) - 1):
+                old[i + 1].arrow_next = carried[i]
+        self.head,self.tail = self.tail,self.head
+        self.nodes.reverse()
+        self.elements.reverse()
+        if self.viewport is not None:
+            self._scroll = max(0,self.length - self.viewport - self._scroll)
+        self.logger.debug("linked_list.reverse len=%d", self.length)
+        return self._sync_viewport()
 
-        self.length += 1
-        return AnimationGroup(node_anim,arrow_anim,lag_ratio=0.5)
-    
-                
-    def create(self,nodes:list[Node] = None ) -> list[AnimationGroup]:
-        """Creates the linked list, links arrows if they exist
-        Returns a list where the first element is the node animations while the second one is the arrow animations
-        """
-        if nodes is None:
-            nodes = self.nodes
-
-        node_anims = [node.body.create() for node in nodes] #create nodes
-        # arrow_anims = AnimationGroup(*[self.connect(node) for node in nodes if self.connect(node)],lag_ratio=0.1) #connect arrows
-        arrow_anims = []
-        for node in nodes:
-            conn = self.connect(node)
-            if conn:
-                arrow_anims.append(conn)
-                    
-                    
-        print(arrow_anims)
-        # return [node_anims,arrow_anims] 
-        return AnimationGroup(*node_anims, *arrow_anims, lag_ratio=0.2)
-     
-                    
-        
+    def scroll_to(self,index:int) -> Succession:
+        """Scrolls the viewport so ``index`` is the first node shown (clamped to the list)."""
+        if self.viewport is None:
+            return Wait(1e-6)
+        self._scroll = int(index)
+        return self._sync_viewport()
+
+    def create(self) -> Succession:
+        """Places the nodes in view and returns their creation animation, arrows included."""
+        if self.scene is not None and self._router not in self.scene.mobjects:
+            self.scene.add(self._router)
+        return self._sync_viewport()
@@ -1,10 +1,11 @@
 from manim import *
 from Structures.base import VisualStructure,VisualElement
 from Components.geometry import get_offset_position
-from Components.logging import DebugLogger
+from Components.logging import get_logger
 from Components.ops import get_operation
 from Components.runtime import is_animating
 import numpy as np
+import weakref
 class Pointer(VisualElement):
     """
     A logical and visual reference marker for navigating within a structure.
@@ -29,14 +30,14 @@ class Pointer(VisualElement):
     """
     _next_id = 0
     def __init__(self,value:int,master:VisualStructure,label:str = "",color=YELLOW,direction:np.ndarray=UP,**kwargs):
-        self.logger = DebugLogger(__name__, output=False)
+        self.logger = get_logger(__name__, output=False)
         self.id = Pointer._next_id
         self.size = kwargs.pop("size",1)
         type(self)._next_id += 1 #Polymorphism-friendly, since it calls the class that inherited and not Pointer if that's the case
         super().__init__(label=label,value=value,master=master,**kwargs)
         self.color = color
         self.direction = direction
-        self.logger.info(
+        self.logger.debug(
             "pointer.init id=%d value=%s dir=%s size=%.2f master=%s",
             self.id,
             value,
@@ -121,9 +122,7 @@ class Pointer(VisualElement):
           
             if new_index < len(self.master):
                 if self.master and self.master.scene and is_animating() and not self.master.scene.in_play:
-                    anim = self.move_pointer(old_index=self.value, new_index=new_index)
-                    self.master.play(anim)
-                    self.value = new_index
+                    self.play_move(old_index=self.value, new_index=new_index)
                     return self
                 self.value = new_index
                 return self
@@ -242,7 +241,7 @@ class Pointer(VisualElement):
     lambda m: m.next_to(self.body, self.direction, buff=0.15).align_to(self.body, ORIGIN)
 )
         self.add(self.body,self.label)
-        self.logger.info(
+        self.logger.debug(
             "pointer.create id=%d at=%s -> %s", self.id,
             np.array2string(arrow_start, precision=2),
             np.array2string(arrow_end, precision=2),
@@ -269,17 +268,133 @@ class Pointer(VisualElement):
         self.logger.debug("pointer.move id=%d %s->%s", self.id, old_index, new_index)
         return anim
     
+    def play_move(self, old_index:int, new_index:int) -> None:
+        """Play `move_pointer`, or queue it on the scene while a pointer batch is open (see `Pointer.batch`)."""
+        scene = self.master.scene
+        if scene.batching_pointer_moves:
+            scene.queue_pointer_move(self, old_index)
+            self.value = new_index.value if isinstance(new_index,VisualElement) else new_index
+            return
+        self.master.play(self.move_pointer(old_index=old_index, new_index=new_index))
+
+    @staticmethod
+    def batch(master:VisualStructure):
+        """
+        Context manager that collects pointer moves on ``master``'s scene and plays them together.
+
+        Moves made inside the block (``i += 1``, ``j -= 1``, `PointerRange` steps) are queued and
+        played as one parallel `AnimationGroup` before the next play, i.e. the next animated read
+        or mutation of a structure, or when the block exits. A pointer moved several times
+        before that animates once, straight to its latest index.
+
+        Examples
+        --------
+        >>> with Pointer.batch(nums):
+        ...     while i < j:
+        ...         i += 1
+        ...         j -= 1  # i and j move together
+        """
+        return master.scene.batch_pointer_moves()
+
     def destroy(self):
         """
         Remove the pointer from the scene and clear its visual state, also plays a fade-out animation.
         """
         if self.master and self.master.scene and is_animating() and not self.master.scene.in_play:
             self.master.play(FadeOut(self))
+        self._discard()
+
+    def _discard(self):
+        """Clear the visual state without animating, for pointers already faded out as part of a group."""
         self.clear_updaters()
         self.label = None
         self.body = None
         self.become(VGroup())  # clears content, removing the pointer normally doens't work? Itll just reappear later
         self.logger.debug("pointer.destroy id=%d index=%s", self.id, getattr(self, "value", None))
+
+
+class PointerPool:
+    """
+    Recycles the pointers of finished `PointerRange` loops over one structure.
+
+    In nested loops (``for i in PointerRange(...): for j in PointerRange(...)``) the inner range
+    would otherwise build, create and fade out a brand-new pointer on every outer iteration.
+    A released pointer is parked where it stopped (still on screen) and handed to the next range
+    asking for the same label/colour/direction, which only has to move the arrow into place.
+    Parked pointers fade out together when the outermost pooled range over the structure ends,
+    however it ends (exhausted, ``break``, ``return`` or an exception).
+
+    Parameters
+    ----------
+    master : VisualStructure
+        The structure whose ranges share this pool, see `VisualStructure.pointer_pool`.
+    """
+    def __init__(self, master: VisualStructure):
+        self.logger = get_logger(__name__, output=False)
+        self._master_ref = weakref.ref(master)
+        self._parked: dict[tuple, list[Pointer]] = {}
+        self.active = 0 #Pooled ranges currently iterating
+
+    @property
+    def master(self) -> VisualStructure | None:
+        return self._master_ref()
+
+    def __len__(self):
+        return sum(len(pointers) for pointers in self._parked.values())
+
+    @staticmethod
+    def key(label, color, direction, size) -> tuple:
+        label_key = label if label is None or isinstance(label, str) else id(label) #MathTex labels only match themselves
+        return (label_key, ManimColor(color).to_hex(), tuple(np.round(np.asarray(direction, dtype=float), 6)), float(size))
+
+    def acquire(self, value: int, label: str = None, color: ManimColor = YELLOW, direction: np.ndarray = UP, size: float = 1) -> Pointer:
+        """Return a parked pointer matching the style, or a new (not yet created) one at ``value``.
+
+        A recycled pointer keeps its old ``value`` and position; the caller moves it to ``value``.
+        """
+        master = self.master
+        key = self.key(label, color, direction, size)
+        parked = self._parked.get(key)
+        while parked:
+            pointer = parked.pop()
+            if pointer.value < len(master): #The structure may have shrunk under a parked pointer
+                self.logger.debug("pointer_pool.reuse id=%d %s->%s", pointer.id, pointer.value, value)
+                return pointer
+            pointer.destroy()
+        pointer = Pointer(value=value, master=master, label=label, color=color, direction=direction, size=size)
+        pointer._pool_key = key
+        return pointer
+
+    def enter(self) -> None:
+        """Count a range that started iterating; the pool stays open until it is released."""
+        self.active += 1
+
+    def release(self, pointer: Pointer, started: bool = True) -> None:
+        """Park ``pointer`` for the next matching range; drains the pool once the outermost range ends.
+
+        Ranges finish inner-first, so ``active`` drops back to 0 exactly when the outermost one does.
+        ``started=False`` returns the pointer of a range that was never iterated (and never counted).
+        """
+        if started:
+            self.active = max(0, self.active - 1)
+        if getattr(pointer, "body", None) is not None: #Pointers destroyed mid-loop can't be reused
+            self._parked.setdefault(pointer._pool_key, []).append(pointer)
+        if self.active == 0:
+            self.drain()
+
+    def drain(self) -> None:
+        """Fade out every parked pointer in one animation and forget them."""
+        parked = [pointer for pointers in self._parked.values() for pointer in pointers]
+        self._parked.clear()
+        if not parked:
+            return
+        master = self.master
+        if master and master.scene and is_animating() and not master.scene.in_play:
+            master.play(AnimationGroup(*[FadeOut(pointer) for pointer in parked]))
+        for pointer in parked:
+            pointer._discard()
+        self.logger.debug("pointer_pool.drain count=%d", len(parked))
+
     
 class PointerRange:
     """
@@ -302,6 +417,20 @@ class PointerRange:
         The parent container (e.g., `VisualArray`) that manages the pointer, acts like a normal iterator if not passed
     label : str | None
         Optional label for the pointer during iteration.
+
+    Notes
+    -----
+    Steps are queued instead of played inside a `PointerRange.batch` block (the same
+    scope as `Pointer.batch`), so ranges iterated together (``zip``) move in one animation.
+
+    With a ``master``, the pointer comes from the structure's `PointerPool` (unless
+    ``PlaybackSettings.pool_pointers`` is off): a finished range parks its pointer instead of
+    fading it out, and the next range with the same label/colour moves it into place.
+
+    A range finishes when it is exhausted or when the loop over it stops early (``break``,
+    ``return``, an exception): ``for`` loops go through a generator that finishes the range
+    when it is closed. Code driving the range with ``next()`` directly calls `close` instead,
+    or uses the range as a context manager.
     """
     def __init__(self,start,stop=None,step:int=1,master:VisualStructure=None,label:str=None,color:ManimColor=YELLOW,**kwargs):
         if stop is None:
@@ -317,14 +446,51 @@ class PointerRange:
         self.direction = kwargs.get("direction",UP)
         self._started = False #Checks if iteration ahs started yet(logic in __next__)
 
+        self._pool:PointerPool|None = None
         if (step > 0 and start < stop) or (step < 0 and start > stop): #Checks if the direction is valid
-            self.pointer:Pointer = Pointer(value=start,master=master,label=label,direction=self.direction,color=self.color)
+            if master is not None and self._pooling_enabled(master):
+                self._pool = master.pointer_pool
+                self.pointer:Pointer = self._pool.acquire(value=self.start,label=label,color=self.color,direction=self.direction)
+            else:
+                self.pointer:Pointer = Pointer(value=start,master=master,label=label,direction=self.direction,color=self.color)
         else:
             self.pointer = None
             
         
-    def __iter__(self): #This returns an iterator
+    @staticmethod
+    def _pooling_enabled(master:VisualStructure) -> bool:
+        app_config = getattr(master.scene, "app_config", None)
+        return app_config is None or app_config.playback.pool_pointers
+
+    def _finish(self):
+        if self._pool is not None:
+            self._pool.release(self.pointer, started=self._started)
+        else:
+            self.pointer.destroy()
+        self.pointer = None
+
+    def close(self) -> None:
+        """Finish the range now: park (or destroy) its pointer. Does nothing once finished."""
+        if self.pointer is not None:
+            self._finish()
+
+    def __enter__(self):
         return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def __iter__(self): #This returns an iterator
+        try:
+            while True:
+                try:
+                    index = next(self)
+                except StopIteration:
+                    return
+                yield index
+        finally: #Runs on break/return too, once the loop drops the generator
+            self.close()
     
     #A for loop basically calls range().__iter__(), and the i gets assigned i = next(range().__iter__())
     #Then i gets updated over and over until StopIteration is raised
@@ -335,8 +501,12 @@ class PointerRange:
         if not self._started: 
             if getattr(self.pointer, "body", None) is None and self.master:
                 self.master.play(self.pointer.create())
+            elif self.pointer.value != self._current and self.master and self.master.scene and is_animating() and not self.master.scene.in_play:
+                self.pointer.play_move(old_index=self.pointer.value, new_index=self._current) #Recycled from the pool
                 
             self._started = True
+            if self._pool is not None:
+                self._pool.enter()
             self.pointer.value = self._current     
             return self._current
         
@@ -344,16 +514,13 @@ class PointerRange:
         next_index = old_index + self.step
 
         if (self.step > 0 and next_index >= self.stop) or (self.step < 0 and next_index <= self.stop): #Cant iterate further
-          
-            self.pointer.destroy()
-            self.pointer = None
+            self._finish()
             raise StopIteration
 
         self._current = next_index
 
         if self.master and self.master.scene and is_animating() and not self.master.scene.in_play:
-            anim = self.pointer.move_pointer(old_index=old_index, new_index=next_index)
-            self.master.play(anim)
+            self.pointer.play_move(old_index=old_index, new_index=next_index)
 
 
 
@@ -361,5 +528,7 @@ class PointerRange:
     
     
 
+    batch = staticmethod(Pointer.batch)
+
     def __repr__(self):
         return f"PointerRange({self.start}, {self.stop}, step={self.step})"
@@ -0,0 +1,331 @@
+from __future__ import annotations
+from typing import Any
+import numpy as np
+from manim import *
+from Components.logging import get_logger
+from Components.runtime import AlgoScene, is_animating
+from Structures.arrays import Cell
+from Structures.base import VisualStructure, VisualElement
+
+
+class _SlotStructure(VisualStructure):
+    """Shared plumbing for structures whose cells sit in fixed slots.
+
+    Subclasses decide where a slot is (`_slot_position`) and which slot a logical index
+    lives in (`_slot_of`); the defaults are the stack's layout, slot ``i`` holding index ``i``
+    one cell further along ``direction`` from ``pos``. Cells are never re-laid out by an
+    ordinary operation, so each push/pop is one animation on the affected cell.
+    """
+
+    def __init__(self, data: Any, scene: AlgoScene, element_width: float, element_height: float,
+                 label: str = None, **kwargs):
+        self._raw_data = [] if data is None else [value.value if isinstance(value, VisualElement) else value for value in data]
+        self.rounded = kwargs.pop("rounded", False)
+        self.border = kwargs.pop("border", True)
+        super().__init__(scene, label, **kwargs)
+        self.element_width = element_width
+        self.element_height = element_height
+        self.direction = np.asarray(UP, dtype=float)
+        self._instantiated = False
+
+    def __repr__(self):
+        return f"{type(self).__name__}({[cell.value for cell in self.elements]})"
+
+    def _slot_position(self, slot: int) -> np.ndarray:
+        vertical = abs(self.direction[1]) >= abs(self.direction[0])
+        step = self.element_height if vertical else self.element_width
+        return self.pos + self.direction * step * slot
+
+    def _slot_of(self, index: int) -> int:
+        return index
+
+    def _make_cell(self, value: Any, slot: int) -> Cell:
+        cell = Cell(
+            value=value.value if isinstance(value, VisualElement) else value,
+            master=self,
+            cell_width=self.element_width,
+            cell_height=self.element_height,
+            rounded=self.rounded,
+            border=self.border,
+            text_color=self.text_color,
+            text_size=self.text_size,
+        )
+        cell.move_to(self._slot_position(slot))
+        return cell
+
+    def _ensure_created(self) -> None:
+        """Build (and, when animating, play) the initial cells before the first operation that needs them."""
+        if not self._instantiated:
+            creation = self.create()
+            if self.scene and is_animating() and not self.scene.in_play:
+                self.play(creation)
+
+    def _enter(self, cell: Cell, runtime: float) -> None:
+        self.add(cell)
+        if self.scene and is_animating() and not self.scene.in_play:
+            self.play(cell.create(runtime=runtime))
+
+    def _leave(self, cell: Cell, direction: np.ndarray, runtime: float) -> Any:
+        if self.scene and is_animating() and not self.scene.in_play:
+            self.play(FadeOut(cell, shift=direction * 0.5, run_time=runtime))
+        self.remove(cell)
+        cell.become(VGroup())
+        return cell.value
+
+    def __getitem__(self, index: int):
+        self._ensure_created()
+        cell = self.get_element(index)
+        if self.scene and is_animating() and not self.scene.in_play:
+            self.play([self.highlight(cell, runtime=0.4), self.unhighlight(cell, runtime=0.3)])
+        return cell.value
+
+    def __len__(self):
+        return len(self.elements) if self._instantiated else len(self._raw_data) #Counts values not drawn yet
+
+    def is_empty(self) -> bool:
+        return len(self) == 0
+
+    def _instantiate(self) -> None:
+        for index, value in enumerate(self._raw_data):
+            cell = self._make_cell(value, self._slot_of(index))
+            self.add(cell)
+            self.elements.append(cell)
+
+    def create(self, runtime: float = 0.5) -> AnimationGroup:
+        """Build the initial cells on first call and return their creation animation."""
+        if not self._instantiated:
+            self._instantiate()
+            self._instantiated = True
+        if not self.scene:
+            return None
+        if not self.elements:
+            return Wait(1e-6)
+        return AnimationGroup(*[cell.create(runtime=runtime) for cell in self.elements], lag_ratio=0.1)
+
+
+class VisualStack(_SlotStructure):
+    """A LIFO stack of `Cell` objects growing from a fixed base.
+
+    Parameters
+    ----------
+    data : Iterable[Any] | None
+        Initial values, bottom first.
+    scene : AlgoScene
+        The active scene (pass ``self``).
+    element_width : float, optional
+        Width of each cell.
+    element_height : float, optional
+        Height of each cell.
+    direction : np.ndarray, optional
+        Direction the stack grows in from its base at ``pos``. Defaults to ``UP``.
+    label : str | None, optional
+        Label used in logs and overlays.
+    **kwargs :
+        Additional positioning arguments (``start_pos`` or ``x``/``y``/``z``), plus
+        ``rounded`` and ``border`` forwarded to each `Cell`.
+
+    Notes
+    -----
+    Slot ``i`` never moves, so `push` only creates the new top cell and `pop` only fades
+    out the old one: each operation is one animation whatever the stack's size, where a
+    `VisualArray` used as a stack recenters or slides its cells.
+    """
+
+    def __init__(self, data: Any = None, scene: AlgoScene = None, element_width: float = 1, element_height: float = 1,
+                 direction: np.ndarray = UP, label: str = None, **kwargs):
+        self.logger = get_logger(logger_name=__name__, output=False)
+        super().__init__(data, scene, element_width, element_height, label, **kwargs)
+        self.direction = np.asarray(direction, dtype=float)
+        self.logger.info("stack.init len=%d w=%s h=%s label=%s", len(self._raw_data), element_width, element_height, label)
+
+    def push(self, value: Any, runtime: float = 0.5) -> None:
+        """Push ``value`` on top of the stack."""
+        self._ensure_created()
+        cell = self._make_cell(value, len(self.elements))
+        self.elements.append(cell)
+        self._enter(cell, runtime)
+        self.logger.debug("stack.push value=%s -> len=%d", cell.value, len(self.elements))
+
+    append = push  # Drop-in for code that uses a list (or VisualArray) as a stack
+
+    def pop(self, runtime: float = 0.5) -> Any:
+        """Remove and return the top value."""
+        self._ensure_created()
+        if not self.elements:
+            raise IndexError("pop from empty stack")
+        cell: Cell = self.elements.pop()
+        value = self._leave(cell, self.direction, runtime)
+        self.logger.debug("stack.pop value=%s -> len=%d", value, len(self.elements))
+        return value
+
+    def peek(self) -> Any:
+        """Return (and flash) the top value without removing it."""
+        self._ensure_created()
+        if not self.elements:
+            raise IndexError("peek from empty stack")
+        return self[len(self.elements) - 1]
+
+    @property
+    def top(self) -> Cell | None:
+        return self.elements[-1] if self.elements else None
+
+
+class VisualDeque(_SlotStructure):
+    """A double-ended queue laid out as a ring buffer of fixed slots.
+
+    Parameters
+    ----------
+    data : Iterable[Any] | None
+        Initial values, front first.
+    scene : AlgoScene
+        The active scene (pass ``self``).
+    capacity : int | None, optional
+        Number of slots in the ring. Defaults to twice the initial length (at least 4);
+        the ring doubles when it fills up.
+    element_width : float, optional
+        Width of each cell.
+    element_height : float, optional
+        Height of each cell.
+    show_slots : bool, optional
+        Draw a faint frame around every slot so the ring's free slots stay visible.
+    label : str | None, optional
+        Label used in logs and overlays.
+    **kwargs :
+        Additional positioning arguments (``start_pos`` or ``x``/``y``/``z``), plus
+        ``rounded`` and ``border`` forwarded to each `Cell`.
+
+    Notes
+    -----
+    - The value at logical index ``i`` lives in slot ``(head + i) % capacity``. Adding or
+      removing at either end moves ``head``/the tail instead of the cells, so every
+      `append`/`appendleft`/`pop`/`popleft` is one animation on one cell and long simulations
+      (BFS frontiers) cost O(1) animations per operation.
+    - Only growing the ring re-lays out the cells (one parallel animation), which happens
+      O(log n) times over n operations.
+    """
+
+    def __init__(self, data: Any = None, scene: AlgoScene = None, capacity: int | None = None,
+                 element_width: float = 1, element_height: float = 1, show_slots: bool = True,
+                 label: str = None, **kwargs):
+        self.logger = get_logger(logger_name=__name__, output=False)
+        super().__init__(data, scene, element_width, element_height, label, **kwargs)
+        self.capacity = max(capacity or 2 * len(self._raw_data), len(self._raw_data), 4)
+        self.head = 0
+        self.show_slots = show_slots
+        self.slot_frames: VGroup | None = None
+        self.logger.info("deque.init len=%d capacity=%d label=%s", len(self._raw_data), self.capacity, label)
+
+    def _slot_position(self, slot: int) -> np.ndarray:
+        return self.pos + RIGHT * (slot - (self.capacity - 1) / 2) * self.element_width
+
+    def _slot_of(self, index: int) -> int:
+        return (self.head + index) % self.capacity
+
+    def _make_frames(self) -> VGroup:
+        frames = VGroup(*[
+            Rectangle(width=self.element_width, height=self.element_height)
+            .set_stroke(GRAY, width=2, opacity=0.4)
+            .set_fill(opacity=0)
+            .move_to(self._slot_position(slot))
+            for slot in range(self.capacity)
+        ])
+        frames.z_index = -1
+        return frames
+
+    def _instantiate(self) -> None:
+        if self.show_slots:
+            self.slot_frames = self._make_frames()
+            self.add(self.slot_frames)
+        super()._instantiate()
+
+    def create(self, runtime: float = 0.5) -> AnimationGroup:
+        cells = super().create(runtime=runtime)
+        if not self.scene or self.slot_frames is None:
+            return cells
+        return AnimationGroup(Create(self.slot_frames, run_time=runtime), cells, lag_ratio=0.5)
+
+    def _grow(self, runtime: float = 0.5) -> None:
+        """Double the ring, moving the cells to slots ``0..n-1`` in one animation."""
+        self.capacity *= 2
+        self.head = 0
+        moves = [ApplyMethod(cell.move_to, self._slot_position(index), run_time=runtime) for index, cell in enumerate(self.elements)]
+        if self.slot_frames is not None:
+            old_frames, self.slot_frames = self.slot_frames, self._make_frames()
+            self.remove(old_frames)
+            self.add(self.slot_frames)
+            moves += [FadeOut(old_frames, run_time=runtime), FadeIn(self.slot_frames, run_time=runtime)]
+        self.logger.debug("deque.grow capacity=%d", self.capacity)
+        if self.scene and is_animating() and not self.scene.in_play:
+            self.play(AnimationGroup(*moves))
+        else:
+            for index, cell in enumerate(self.elements):
+                cell.move_to(self._slot_position(index))
+
+    def append(self, value: Any, runtime: float = 0.5) -> None:
+        """Add ``value`` at the back."""
+        self._ensure_created()
+        if len(self.elements) == self.capacity:
+            self._grow(runtime=runtime)
+        cell = self._make_cell(value, self._slot_of(len(self.elements)))
+        self.elements.append(cell)
+        self._enter(cell, runtime)
+        self.logger.debug("deque.append value=%s -> len=%d", cell.value, len(self.elements))
+
+    def appendleft(self, value: Any, runtime: float = 0.5) -> None:
+        """Add ``value`` at the front."""
+        self._ensure_created()
+        if len(self.elements) == self.capacity:
+            self._grow(runtime=runtime)
+        self.head = (self.head - 1) % self.capacity
+        cell = self._make_cell(value, self.head)
+        self.elements.insert(0, cell)
+        self._enter(cell, runtime)
+        self.logger.debug("deque.appendleft value=%s -> len=%d", cell.value, len(self.elements))
+
+    def pop(self, runtime: float = 0.5) -> Any:
+        """Remove and return the value at the back."""
+        self._ensure_created()
+        if not self.elements:
+            raise IndexError("pop from an empty deque")
+        cell: Cell = self.elements.pop()
+        value = self._leave(cell, DOWN, runtime)
+        self.logger.debug("deque.pop value=%s -> len=%d", value, len(self.elements))
+        return value
+
+    def popleft(self, runtime: float = 0.5) -> Any:
+        """Remove and return the value at the front."""
+        self._ensure_created()
+        if not self.elements:
+            raise IndexError("pop from an empty deque")
+        cell: Cell = self.elements.pop(0)
+        self.head = (self.head + 1) % self.capacity
+        value = self._leave(cell, UP, runtime)
+        self.logger.debug("deque.popleft value=%s -> len=%d", value, len(self.elements))
+        return value
+
+    @property
+    def front(self) -> Cell | None:
+        return self.elements[0] if self.elements else None
+
+    @property
+    def back(self) -> Cell | None:
+        return self.elements[-1] if self.elements else None
+
+
+class VisualQueue(VisualDeque):
+    """A FIFO queue: a `VisualDeque` with `enqueue` (back), `dequeue` (front) and `peek` names."""
+
+    def enqueue(self, value: Any, runtime: float = 0.5) -> None:
+        """Add ``value`` at the back of the queue."""
+        self.append(value, runtime=runtime)
+
+    def dequeue(self, runtime: float = 0.5) -> Any:
+        """Remove and return the value at the front of the queue."""
+        return self.popleft(runtime=runtime)
+
+    def peek(self) -> Any:
+        """Return (and flash) the front value without removing it."""
+        self._ensure_created()
+        if not self.elements:
+            raise IndexError("peek from an empty queue")
+        return self[0]
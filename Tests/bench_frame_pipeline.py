@@ -0,0 +1,56 @@
+"""
+Frames/sec benchmark for the Algomancer frame pipeline.
+
+Pushes synthetic RGBA frames into ffmpeg two ways and reports throughput:
+- manim-style: copy the frame (camera.get_frame), convert to bytes, write,
+- ring: FFmpegSink, one copy into a pre-allocated slot, memoryview to ffmpeg.
+ffmpeg decodes into the null muxer so the numbers measure the hand-off, not
+the encoder. Run with: python -m Tests.bench_frame_pipeline [frames] [width] [height]
+"""
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from Components.frame_pipeline import FFmpegSink
+
+
+def make_frames(width: int, height: int, count: int = 4) -> list[np.ndarray]:
+    rng = np.random.default_rng(0)
+    return [rng.integers(0, 255, size=(height, width, 4), dtype=np.uint8) for _ in range(count)]
+
+
+def bench_manim_style(frames: list[np.ndarray], total: int, width: int, height: int, fps: int) -> float:
+    command = [
+        "ffmpeg", "-y", "-loglevel", "error",
+        "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}", "-r", str(fps),
+        "-i", "-", "-an", "-f", "null", "-",
+    ]
+    process = subprocess.Popen(command, stdin=subprocess.PIPE)
+    start = time.perf_counter()
+    for i in range(total):
+        frame = np.array(frames[i % len(frames)])  # camera.get_frame() copy
+        process.stdin.write(frame.tobytes())
+    process.stdin.close()
+    process.wait()
+    return total / (time.perf_counter() - start)
+
+
+def bench_ring(frames: list[np.ndarray], total: int, width: int, height: int, fps: int) -> float:
+    start = time.perf_counter()
+    with FFmpegSink("-", width, height, fps, output_args=("-f", "null")) as sink:
+        for i in range(total):
+            sink.write(frames[i % len(frames)])
+    return total / (time.perf_counter() - start)
+
+
+def main(total: int = 600, width: int = 1920, height: int = 1080, fps: int = 60) -> None:
+    frames = make_frames(width, height)
+    print(f"{total} frames at {width}x{height}")
+    print(f"manim-style : {bench_manim_style(frames, total, width, height, fps):8.1f} frames/sec")
+    print(f"ring buffer : {bench_ring(frames, total, width, height, fps):8.1f} frames/sec")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:4]))
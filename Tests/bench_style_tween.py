@@ -0,0 +1,53 @@
+"""
+Allocation benchmark: StyleTween vs ApplyMethod(set_fill).
+
+Drives both animations by hand (begin, one interpolate per frame, finish) on a
+row of cells and reports bytes allocated, allocation count and wall time.
+Run with: python -m Tests.bench_style_tween [cells] [frames]
+"""
+import sys
+import time
+import tracemalloc
+
+from manim import ApplyMethod, RED, Square, VGroup
+
+from Components.animations import StyleTween
+
+
+def make_cells(count: int) -> list[Square]:
+    return list(VGroup(*[Square(side_length=1).set_fill(opacity=0.5) for _ in range(count)]).arrange())
+
+
+def drive(animations, frames: int) -> None:
+    for animation in animations:
+        animation.begin()
+    for frame in range(1, frames + 1):
+        for animation in animations:
+            animation.interpolate(frame / frames)
+    for animation in animations:
+        animation.finish()
+
+
+def measure(label: str, build, cells: int, frames: int) -> None:
+    bodies = make_cells(cells)
+    tracemalloc.start()
+    start = time.perf_counter()
+    drive([build(body) for body in bodies], frames)
+    elapsed = time.perf_counter() - start
+    snapshot = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    stats = snapshot.statistics("filename")
+    allocated = sum(stat.size for stat in stats)
+    blocks = sum(stat.count for stat in stats)
+    print(f"{label:<24} live={allocated / 1024:10.1f} KiB  blocks={blocks:8d}  peak={peak / 1024:10.1f} KiB  {elapsed * 1000:8.1f} ms")
+
+
+def main(cells: int = 200, frames: int = 30) -> None:
+    print(f"{cells} cells x {frames} frames")
+    measure("ApplyMethod(set_fill)", lambda body: ApplyMethod(body.set_fill, RED, 0.5), cells, frames)
+    measure("StyleTween", lambda body: StyleTween(body, fill_color=RED, fill_opacity=0.5), cells, frames)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -5,7 +5,9 @@ and error handling.  Designed for direct call-and-see execution.
 """
 from manim import *
 from Structures.arrays import VisualArray
-from Structures.pointers import Pointer
+from Structures.pointers import Pointer, PointerRange
+from Components.runtime import is_animating
+from Components.shapes import SharedRectangle
 from Tests.test_decorator import test
 
 
@@ -84,6 +86,141 @@ def test_internal_comparisons(array: VisualArray) -> None:
         print(f"cells[{i}]={left.value} vs cells[{i+1}]={right.value} → "
               f"lt={lt}, gt={gt}, eq={eq}")
 
+@test
+def test_state_digest(array:VisualArray):
+    """The cached digest is reused until a play, mutation or style edit touches the array."""
+    create_array(array)
+    before = array.state_digest()
+    assert array.state_digest() is before, "Unchanged array should reuse its cached digest"
+    array.play(array.swap(0, len(array) - 1))
+    assert array.state_digest() != before, "Swap should invalidate the digest"
+    swapped = array.state_digest()
+    array[0].set_fill(RED)
+    assert array.state_digest() != swapped, "Style edits outside a play should invalidate the digest"
+    restyled = array.state_digest()
+    array[1].add_updater(lambda m, dt: None)
+    cache = array.scene.player.render_cache
+    if cache is not None:
+        cache.state.mark_animated([], array.scene)
+        assert array.state_digest() is not restyled, "Structures with updaters should be rehashed after every play"
+    array[1].clear_updaters()
+
+
+
+
+@test
+def test_compare_batching(array:VisualArray):
+    """Compares are queued on the scene and played together on flush."""
+    create_array(array)
+    for i in range(len(array) - 1):
+        _ = array.elements[i] < array.elements[i + 1]
+    if array.scene.app_config.playback.batch_compares:
+        assert array.scene._pending_compares, "Compares should be queued until the next play"
+    array.flush_compares()
+    assert not array.scene._pending_compares, "Flush should play every pending compare"
+
+
+
+
+@test
+def test_pointer_pool(array:VisualArray):
+    """Nested PointerRanges reuse one inner pointer and drain the pool when the outer loop ends."""
+    create_array(array)
+    inner_pointers = set()
+    for i in PointerRange(len(array) - 1, master=array, label="i"):
+        inner = PointerRange(i, len(array), master=array, label="j", color=PURPLE)
+        inner_pointers.add(id(inner.pointer))
+        for j in inner:
+            pass
+    if array.scene.app_config.playback.pool_pointers:
+        assert len(inner_pointers) == 1, "Every inner range should reuse the same pointer"
+        assert len(array.pointer_pool) == 0 and array.pointer_pool.active == 0, "Pool should drain after the outer loop"
+
+
+
+@test
+def test_pointer_pool_early_exit(array:VisualArray):
+    """Breaking out of (or returning from) pooled loops still drains the pool."""
+    create_array(array)
+    def find_pair():
+        for i in PointerRange(len(array), master=array, label="i"):
+            for j in PointerRange(i + 1, len(array), master=array, label="j", color=PURPLE):
+                if j == len(array) - 1:
+                    return i, j
+    for i in PointerRange(len(array), master=array, label="i"):
+        for j in PointerRange(i, len(array), master=array, label="j", color=PURPLE):
+            break
+    assert find_pair() is not None, "The search should find a pair"
+    assert len(array.pointer_pool) == 0 and array.pointer_pool.active == 0, "Pool should drain after an early exit"
+
+
+
+
+@test
+def test_pointer_batch(array:VisualArray, ptr_a:Pointer, ptr_b:Pointer):
+    """Moves inside Pointer.batch are queued and played together when the block exits."""
+    create_array(array)
+    with Pointer.batch(array):
+        ptr_a += 1
+        ptr_b -= 1
+        if is_animating():
+            assert len(array.scene._pending_pointer_moves) == 2, "Both moves should be queued"
+    assert not array.scene._pending_pointer_moves, "Leaving the block should flush the moves"
+
+
+
+
+@test
+def test_slice_regions(array:VisualArray):
+    """Slices read like lists and a sliding window moves one overlay instead of restyling cells."""
+    create_array(array)
+    assert array[1:3] == [cell.value for cell in array.elements[1:3]], "Slicing should return the values"
+    window = 2
+    array.play(array.highlight(slice(0, window)))
+    for start in range(1, len(array) - window + 1):
+        array.play(array.highlight(slice(start, start + window)))
+    array.play(array.unhighlight(slice(0, window)))
+    array.play(array.outline(slice(0, len(array))), array.unoutline(slice(0, len(array))))
+    assert len(array._regions) <= 2, "Region effects should reuse one overlay per kind"
+
+
+
+
+@test
+def test_block_shifts(array:VisualArray):
+    """pop, insert and shift_cell keep the values in order while shifting cells as one block."""
+    create_array(array)
+    values = [cell.value for cell in array.elements]
+    first = array.pop(0)
+    assert first == values[0] and [cell.value for cell in array.elements] == values[1:], "pop(0) should drop the first value"
+    array.insert(first, 0)
+    assert [cell.value for cell in array.elements] == values, "insert should restore the original order"
+    array.play(array.shift_cell(from_idx=0, to_idx=len(array) - 1))
+    assert [cell.value for cell in array.elements] == values[1:] + values[:1], "shift_cell should rotate the first value to the end"
+
+
+
+
+@test
+def test_swap_many(array:VisualArray):
+    """A round of disjoint swaps plays once and permutes the values; overlapping pairs are rejected."""
+    create_array(array)
+    values = [cell.value for cell in array.elements]
+    pairs = [(i, i + 1) for i in range(0, len(array) - 1, 2)]
+    array.play(array.swap_many(pairs))
+    for i, j in pairs:
+        values[i], values[j] = values[j], values[i]
+    assert [cell.value for cell in array.elements] == values, "Every pair should be swapped"
+    try:
+        array.swap_many([(0, 1), (1, 2)])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Overlapping pairs should raise ValueError")
+
+
+
+
 @test
 def test_highlight_unhighlight(array:VisualArray):
     """Check visual highlight/unhighlight animations."""
@@ -204,3 +341,55 @@ def test_pointers_only(array: VisualArray, ptr_a: Pointer, ptr_b: Pointer | None
 
     for func in tests:
         func(array)
+
+
+
+
+@test
+def test_shared_geometry(array:VisualArray):
+    """Same-sized cell bodies share one template until indicate scales them (Cairo only)."""
+    create_array(array)
+    bodies = [cell.body for cell in array.elements]
+    if not all(isinstance(body, SharedRectangle) for body in bodies):
+        return #OpenGL keeps ordinary rectangles
+    assert all(body._template is bodies[0]._template for body in bodies), "Same-sized bodies should share one template"
+    assert all(body.shares_template for body in bodies), "Laid out bodies should only store a translation"
+    body = bodies[0]
+    center = body.get_center()
+    body.scale(1.2)
+    assert not body.shares_template, "Scaling a body should give it its own points"
+    body.scale(1 / 1.2)
+    assert body.shares_template and np.allclose(body.get_center(), center), "Scaling back should drop the copy"
+
+
+
+@test
+def test_shared_geometry_create(array:VisualArray):
+    """Create on a shared body draws part of the outline mid-animation and shares the template again at the end."""
+    create_array(array)
+    body = array.elements[0].body
+    if not isinstance(body, SharedRectangle):
+        return #OpenGL keeps ordinary rectangles
+    full = body.points.copy()
+    animation = Create(body)
+    animation.begin()
+    animation.interpolate(0.8)
+    assert not np.allclose(body.points, full), "Create at alpha 0.8 should not show the full outline"
+    animation.finish()
+    assert np.allclose(body.points, full) and body.shares_template, "Finishing Create should restore the shared outline"
+
+
+
+
+@test
+def test_offscreen_culling(array:VisualArray):
+    """Effects on cells outside the frame skip their frames but still finish (expects an array wider than the frame)."""
+    create_array(array)
+    scene = array.scene
+    if scene.culler is None:
+        return #cull_offscreen is off
+    scene.culler.begin_frame(scene.renderer.camera)
+    hidden = [cell for cell in array.elements if not scene.culler.is_visible(cell)]
+    array.play(AnimationGroup(*[array.highlight(cell, runtime=0.3) for cell in array.elements]))
+    assert scene.culler.guarded >= len(hidden), "Every off-screen highlight should be culled"
+    array.play(AnimationGroup(*[array.unhighlight(cell, runtime=0.3) for cell in array.elements]))
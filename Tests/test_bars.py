@@ -0,0 +1,53 @@
+"""
+Basic tests for VisualBarArray.
+Covers indexing, writes, swaps and pointers on a bar strip.
+Designed for direct call-and-see execution.
+"""
+from manim import *
+from Structures.bars import VisualBarArray
+from Structures.pointers import Pointer
+from Tests.test_decorator import test
+
+
+def create_bars(bars:VisualBarArray) -> None:
+    """Creates the strip if it's not created yet."""
+    if bars.strip is None:
+        bars.play(bars.create())
+
+@test
+def test_indexing(bars:VisualBarArray):
+    """Reads go through the NumPy buffer, slices return lists."""
+    create_bars(bars)
+    assert bars[0] == bars.values[0], "bars[i] should read the value buffer"
+    assert bars[1:3] == bars.values[1:3].tolist(), "bars[i:j] should return the values in the slice"
+    assert bars.get_element(-1).index == len(bars) - 1, "Negative indices should resolve to the last bar"
+
+
+
+
+@test
+def test_writes_and_swaps(bars:VisualBarArray):
+    """set_value and swap update the buffer and redraw only the touched bars."""
+    create_bars(bars)
+    first, second = bars.values[0].item(), bars.values[1].item()
+    bars.play(bars.swap(0, 1))
+    assert bars.values[0] == second and bars.values[1] == first, "swap should exchange the two values"
+    assert np.allclose(bars._drawn, bars.values), "The drawn bars should match the buffer after the swap"
+    bars.play(bars.set_value(2, bars.values.max() * 2))
+    assert np.allclose(bars._drawn, bars.values), "Writes past the drawn range should rescale the strip"
+    bars.values = bars.values.astype(int) #An int strip keeps fractional writes instead of truncating them
+    bars.play(bars.set_value(3, 2.5))
+    assert bars.values[3] == 2.5 and bars.values.dtype.kind == "f", "Writing 2.5 should upcast an int strip"
+
+
+
+
+@test
+def test_pointer(bars:VisualBarArray):
+    """A Pointer sits over its bar and moves like on a VisualArray."""
+    create_bars(bars)
+    pointer = Pointer(0, master=bars)
+    bars.play(pointer.create())
+    bars.play(pointer.move_pointer(0, 1))
+    assert bars[pointer] == bars.values[1], "Reading through a pointer should return the bar's value"
+    pointer.destroy()
@@ -0,0 +1,49 @@
+"""
+Tests for effect reduction (Components.effects.reduce_effects).
+Covers dropping, cancelling and merging tagged effect animations; nothing is played,
+the reduction only reads the tags and the bodies' current style.
+"""
+from manim import *
+from Structures.arrays import VisualArray
+from Components.effects import reduce_effects
+from Tests.test_decorator import test
+
+
+def reset_cells(array:VisualArray) -> None:
+    """Creates the array if needed and gives the first two cells the unhighlighted fill."""
+    if not array.elements:
+        array.play(array.create())
+    for cell in array.elements[:2]:
+        cell.body.set_fill(BLACK, opacity=array.effects.strategy.get_fill_opacity())
+
+
+@test
+def test_reduce_drop(array:VisualArray):
+    """Effects to the state an element is already in are dropped."""
+    reset_cells(array)
+    assert reduce_effects([array.unhighlight(0)]) == [], "Unhighlighting a plain cell should be dropped"
+    highlight = array.highlight(0)
+    assert reduce_effects([highlight, array.highlight(0)]) == [highlight], "A repeated highlight should be dropped"
+    wait = Wait(0.1)
+    assert reduce_effects([highlight, wait]) == [highlight, wait], "Non-effects should be kept in order"
+
+
+@test
+def test_reduce_cancel(array:VisualArray):
+    """A highlight/unhighlight pair cancels in a parallel play; sequentially it is a visible flash and stays."""
+    reset_cells(array)
+    pair = [array.highlight(0), array.unhighlight(0)]
+    assert reduce_effects(pair, parallel=True) == [], "A parallel pair should cancel out"
+    assert reduce_effects(pair) == pair, "A sequential pair should be kept"
+    red, blue = array.highlight(0, color=RED), array.highlight(0, color=BLUE)
+    assert reduce_effects([red, blue], parallel=True) == [blue], "Only the last fill effect per cell should survive"
+
+
+@test
+def test_reduce_merge(array:VisualArray):
+    """An indicate repeating the previous one on the same element is merged into it."""
+    reset_cells(array)
+    first = array.indicate(0)
+    assert reduce_effects([first, array.indicate(0)]) == [first], "A repeated indicate should be merged"
+    other = array.indicate(1)
+    assert reduce_effects([first, other]) == [first, other], "Indicates on different cells should both play"
@@ -0,0 +1,48 @@
+"""
+Basic tests for VisualGrid.
+Covers creation, 2D indexing and slicing, assignment and region
+highlights.  Designed for direct call-and-see execution.
+"""
+from manim import *
+from Structures.grids import VisualGrid
+from Tests.test_decorator import test
+
+
+def create_grid(grid:VisualGrid) -> None:
+    """Creates the grid if it's not created yet."""
+    if not grid.elements:
+        grid.play(grid.create())
+
+@test
+def test_indexing(grid:VisualGrid):
+    """Single cells return scalars, slices return NumPy arrays."""
+    create_grid(grid)
+    assert grid[0, 0] == grid.values[0, 0], "grid[r, c] should read the value store"
+    assert list(grid[0]) == list(grid.values[0]), "grid[r] should return the whole row"
+    assert list(grid[:, 1]) == list(grid.values[:, 1]), "grid[:, c] should return the whole column"
+
+
+
+
+@test
+def test_assignment(grid:VisualGrid):
+    """Assigning cells keeps the value store and the cells in sync, upcasting the store when needed."""
+    create_grid(grid)
+    grid[1, 1] = 42
+    assert grid.values[1, 1] == 42, "Value store should hold the new value"
+    assert grid.get_element((1, 1)).value == 42, "Cell should hold the new value"
+    grid[0, 1] = 2.5
+    assert grid.values[0, 1] == 2.5, "Floats written into an int grid should not be truncated"
+    grid[1] = float("inf")
+    assert np.isinf(grid.values[1]).all(), "inf should fill the whole row"
+
+
+
+
+@test
+def test_region_highlights(grid:VisualGrid):
+    """Row, column and region highlights each play as one animation."""
+    create_grid(grid)
+    grid.play(grid.highlight_row(0), grid.unhighlight_row(0))
+    grid.play(grid.highlight_column(1), grid.unhighlight_column(1))
+    grid.play(grid.highlight_region(slice(0, 2), slice(0, 2)), grid.unhighlight_region(slice(0, 2), slice(0, 2)))
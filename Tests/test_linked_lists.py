@@ -0,0 +1,80 @@
+"""
+Basic tests for VisualLinkedList.
+Covers link bookkeeping for insert/remove/reverse, find, and viewport scrolling.
+Designed for direct call-and-see execution.
+"""
+from manim import *
+from Structures.linked_lists import VisualLinkedList
+from Tests.test_decorator import test
+
+
+def create_list(linked_list:VisualLinkedList) -> None:
+    """Creates the list if it's not shown yet."""
+    if not linked_list._shown:
+        linked_list.play(linked_list.create())
+
+
+def assert_links(linked_list:VisualLinkedList) -> None:
+    """Walk head -> tail and tail -> head and check both agree with `nodes`."""
+    forward = list(linked_list)
+    assert forward == linked_list.nodes, "next pointers out of sync with nodes"
+    backward = []
+    node = linked_list.tail
+    while node is not None:
+        backward.append(node)
+        node = node.prev
+    assert backward[::-1] == linked_list.nodes, "prev pointers out of sync with nodes"
+    assert len(forward) == linked_list.length == len(linked_list.elements)
+
+
+@test
+def test_insert_and_remove(linked_list:VisualLinkedList):
+    """Insert at the head, middle and tail, then remove them again."""
+    create_list(linked_list)
+    values = [node.value for node in linked_list.nodes]
+    linked_list.play(linked_list.insert_at(0,"h"))
+    linked_list.play(linked_list.insert_at(2,"m"))
+    linked_list.play(linked_list.append("t"))
+    assert_links(linked_list)
+    centers = [node.get_center()[0] for node in linked_list._shown]
+    assert np.allclose(np.diff(centers),linked_list.spacing), "append left the shown nodes unevenly spaced"
+    assert linked_list.head.value == "h" and linked_list.tail.value == "t"
+
+    linked_list.play(linked_list.remove_at(-1))
+    linked_list.play(linked_list.remove_at(2))
+    linked_list.play(linked_list.remove_at(0))
+    assert_links(linked_list)
+    assert [node.value for node in linked_list.nodes] == values
+
+
+@test
+def test_find(linked_list:VisualLinkedList):
+    """Find an existing and a missing value."""
+    create_list(linked_list)
+    last = linked_list.tail.value
+    assert linked_list.find(last) == [node.value for node in linked_list.nodes].index(last)
+    assert linked_list.find("missing") == -1
+
+
+@test
+def test_reverse(linked_list:VisualLinkedList):
+    """Reverse twice and confirm the links round-trip."""
+    create_list(linked_list)
+    values = [node.value for node in linked_list.nodes]
+    linked_list.play(linked_list.reverse())
+    assert_links(linked_list)
+    assert [node.value for node in linked_list.nodes] == values[::-1]
+    linked_list.play(linked_list.reverse())
+    assert [node.value for node in linked_list.nodes] == values
+
+
+@test
+def test_viewport_scroll(linked_list:VisualLinkedList):
+    """Only `viewport` nodes are shown, and scrolling swaps the window."""
+    create_list(linked_list)
+    assert linked_list.viewport is not None, "Pass a list built with viewport=..."
+    assert len(linked_list._shown) == min(linked_list.viewport,linked_list.length)
+    linked_list.play(linked_list.scroll_to(linked_list.length))
+    assert linked_list._shown[-1] is linked_list.tail
+    linked_list.play(linked_list.scroll_to(0))
+    assert linked_list._shown[0] is linked_list.head
@@ -0,0 +1,63 @@
+"""
+Basic tests for VisualStack, VisualQueue and VisualDeque.
+Covers push/pop order, ring-buffer wraparound and growth.
+Designed for direct call-and-see execution.
+"""
+from manim import *
+from Structures.stacks_queues import VisualStack, VisualQueue, VisualDeque
+from Tests.test_decorator import test
+
+
+@test
+def test_stack_order(stack:VisualStack):
+    """Values come back out in LIFO order and cells stay in their slots."""
+    stack.play(stack.create())
+    for value in (1, 2, 3):
+        stack.push(value)
+    base = stack.elements[0].get_center()
+    assert stack.peek() == 3, "peek should return the top value"
+    assert [stack.pop(), stack.pop()] == [3, 2], "pop should return values in LIFO order"
+    assert np.allclose(stack.elements[0].get_center(), base), "Pops should not move the remaining cells"
+
+
+
+
+@test
+def test_stack_initial_data(scene:Scene):
+    """Initial values are there before create(): len, peek and pop see them."""
+    stack = VisualStack([1, 2, 3], scene=scene)
+    assert len(stack) == 3 and not stack.is_empty(), "len should count the initial values"
+    assert stack.peek() == 3, "peek should build the cells on first use"
+    assert stack.pop() == 3 and len(stack) == 2, "pop should work without an explicit create()"
+
+
+
+
+@test
+def test_queue_wraparound(queue:VisualQueue):
+    """Enqueue/dequeue past the end of the ring reuses the freed slots (expects an empty queue)."""
+    queue.play(queue.create())
+    for value in range(queue.capacity):
+        queue.enqueue(value)
+    head_values = [queue.dequeue() for _ in range(2)]
+    assert head_values == [0, 1], "dequeue should return values in FIFO order"
+    queue.enqueue("a")
+    queue.enqueue("b")
+    assert queue.head == 2 and len(queue) == queue.capacity, "The tail should wrap into the freed slots"
+    assert queue.back.value == "b" and queue.front.value == 2, "Logical order should survive the wraparound"
+
+
+
+
+@test
+def test_deque_growth(deque:VisualDeque):
+    """A full ring doubles and keeps the logical order."""
+    deque.play(deque.create())
+    capacity = deque.capacity
+    values = list(range(capacity + 1))
+    for value in values:
+        deque.append(value)
+    deque.appendleft(-1)
+    assert deque.capacity == capacity * 2, "The ring should double when it fills up"
+    assert [cell.value for cell in deque.elements] == [-1] + values, "Growth should keep the logical order"
+    assert deque.popleft() == -1 and deque.pop() == values[-1], "Both ends should pop"
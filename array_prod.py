@@ -1,15 +1,16 @@
 from manim import *
 from Structures.arrays import VisualArray
+from Structures.stacks_queues import VisualStack
 from Structures.pointers import Pointer,PointerRange
 from Algorithms.searching import linear_search
 from Components.runtime import AlgoScene,AlgoSlide
 from Tests import test_arrays as ta
-from Components.logging import DebugLogger
+from Components.logging import get_logger
 from Components.render_scene import render_scene
 class ArrayScene(AlgoSlide):
     def __init__(self,*args,**kwargs):
         super().__init__(*args,**kwargs)
-        self.logger = DebugLogger(logger_name=__name__, output=True)
+        self.logger = get_logger(logger_name=__name__, output=True)
     def generate_board(self,array:np.ndarray):
         pass
     # def bubble_sort(self,array: VisualArray):
@@ -70,8 +71,9 @@ class ArrayScene(AlgoSlide):
                     i += 1
                 else:
                     triplets.append([nums[i],nums[j],k])
-                    i += 1
-                    j -= 1
+                    with Pointer.batch(nums): #Both pointers move in one animation
+                        i += 1
+                        j -= 1
                     while i < j and nums[i] == nums[i-1]:
                         i += 1
             nums.play(nums.outline(element=idx))
@@ -85,11 +87,11 @@ class ArrayScene(AlgoSlide):
         '[': ']',
         '{': '}'}
         
-        stack = VisualArray([],scene=self,label="stack",pos=DOWN+LEFT)
+        stack = VisualStack(scene=self,label="stack",start_pos=DOWN+LEFT)
         self.play(stack.create())
         for char in s:
             if char in pairs:
-                stack.append(char,recenter=False)
+                stack.push(char)
             else:
                 if not stack or pairs[stack.pop()] != char:
                     return False
@@ -1,6 +1,6 @@
 from manim import *
 from Structures.hash_tables import VisualHashTable
-from Components.logging import DebugLogger
+from Components.logging import get_logger
 from Components.render_scene import render_scene
 from Components.runtime import AlgoScene
 
@@ -8,7 +8,7 @@ from Components.runtime import AlgoScene
 class HashTableScene(AlgoScene):
     def __init__(self,*args,**kwargs):
         super().__init__(*args,**kwargs)
-        self.logger = DebugLogger(__name__)
+        self.logger = get_logger(__name__)
         
     def construct(self):
         with self.animation_context():
@@ -1,18 +1,23 @@
-from manim import *
 from Structures.linked_lists import VisualLinkedList
 from Algorithms.sorting import bubble_sort,insertion_sort
 from Algorithms.searching import linear_search
 from Components.render_scene import render_scene
+from Components.runtime import AlgoScene
 import numpy as np
 import random
 
-class LinkedListScene(Scene):
+class LinkedListScene(AlgoScene):
     def construct(self):
-        ll = VisualLinkedList([1,2,3,4],scene=self)
-        ll.play(ll.create())
-        self.wait(0.5)
-        ll.play(ll.append(1),ll.append(2),ll.append(43))
-        
+        with self.animation_context():
+            ll = VisualLinkedList([1,2,3,4],scene=self)
+            ll.play(ll.create())
+            self.wait(0.5)
+            ll.play(ll.append(1),ll.append(2),ll.append(43))
+            ll.play(ll.insert_at(2,7))
+            ll.play(ll.remove_at(0))
+            ll.find(43)
+            ll.play(ll.reverse())
+
         self.wait(1)
 if __name__ == "__main__":
-    render_scene(LinkedListScene,file=__file__,quality="medium")
\ No newline at end of file
+    render_scene(LinkedListScene,file=__file__,quality="medium")